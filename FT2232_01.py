@@ -1,12 +1,14 @@
 import os
 import time
 import struct
-import msvcrt
 from typing import List, Optional, Tuple, Union, Dict
 from ctypes import (
-    windll, c_ulong, c_uint, c_ushort, c_ubyte, c_char, c_void_p, 
+    c_ulong, c_uint, c_ushort, c_ubyte, c_char, c_void_p, 
     c_char_p, c_int, c_long, POINTER, byref, create_string_buffer
 )
+from lcd_image import blit_image_to_buffer, blit_bits_to_buffer
+from lcd_dither import dither
+from LCD_FONTS import atlas_rows
 
 # 设置FTD2XX DLL路径
 os.environ['FTD2XX_DLL_DIR'] = r'C:\Users\sesa696240\Desktop\PMDB'
@@ -127,18 +129,18 @@ class LCDFonts:
     
     @staticmethod
     def get_ascii_1608_font(char_code: int) -> List[int]:
-        """获取8x16 ASCII字体数据"""
-        return [0] * 16
+        """获取8x16 ASCII字体数据 (来自字模图集，最高位为最左列)"""
+        return list(atlas_rows(16, char_code, msb_first=True))
     
     @staticmethod
     def get_ascii_2412_font(char_code: int) -> List[int]:
-        """获取12x24 ASCII字体数据"""
-        return [0] * 24
+        """获取12x24 ASCII字体数据 (来自字模图集，最高位为最左列)"""
+        return list(atlas_rows(24, char_code, msb_first=True))
     
     @staticmethod
     def get_ascii_3216_font(char_code: int) -> List[int]:
-        """获取16x32 ASCII字体数据"""
-        return [0] * 32
+        """获取16x32 ASCII字体数据 (来自字模图集，最高位为最左列)"""
+        return list(atlas_rows(32, char_code, msb_first=True))
     
     @staticmethod
     def get_chinese_12x12_font(char_bytes: bytes) -> List[int]:
@@ -269,6 +271,8 @@ class FTD2XXSPIInterface:
     def _init_dll(self):
         """初始化FTD2XX DLL"""
         try:
+            from ctypes import windll  # 仅 Windows 可用，连接时才导入
+            
             # 尝试加载DLL
             dll_paths = [
                 r'C:\Users\sesa696240\Desktop\PMDB\FTD2XX.DLL',
@@ -1125,7 +1129,7 @@ class PMDBLCD:
         
         # 初始化显示缓冲区
         self.buffer_size = (self.width // 8) * self.height
-        self.display_buffer = [0x00] * self.buffer_size
+        self.display_buffer = bytearray(self.buffer_size)
     
     def init(self) -> bool:
         """初始化LCD显示屏"""
@@ -1181,7 +1185,7 @@ class PMDBLCD:
             return False
             
         # 清空缓冲区
-        self.display_buffer = [0x00] * self.buffer_size
+        self.display_buffer = bytearray(self.buffer_size)
         # 刷新显示
         return self.refresh()
     
@@ -1231,12 +1235,44 @@ class PMDBLCD:
             
         return True
     
+    def blit_image(self, img, x: int = 0, y: int = 0, invert: bool = False) -> bool:
+        """将1bit图像/bool数组打包为页格式写入缓冲区（支持任意y偏移与裁剪）"""
+        if not self.initialized:
+            return False
+            
+        try:
+            blit_image_to_buffer(self.display_buffer, self.width, self.height, img, x, y, invert)
+            return True
+        except Exception as e:
+            print(f"写入图像失败: {str(e)}")
+            return False
+    
+    def blit_grayscale(self, img, x: int = 0, y: int = 0, method: str = 'bayer8', invert: bool = False) -> bool:
+        """将灰度图像抖动为1bpp后写入缓冲区（method: threshold/bayer4/bayer8/diffusion）"""
+        if not self.initialized:
+            return False
+            
+        try:
+            blit_bits_to_buffer(self.display_buffer, self.width, self.height,
+                                dither(img, method, invert), x, y)
+            return True
+        except Exception as e:
+            print(f"写入灰度图像失败: {str(e)}")
+            return False
+    
+    def load_frame(self, frame: bytes) -> bool:
+        """载入整帧页格式数据（如dither_sequence预抖动的结果）"""
+        if not self.initialized or len(frame) != self.buffer_size:
+            return False
+        self.display_buffer[:] = frame
+        return True
+    
     def draw_char(self, x: int, y: int, char: str, font_size: tuple = (6, 12)) -> int:
         """绘制单个ASCII字符"""
         if not self.initialized or len(char) != 1:
             return 0
             
-        char_code = ord(char)
+        char_code = ord(char) - ord(' ')  # 字库按 ASCII 32 起的序号索引
         font_width, font_height = font_size
         
         # 获取字符字体数据
@@ -1320,6 +1356,7 @@ class PMDBLCD:
 
 def main():
     """主函数：演示PMDB LCD显示屏控制"""
+    import msvcrt  # 仅 Windows 可用，演示程序运行时才导入
     print("PMDB LCD显示屏测试程序")
     print("----------------------")
     
@@ -3,7 +3,67 @@ LCD字体数据文件
 包含ASCII和中文字体数据
 """
 
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+try:
+    # 由 font_compiler.py 生成的字模图集 (页格式，8x16 / 12x24 / 16x32)
+    from lcd_font_atlas import ATLAS, FIRST_CHAR, CHAR_COUNT
+except ImportError:
+    ATLAS, FIRST_CHAR, CHAR_COUNT = {}, 32, 0
+
+
+@lru_cache(maxsize=None)
+def atlas_columns(size: int, index: int) -> Optional[Tuple[int, ...]]:
+    """
+    从图集取字符的按列位掩码 (bit i = 第i行)
+    
+    Args:
+        size: 字号 (16/24/32)
+        index: 字符序号 (ord(char) - ord(' '))
+        
+    Returns:
+        每列一个整数，图集中没有该字号时返回None，超出字符集时返回全0
+    """
+    if size not in ATLAS:
+        return None
+    width, height, data = ATLAS[size]
+    if not 0 <= index < CHAR_COUNT:
+        return (0,) * width
+    pages = (height + 7) >> 3
+    glyph = data[index * width * pages:(index + 1) * width * pages]
+    return tuple(
+        int.from_bytes(bytes(glyph[k * width + j] for k in range(pages)), 'little')
+        for j in range(width)
+    )
+
+
+@lru_cache(maxsize=None)
+def atlas_rows(size: int, index: int, msb_first: bool = False) -> Tuple[int, ...]:
+    """
+    从图集取字符的按行取模数据 (每行一个整数)
+    
+    Args:
+        size: 字号 (16/24/32)
+        index: 字符序号 (ord(char) - ord(' '))
+        msb_first: False=bit0为最左列 (LCDFonts 约定), True=最高位为最左列
+        
+    Returns:
+        每行一个整数，图集中没有该字号时返回全0
+    """
+    columns = atlas_columns(size, index)
+    if columns is None:
+        return (0,) * size
+    width = len(columns)
+    rows = []
+    for i in range(size):
+        row = 0
+        for j, col in enumerate(columns):
+            if (col >> i) & 1:
+                row |= 1 << (width - 1 - j if msb_first else j)
+        rows.append(row)
+    return tuple(rows)
+
 
 class LCDFonts:
     """LCD字体数据类"""
@@ -112,42 +172,39 @@ class LCDFonts:
     
     @staticmethod
     def get_ascii_1608_font(char_code: int) -> List[int]:
-        """获取8x16 ASCII字体数据"""
-        # 这里应该包含完整的字体数据，暂时返回空数据
-        return [0] * 16
+        """获取8x16 ASCII字体数据 (来自字模图集)"""
+        return list(atlas_rows(16, char_code))
     
     @staticmethod
     def get_ascii_2412_font(char_code: int) -> List[int]:
-        """获取12x24 ASCII字体数据"""
-        # 这里应该包含完整的字体数据，暂时返回空数据
-        return [0] * 24
+        """获取12x24 ASCII字体数据 (来自字模图集)"""
+        return list(atlas_rows(24, char_code))
     
     @staticmethod
     def get_ascii_3216_font(char_code: int) -> List[int]:
-        """获取16x32 ASCII字体数据"""
-        # 这里应该包含完整的字体数据，暂时返回空数据
-        return [0] * 32
+        """获取16x32 ASCII字体数据 (来自字模图集)"""
+        return list(atlas_rows(32, char_code))
     
     @staticmethod
     def get_chinese_12x12_font(char_bytes: bytes) -> List[int]:
-        """获取12x12中文字体数据"""
-        # 这里应该包含中文字体数据，暂时返回空数据
-        return [0] * 24
+        """获取12x12中文字体数据 (来自 lcd_cjk_font 注册的字库，未注册时为空数据)"""
+        from lcd_cjk_font import chinese_rows
+        return chinese_rows(12, char_bytes)
     
     @staticmethod
     def get_chinese_16x16_font(char_bytes: bytes) -> List[int]:
-        """获取16x16中文字体数据"""
-        # 这里应该包含中文字体数据，暂时返回空数据
-        return [0] * 32
+        """获取16x16中文字体数据 (来自 lcd_cjk_font 注册的字库，未注册时为空数据)"""
+        from lcd_cjk_font import chinese_rows
+        return chinese_rows(16, char_bytes)
     
     @staticmethod
     def get_chinese_24x24_font(char_bytes: bytes) -> List[int]:
-        """获取24x24中文字体数据"""
-        # 这里应该包含中文字体数据，暂时返回空数据
-        return [0] * 72
+        """获取24x24中文字体数据 (来自 lcd_cjk_font 注册的字库，未注册时为空数据)"""
+        from lcd_cjk_font import chinese_rows
+        return chinese_rows(24, char_bytes)
     
     @staticmethod
     def get_chinese_32x32_font(char_bytes: bytes) -> List[int]:
-        """获取32x32中文字体数据"""
-        # 这里应该包含中文字体数据，暂时返回空数据
-        return [0] * 128
+        """获取32x32中文字体数据 (来自 lcd_cjk_font 注册的字库，未注册时为空数据)"""
+        from lcd_cjk_font import chinese_rows
+        return chinese_rows(32, char_bytes)
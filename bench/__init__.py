@@ -0,0 +1,8 @@
+"""
+传输与刷新路径的基准测试 (在 MPSSE 模拟器上运行，不需要硬件，Linux 可用)
+
+    python -m bench.run -o bench/results.json
+    python -m bench.compare bench/baselines/emulated.json bench/results.json
+
+bench/baselines/ 只含确定性计数指标；计时基线在本机生成到 bench/local/ (见 bench.compare)。
+"""
@@ -0,0 +1,104 @@
+"""
+与保存的基准结果比较，标出性能退化
+
+写入次数、字节数等确定性指标只要增加就算退化；CPU 时间、每秒操作数 (bench.render)
+与每次操作的峰值分配按相对阈值判断。只比较两份结果中都有的指标。
+
+仓库中的基线 (bench/baselines/) 只含确定性计数指标。不同机器的计时不可比，
+计时基线需在本机生成 (bench/local/ 不纳入版本管理)，之后与同一台机器上的结果比较。
+
+用法:
+    python -m bench.compare bench/baselines/emulated.json bench/results.json
+
+    python -m bench.run -o bench/local/emulated.json          # 改动前: 本机计时基线
+    python -m bench.run -o bench/results.json                 # 改动后
+    python -m bench.compare bench/local/emulated.json bench/results.json --cpu-threshold 0.2
+
+    python -m bench.render -o bench/local/render.json
+    python -m bench.render -o bench/render.json
+    python -m bench.compare bench/local/render.json bench/render.json
+
+退出码: 0=无退化, 1=有退化
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+# 确定性指标 (模拟器上的计数，与机器无关)
+EXACT_METRICS = (
+    'writes_per_frame',
+    'bytes_per_frame',
+    'clocked_bytes_per_frame',
+    'gpio_sets_per_frame',
+    'wire_ms_per_frame',
+)
+# 计时与分配指标 (越小越好)
+TIMING_METRICS = ('cpu_ms_per_frame', 'us_per_op', 'peak_bytes_per_op')
+# 越大越好的指标
+HIGHER_METRICS = ('ops_per_s',)
+
+
+def compare(baseline: Dict[str, dict], current: Dict[str, dict],
+            cpu_threshold: float = 0.25) -> Tuple[List[tuple], List[tuple]]:
+    """
+    比较两份结果
+
+    Returns:
+        (退化列表, 全部比较行)，每行为 (基准, 指标, 基线值, 当前值, 变化比例, 是否退化)
+    """
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        base, cur = baseline[name], current[name]
+        for metric in EXACT_METRICS + TIMING_METRICS + HIGHER_METRICS:
+            if metric not in base or metric not in cur:
+                continue
+            old, new = base[metric], cur[metric]
+            change = (new - old) / old if old else (0.0 if new == old else float('inf'))
+            if metric in EXACT_METRICS:
+                regressed = new > old * (1 + 1e-9)
+            elif metric in HIGHER_METRICS:
+                regressed = change < -cpu_threshold
+            else:
+                regressed = change > cpu_threshold
+            rows.append((name, metric, old, new, change, regressed))
+    return [row for row in rows if row[5]], rows
+
+
+def _load(path: str) -> Dict[str, dict]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='比较基准测试结果')
+    parser.add_argument('baseline', help='基线 JSON')
+    parser.add_argument('current', help='当前结果 JSON')
+    parser.add_argument('--cpu-threshold', type=float, default=0.25,
+                        help='计时指标允许的相对变差 (默认 0.25 = 25%%)')
+    parser.add_argument('--all', action='store_true', help='显示全部指标 (默认只显示有变化的)')
+    args = parser.parse_args()
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    regressions, rows = compare(baseline, current, args.cpu_threshold)
+
+    for name, metric, old, new, change, regressed in rows:
+        if not args.all and not regressed and abs(change) < 0.01:
+            continue
+        better = change > 0 if metric in HIGHER_METRICS else change < 0
+        flag = '退化' if regressed else ('改善' if better else '')
+        print(f"{name:28s} {metric:24s} {old:12.3f} -> {new:12.3f} ({change:+7.1%}) {flag}")
+
+    missing = sorted(set(baseline) - set(current))
+    if missing:
+        print(f"当前结果缺少基准: {missing}")
+
+    if regressions:
+        print(f"发现 {len(regressions)} 项退化")
+        sys.exit(1)
+    print("无退化")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+基准测试工具: 把各驱动的接口连接到 MPSSE 模拟器，测量每帧的USB写入次数、字节数、
+Python CPU 时间与给定 SCLK 下的总线时间估算。
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import time
+from typing import Callable, Dict
+
+from ftdi_emulator import FTDIEmulator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def quiet(fn: Callable, *args, **kwargs):
+    """执行 fn 并丢弃其打印输出 (驱动在连接/初始化时打印较多)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def attach_emulator(spi, clock: int) -> FTDIEmulator:
+    """
+    把未连接的 FTDI 接口 (gemini_lcd_00/01、FT2232_01 等) 接到模拟器上，
+    按 clock 初始化 MPSSE
+
+    Returns:
+        FTDIEmulator: 模拟器 (统计从此刻开始)
+    """
+    emulator = FTDIEmulator()
+    emulator.setBitMode(0x00, 0x02)
+    spi.use_ctypes = False
+    spi.device_handle = emulator
+    spi.clock_speed = clock
+    quiet(spi._initialize_mpsse)
+    spi.is_connected = True
+    return emulator
+
+
+def load_bluebrid(name: str):
+    """按文件路径导入 bluebrid 目录下的脚本 (该目录不是包)"""
+    path = os.path.join(ROOT, 'bluebrid', f'{name}.py')
+    spec = importlib.util.spec_from_file_location(f'bluebrid_{name}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(emulator: FTDIEmulator, run: Callable[[], object], frames: int, sclk: int) -> Dict[str, float]:
+    """
+    执行 run() frames 次，返回每帧的平均指标
+
+    Args:
+        emulator: 被测接口所连的模拟器
+        run: 渲染/刷新一帧
+        frames: 帧数
+        sclk: 用于估算总线时间的 SCLK 频率 (Hz)
+    """
+    start = emulator.stats()
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    for _ in range(frames):
+        quiet(run)
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+    end = emulator.stats()
+
+    def per_frame(key):
+        return (end[key] - start[key]) / frames
+
+    clocked = per_frame('bytes_clocked')
+    return {
+        'frames': frames,
+        'writes_per_frame': per_frame('writes'),
+        'bytes_per_frame': per_frame('bytes_written'),
+        'clocked_bytes_per_frame': clocked,
+        'gpio_sets_per_frame': per_frame('gpio_sets'),
+        'cpu_ms_per_frame': cpu / frames * 1000,
+        'wall_ms_per_frame': wall / frames * 1000,
+        'wire_ms_per_frame': clocked * 8 / sclk * 1000,
+    }
@@ -0,0 +1,312 @@
+"""
+绘图原语微基准 (只测显示缓冲区上的渲染，不涉及USB)
+
+对 gemini_lcd.PMDBLCD、gemini_lcd_00.PMDBLCD、gemini_lcd_01.P3PLUSLCD 的画点、画线、画圆、
+填充、字符/字符串、整数显示与清屏，以及仪表盘/文字页/曲线图三个典型场景，
+测量每秒操作数与每次操作的内存分配 (tracemalloc 峰值字节与残留内存块)。
+
+用法:
+    python -m bench.render                              # 打印结果
+    python -m bench.render -o bench/render.json
+    python -m bench.render --drivers pmdb p3plus --ops line show_string_static
+    python -m bench.render -o bench/local/render.json    # 本机基线 (计时只能与同一台机器比较)
+    python -m bench.compare bench/local/render.json bench/render.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+from bench.harness import quiet
+
+
+# ==========================================
+# 驱动适配: 统一各驱动的绘图接口 (不支持的操作为None)
+# ==========================================
+
+def _adapt_pmdb():
+    from gemini_lcd import PMDBLCD
+    lcd = PMDBLCD(None)
+    return {
+        'point': lcd.lcd_draw_point,
+        'line': lcd.lcd_draw_line,
+        'rect': lcd.lcd_draw_rectangle,
+        'circle': lcd.draw_circle,
+        'fill': lcd.lcd_fill,
+        'char': lambda x, y, ch, size: lcd.lcd_show_char(x, y, ch, 1, 0, size),
+        'string': lambda x, y, text, size: lcd.lcd_show_string(x, y, text, 1, 0, size),
+        'int_num': lambda x, y, num, length, size: lcd.lcd_show_int_num(x, y, num, length, 1, 0, size),
+        'clear': lcd.clear_screen,
+        'size16': True,
+    }
+
+
+def _adapt_p3plus():
+    from gemini_lcd_01 import P3PLUSLCD
+    lcd = P3PLUSLCD(None)
+    return {
+        'point': lcd.lcd_draw_point,
+        'line': lcd.lcd_draw_line,
+        'rect': lcd.lcd_draw_rectangle,
+        'circle': lcd.draw_circle,
+        'fill': lcd.lcd_fill,
+        'char': lambda x, y, ch, size: lcd.lcd_show_char(x, y, ch, 1, 0, size),
+        'string': lambda x, y, text, size: lcd.lcd_show_string(x, y, text, 1, 0, size),
+        'int_num': lambda x, y, num, length, size: lcd.lcd_show_int_num(x, y, num, length, 1, 0, size),
+        'clear': lcd.clear_screen,
+        'size16': None,     # 仅 12 号字体
+    }
+
+
+def _adapt_pmdb00():
+    from gemini_lcd_00 import PMDBLCD
+    lcd = PMDBLCD(None)
+    return {
+        'point': lcd.draw_point,
+        'line': lcd.draw_line,
+        'rect': lcd.draw_rect,
+        'circle': lcd.draw_circle,
+        'fill': None,
+        'char': lambda x, y, ch, size: lcd.show_string(x, y, ch, size),
+        'string': lambda x, y, text, size: lcd.show_string(x, y, text, size),
+        'int_num': None,
+        'clear': lcd.clear,
+        'size16': None,     # 仅 12 号字体
+    }
+
+
+DRIVERS: Dict[str, Callable[[], dict]] = {
+    'pmdb': _adapt_pmdb,
+    'pmdb00': _adapt_pmdb00,
+    'p3plus': _adapt_p3plus,
+}
+
+
+# ==========================================
+# 操作: 名称 -> (需要的原语, 生成第 i 次操作的函数)
+# ==========================================
+
+def _op_point(d, i):
+    d['point']((i * 37) & 127, (i * 91) & 127, i & 1)
+
+
+def _op_line(d, i):
+    k = i & 63
+    d['line'](0, k, 127, 127 - k, 1)
+
+
+def _op_circle(d, i):
+    d['circle'](64, 64, 10 + (i % 40), 1)
+
+
+def _op_fill(d, i):
+    # 64x20 区域，y 不按页对齐
+    y = 3 + (i % 8)
+    d['fill'](16, y, 79, y + 19, i & 1)
+
+
+def _op_char(d, i):
+    d['char']((i * 6) % 120, 16, chr(33 + i % 94), 12)
+
+
+def _op_string_static(d, i):
+    d['string'](0, 32, "Temp: 23.5 C  OK", 12)
+
+
+def _op_string_varying(d, i):
+    d['string'](0, 48, f"Count {i:010d}", 12)
+
+
+def _op_string_16(d, i):
+    d['string'](0, 64, f"V={i % 1000:04d}", 16)
+
+
+def _op_int_num(d, i):
+    d['int_num'](0, 80, i % 100000, 5, 12)
+
+
+def _op_clear(d, i):
+    d['clear'](i & 1)
+
+
+def _scene_dashboard(d, i):
+    """仪表盘: 边框、标签、数值、进度条"""
+    value = i % 101
+    d['rect'](0, 0, 127, 127, 1)
+    d['string'](4, 4, "SPEED", 12)
+    d['string'](4, 20, f"{value * 3:5d} rpm", 16 if d['size16'] else 12)
+    d['string'](4, 44, "LOAD", 12)
+    d['rect'](4, 58, 123, 69, 1)
+    if d['fill'] is not None:
+        d['fill'](5, 59, 5 + value * 117 // 100, 68, 1)
+        d['fill'](6 + value * 117 // 100, 59, 122, 68, 0)
+    d['string'](4, 76, f"T {20 + value % 15:2d}.{value % 10} C", 12)
+    d['circle'](100, 100, 20, 1)
+
+
+_TEXT_PAGE = [
+    "FT2232H LCD driver",
+    "UC1638 128x128 mono",
+    "SPI mode 0  6 MHz",
+    "Page format buffer",
+    "Dirty rect flush",
+    "Text strip cache",
+    "Scene graph widgets",
+    "Shared framebuffer",
+    "Display daemon",
+    "Capture and replay",
+]
+
+
+def _scene_text_page(d, i):
+    """文字页: 整屏 10 行文字 (每帧一行内容变化)"""
+    d['clear'](0)
+    for row, line in enumerate(_TEXT_PAGE):
+        text = f"{line} {i % 100:02d}" if row == i % len(_TEXT_PAGE) else line
+        d['string'](0, row * 12, text, 12)
+
+
+def _scene_chart(d, i):
+    """曲线图: 坐标轴 + 100 点折线"""
+    d['clear'](0)
+    d['line'](10, 5, 10, 120, 1)
+    d['line'](10, 120, 125, 120, 1)
+    prev = None
+    for k in range(100):
+        y = 62 + ((k * 7 + i * 3) % 50) - 25
+        point = (12 + k, y)
+        if prev is not None:
+            d['line'](prev[0], prev[1], point[0], point[1], 1)
+        prev = point
+
+
+OPS: Dict[str, tuple] = {
+    'point': (('point',), _op_point),
+    'line': (('line',), _op_line),
+    'circle': (('circle',), _op_circle),
+    'fill': (('fill',), _op_fill),
+    'show_char': (('char',), _op_char),
+    'show_string_static': (('string',), _op_string_static),
+    'show_string_varying': (('string',), _op_string_varying),
+    'show_string_16': (('string', 'size16'), _op_string_16),
+    'show_int_num': (('int_num',), _op_int_num),
+    'clear_screen': (('clear',), _op_clear),
+    'scene_dashboard': (('rect', 'string', 'circle'), _scene_dashboard),
+    'scene_text_page': (('clear', 'string'), _scene_text_page),
+    'scene_chart': (('clear', 'line'), _scene_chart),
+}
+
+
+# ==========================================
+# 测量
+# ==========================================
+
+def measure_op(adapter: dict, op: Callable, min_time: float = 0.2, alloc_ops: int = 20) -> Dict[str, float]:
+    """
+    测量一个操作
+
+    Args:
+        adapter: 驱动适配字典
+        op: op(adapter, i)
+        min_time: 计时阶段的最短运行时间 (秒)
+        alloc_ops: 分配测量阶段的操作次数
+
+    Returns:
+        Dict[str, float]: ops_per_s, us_per_op, peak_bytes_per_op, retained_blocks_per_op
+    """
+    # 预热 (填充缓存、导入字库)
+    for i in range(10):
+        quiet(op, adapter, i)
+
+    # 计时: 按上一轮的耗时估算次数，直到单轮超过 min_time
+    n = 10
+    while True:
+        start = time.perf_counter()
+        for i in range(n):
+            op(adapter, i)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        n = max(n * 2, int(n * min_time * 1.1 / max(elapsed, 1e-6)))
+
+    # 内存: 单次操作的峰值增量，以及一批操作后残留的内存块数
+    tracemalloc.start()
+    try:
+        peak = 0
+        for i in range(alloc_ops):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            op(adapter, i)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+        before = tracemalloc.take_snapshot()
+        for i in range(alloc_ops):
+            op(adapter, alloc_ops + i)
+        after = tracemalloc.take_snapshot()
+        retained = sum(stat.count_diff for stat in after.compare_to(before, 'lineno') if stat.count_diff > 0)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops': n,
+        'ops_per_s': n / elapsed,
+        'us_per_op': elapsed / n * 1000000,
+        'peak_bytes_per_op': peak,
+        'retained_blocks_per_op': retained / alloc_ops,
+    }
+
+
+def run(drivers=None, ops=None, min_time: float = 0.2) -> Dict[str, dict]:
+    """
+    运行微基准
+
+    Returns:
+        Dict[str, dict]: '驱动.操作' -> 指标 (驱动不支持的操作不出现)
+    """
+    results = {}
+    for driver in drivers or DRIVERS:
+        for name in ops or OPS:
+            needs, op = OPS[name]
+            adapter = quiet(DRIVERS[driver])
+            if any(adapter.get(k) is None for k in needs):
+                continue
+            results[f'{driver}.{name}'] = measure_op(adapter, op, min_time)
+    return results
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description='绘图原语微基准')
+    parser.add_argument('-o', '--output', help='结果 JSON 路径 (默认打印)')
+    parser.add_argument('--drivers', nargs='+', choices=sorted(DRIVERS), help='只测指定驱动')
+    parser.add_argument('--ops', nargs='+', choices=sorted(OPS), help='只测指定操作')
+    parser.add_argument('--min-time', type=float, default=0.2, help='每项最短计时 (秒)')
+    args = parser.parse_args(argv)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        },
+        'results': run(args.drivers, args.ops, args.min_time),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"结果已写入 {args.output}")
+    else:
+        print(text)
+
+    for name, result in report['results'].items():
+        print(f"{name:30s} {result['ops_per_s']:12.0f} 次/秒  {result['us_per_op']:10.1f} us/次  "
+              f"峰值 {result['peak_bytes_per_op']:7d} B  残留 {result['retained_blocks_per_op']:6.2f} 块",
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""
+运行基准测试并输出 JSON
+
+用法:
+    python -m bench.run                               # 打印结果
+    python -m bench.run -o bench/results.json --sclk 6000000
+    python -m bench.run --only pmdb_flush ssd1306_refresh
+    python -m bench.run --counts-only -o bench/baselines/emulated.json   # 更新提交的基线
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict
+
+from bench.compare import EXACT_METRICS
+from bench.harness import attach_emulator, load_bluebrid, measure, quiet
+
+# 名称 -> (建立被测对象的函数, 默认帧数)
+# 建立函数参数为 SCLK，返回 (模拟器, 每帧执行的函数)
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def benchmark(name: str, frames: int):
+    def register(fn: Callable):
+        BENCHMARKS[name] = (fn, frames)
+        return fn
+    return register
+
+
+def _pmdb(sclk: int):
+    from ftdi_emulator import FTDIEmulator
+    from gemini_lcd import FTD2XXSPIInterface, PMDBLCD
+    emulator = FTDIEmulator()
+    spi = FTD2XXSPIInterface(backend=emulator)
+    quiet(spi.connect)
+    quiet(spi.configure_spi, 0, sclk)
+    lcd = PMDBLCD(spi)
+    lcd.display_buffer[:] = bytes(range(256)) * (len(lcd.display_buffer) // 256)
+    return emulator, lcd
+
+
+@benchmark('pmdb_flush', 50)
+def bench_pmdb_flush(sclk: int):
+    emulator, lcd = _pmdb(sclk)
+    return emulator, lcd.lcd_flush
+
+
+@benchmark('pmdb_flush_rect', 100)
+def bench_pmdb_flush_rect(sclk: int):
+    emulator, lcd = _pmdb(sclk)
+    return emulator, lambda: lcd.flush_rect(10, 20, 57, 35)
+
+
+@benchmark('uc1638_init', 3)
+def bench_uc1638_init(sclk: int):
+    emulator, lcd = _pmdb(sclk)
+    return emulator, lcd.pmdb_init
+
+
+@benchmark('p3plus_flush', 50)
+def bench_p3plus_flush(sclk: int):
+    import gemini_lcd_01
+    spi = gemini_lcd_01.FTD2XXSPIInterface()
+    emulator = attach_emulator(spi, sclk)
+    lcd = gemini_lcd_01.P3PLUSLCD(spi)
+    lcd.display_buffer[:] = bytes(range(256)) * (len(lcd.display_buffer) // 256)
+    return emulator, lcd.lcd_flush
+
+
+@benchmark('ssd1306_refresh', 20)
+def bench_ssd1306_refresh(sclk: int):
+    import FT2232_01
+    spi = FT2232_01.FTD2XXSPIInterface()
+    emulator = attach_emulator(spi, sclk)
+    lcd = FT2232_01.PMDBLCD(spi)
+    lcd.initialized = True
+    lcd.display_buffer[:] = bytes(range(256)) * (len(lcd.display_buffer) // 256)
+    return emulator, lcd.refresh
+
+
+def _st7789(sclk: int):
+    from ftdi_emulator import FTDIEmulator
+    module = load_bluebrid('gemini')
+    emulator = FTDIEmulator()
+    emulator.setBitMode(0x00, 0x02)
+    # 不打开真实设备: 只替换写函数
+    driver = module.FTDI_PDF_Driver.__new__(module.FTDI_PDF_Driver)
+    driver._write_raw = emulator.write
+    driver._setup_mpsse()
+    return emulator, driver
+
+
+@benchmark('st7789_init', 3)
+def bench_st7789_init(sclk: int):
+    emulator, spi = _st7789(sclk)
+
+    def init():
+        # 与 bluebrid/gemini.py main() 相同的初始化序列
+        spi.drive_reset_procedure()
+        spi.write_cmd_a0(0x11)
+        time.sleep(0.12)
+        spi.write_cmd_a0(0x3A)
+        spi.write_data_a1(0x05)
+        spi.write_cmd_a0(0x36)
+        spi.write_data_a1(0x2A)
+        spi.write_cmd_a0(0x2A)
+        spi.write_data_a1([0x00, 0x00, 0x01, 0x3F])
+        spi.write_cmd_a0(0x2B)
+        spi.write_data_a1([0x00, 0x00, 0x00, 0xEF])
+        spi.write_cmd_a0(0x29)
+    return emulator, init
+
+
+@benchmark('st7789_frame', 5)
+def bench_st7789_frame(sclk: int):
+    emulator, spi = _st7789(sclk)
+    line = [0x07, 0xE0] * 320
+
+    def frame():
+        # 与 bluebrid/gemini.py main() 相同的整帧写入 (320x240 RGB565，逐行)
+        spi.write_cmd_a0(0x2C)
+        for _ in range(240):
+            spi.write_data_a1(line)
+    return emulator, frame
+
+
+def run(names=None, sclk: int = 6000000, frames: int = None) -> Dict[str, dict]:
+    """
+    运行基准测试
+
+    Args:
+        names: 要运行的基准名称 (默认全部)
+        sclk: SCLK 频率 (Hz)，用于配置接口与估算总线时间
+        frames: 覆盖默认帧数
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        setup, default_frames = BENCHMARKS[name]
+        emulator, fn = quiet(setup, sclk)
+        results[name] = measure(emulator, fn, frames or default_frames, sclk)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='传输与刷新路径基准测试 (MPSSE 模拟器)')
+    parser.add_argument('-o', '--output', help='结果 JSON 路径 (默认打印)')
+    parser.add_argument('--sclk', type=int, default=6000000, help='SCLK 频率 (Hz)')
+    parser.add_argument('--frames', type=int, default=None, help='覆盖默认帧数')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='只运行指定的基准')
+    parser.add_argument('--counts-only', action='store_true',
+                        help='只输出确定性计数指标 (提交到仓库的基线不含计时)')
+    args = parser.parse_args()
+
+    results = run(args.only, args.sclk, args.frames)
+    if args.counts_only:
+        output = {name: {key: value for key, value in result.items()
+                         if key == 'frames' or key in EXACT_METRICS}
+                  for name, result in results.items()}
+    else:
+        output = results
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sclk': args.sclk,
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        },
+        'results': output,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"结果已写入 {args.output}")
+    else:
+        print(text)
+
+    for name, result in results.items():
+        print(f"{name:18s} 写入 {result['writes_per_frame']:8.1f} 次/帧  "
+              f"{result['bytes_per_frame']:9.0f} 字节/帧  CPU {result['cpu_ms_per_frame']:8.2f} ms/帧  "
+              f"总线 {result['wire_ms_per_frame']:7.2f} ms/帧", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
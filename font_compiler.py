@@ -0,0 +1,206 @@
+"""
+字体编译器 (离线工具)
+将 TTF/OTF (Pillow FreeType) 或 BDF/PCF 点阵字体栅格化为驱动使用的字模图集，
+生成 lcd_font_atlas.py。运行时只做查表，不需要 Pillow。
+
+图集格式: 每个字号一段连续字节，字符 (FIRST_CHAR 起共 CHAR_COUNT 个) 依次排列，
+每个字符 页数 * 宽 字节，页优先、列次之 (第 k 页第 j 列的字节 bit i = 第 8k+i 行)，
+与显示缓冲区的页格式一致，可直接按列取用。
+
+使用 --cjk 时生成 lcd_cjk_font 的 Unicode 字库文件 (每个字号一个文件，
+字形为 size x size)，字符集默认为 GB2312 全部汉字与符号。
+
+用法:
+    python font_compiler.py SourceCodePro-Bold.ttf -s 16 24 32 -o lcd_font_atlas.py
+    python font_compiler.py ter-u16n.bdf -s 16 -o lcd_font_atlas.py
+    python font_compiler.py wqy-microhei.ttc --cjk -s 16 24 -o cjk{size}.bin
+"""
+
+import argparse
+import os
+import tempfile
+from typing import Dict, List
+
+from PIL import Image, ImageDraw, ImageFont
+
+FIRST_CHAR = 32   # ' '
+LAST_CHAR = 126   # '~'
+CHARSET = ''.join(chr(c) for c in range(FIRST_CHAR, LAST_CHAR + 1))
+
+
+def gb2312_charset() -> str:
+    """GB2312 全部双字节字符 (按区位码顺序)"""
+    chars = []
+    for zone in range(0xA1, 0xF8):
+        for pos in range(0xA1, 0xFF):
+            try:
+                chars.append(bytes([zone, pos]).decode('gb2312'))
+            except UnicodeDecodeError:
+                pass
+    return ''.join(chars)
+
+
+def load_font(path: str, height: int, charset: str = CHARSET):
+    """
+    加载字体
+
+    TTF/OTF 按像素高度加载 (字号逐步缩小直到全部字符的墨迹高度不超过 height)；
+    BDF/PCF 通过 Pillow 的 FontFile 转换为 .pil 点阵字体后加载 (不缩放)。
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.bdf', '.pcf'):
+        if ext == '.bdf':
+            from PIL import BdfFontFile as font_file_module
+            cls = font_file_module.BdfFontFile
+        else:
+            from PIL import PcfFontFile as font_file_module
+            cls = font_file_module.PcfFontFile
+        with open(path, 'rb') as fp:
+            font_file = cls(fp)
+        # ImageFont.load 会把点阵图整个读入内存，返回后即可删除临时目录
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base = os.path.join(tmp_dir, 'font')
+            font_file.save(base)
+            return ImageFont.load(base + '.pil')
+
+    pixel_size = height
+    while pixel_size > 4:
+        font = ImageFont.truetype(path, pixel_size)
+        top, bottom = _ink_rows(font, charset)
+        if bottom - top <= height:
+            return font
+        pixel_size -= 1
+    raise Exception(f"无法将字体缩放到 {height} 像素高: {path}")
+
+
+def _ink_rows(font, charset: str = CHARSET):
+    """整个字符集的墨迹纵向范围 (上, 下)，以 draw.text((0, 0)) 为基准"""
+    top, bottom = None, None
+    for char in charset:
+        bbox = font.getbbox(char)
+        if bbox[3] <= bbox[1]:
+            continue
+        top = bbox[1] if top is None else min(top, bbox[1])
+        bottom = bbox[3] if bottom is None else max(bottom, bbox[3])
+    return top or 0, bottom or 0
+
+
+def rasterize_font(path: str, width: int, height: int, charset: str = CHARSET) -> List[List[int]]:
+    """
+    将字符集栅格化到 width x height 的字符格
+
+    字符在格内水平居中 (按前进宽度)，整个字符集共用同一基线，墨迹纵向居中。
+
+    Returns:
+        List[List[int]]: 每个字符的按列位掩码 (bit i = 第i行点亮)
+    """
+    font = load_font(path, height, charset)
+    top, bottom = _ink_rows(font, charset)
+    y_offset = (height - (bottom - top)) // 2 - top
+
+    glyphs = []
+    for char in charset:
+        img = Image.new('1', (width, height), 0)
+        draw = ImageDraw.Draw(img)
+        draw.fontmode = '1'
+        advance = font.getlength(char) if hasattr(font, 'getlength') else font.getbbox(char)[2]
+        x_offset = int(round((width - advance) / 2))
+        draw.text((x_offset, y_offset), char, fill=1, font=font)
+
+        pixels = img.load()
+        columns = []
+        for x in range(width):
+            col = 0
+            for y in range(height):
+                if pixels[x, y]:
+                    col |= 1 << y
+            columns.append(col)
+        glyphs.append(columns)
+    return glyphs
+
+
+def columns_to_pages(columns: List[int], height: int) -> bytes:
+    """按列位掩码 -> 页优先的页格式字节"""
+    pages = (height + 7) >> 3
+    out = bytearray()
+    for k in range(pages):
+        out.extend((col >> (k << 3)) & 0xFF for col in columns)
+    return bytes(out)
+
+
+def compile_atlas(path: str, sizes: List[int]) -> Dict[int, tuple]:
+    """
+    编译图集
+
+    Returns:
+        Dict[int, tuple]: 字号 -> (宽, 高, 图集字节)
+    """
+    atlas = {}
+    for size in sizes:
+        width, height = size // 2, size
+        glyphs = rasterize_font(path, width, height)
+        data = b''.join(columns_to_pages(columns, height) for columns in glyphs)
+        atlas[size] = (width, height, data)
+    return atlas
+
+
+def write_atlas_module(atlas: Dict[int, tuple], out_path: str, source: str):
+    """生成图集模块 (十六进制字符串，每行一个字符)"""
+    lines = [
+        '"""',
+        'LCD 字模图集 (由 font_compiler.py 自动生成，请勿手动修改)',
+        '',
+        f'源字体: {source}',
+        '格式: 每个字符 页数*宽 字节，页优先、列次之，字节内 LSB 在上',
+        '"""',
+        '',
+        f'FIRST_CHAR = {FIRST_CHAR}',
+        f'CHAR_COUNT = {len(CHARSET)}',
+        '',
+        '# 字号: (宽, 高, 图集数据)',
+        'ATLAS = {',
+    ]
+    for size in sorted(atlas):
+        width, height, data = atlas[size]
+        glyph_bytes = width * ((height + 7) >> 3)
+        lines.append(f'    {size}: ({width}, {height}, bytes.fromhex(')
+        for i in range(0, len(data), glyph_bytes):
+            char = CHARSET[i // glyph_bytes]
+            lines.append(f"        '{data[i:i + glyph_bytes].hex()}'  # {char!r}")
+        lines.append('    )),')
+    lines.append('}')
+    lines.append('')
+
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='将 TTF/BDF/PCF 字体编译为 LCD 字模图集')
+    parser.add_argument('font', help='字体文件 (.ttf/.otf/.bdf/.pcf)')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[16, 24, 32],
+                        help='字号 (字符格高度，宽度为一半)')
+    parser.add_argument('-o', '--output', default='lcd_font_atlas.py',
+                        help='输出路径 (--cjk 时可含 {size} 占位符)')
+    parser.add_argument('--cjk', action='store_true', help='生成中文 Unicode 字库文件')
+    parser.add_argument('--chars', help='中文字库的字符集 (默认 GB2312)')
+    args = parser.parse_args()
+
+    if args.cjk:
+        from lcd_cjk_font import write_store
+        charset = args.chars or gb2312_charset()
+        for size in args.sizes:
+            glyphs = rasterize_font(args.font, size, size, charset)
+            out = args.output.format(size=size)
+            write_store(out, size, {ord(c): g for c, g in zip(charset, glyphs)})
+            print(f"已生成 {out}: {size}x{size}, {len(charset)} 字")
+        return
+
+    atlas = compile_atlas(args.font, args.sizes)
+    write_atlas_module(atlas, args.output, os.path.basename(args.font))
+    total = sum(len(data) for _, _, data in atlas.values())
+    print(f"已生成 {args.output}: 字号 {sorted(atlas)}, 共 {total} 字节")
+
+
+if __name__ == '__main__':
+    main()
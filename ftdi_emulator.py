@@ -0,0 +1,361 @@
+"""
+FTDI MPSSE 模拟器
+提供与 ftd2xx 设备句柄相同的 write/read/getQueueStatus/purge 等方法，解析 MPSSE 命令流:
+GPIO 设置/读取、时钟分频、字节/位时钟输出与输入、SEND_IMMEDIATE，
+并按时钟分频估算总线时间。没有硬件时可作为 FTD2XXSPIInterface(backend=...) 或
+lcd_capture.replay() 的后端。
+
+每次时钟输出的数据连同当时的 GPIO 状态交给 listeners (可用于解码 A0/CS 与控制器命令)，
+时钟输入的数据由 reader 提供 (默认全0)。UC1638Model 据此模拟控制器 GRAM 的写入与读回。
+
+用法:
+    emu = FTDIEmulator()
+    spi = FTD2XXSPIInterface(backend=emu)
+    spi.connect()
+    ...
+    print(emu.stats())
+"""
+
+import random
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+# 主时钟 (禁用5分频时 60MHz，启用时 12MHz)
+BASE_CLOCK = 60000000
+BASE_CLOCK_DIV5 = 12000000
+
+# 带 2 字节参数的命令
+_TWO_ARG_COMMANDS = {0x80, 0x82, 0x86, 0x8F, 0x9C, 0x9D, 0x9E}
+# 无参数的配置命令
+_NO_ARG_COMMANDS = {0x84, 0x85, 0x87, 0x88, 0x89, 0x8A, 0x8B, 0x8C, 0x8D, 0x96, 0x97}
+
+
+class FTDIEmulator:
+    """模拟 FT2232H 一个通道的 MPSSE 引擎"""
+
+    def __init__(self, serial: str = 'EMU0001A', description: str = 'FTDI Emulator A'):
+        self.serial = serial
+        self.description = description
+        self.bit_mode = 0
+        self.divisor = 0
+        self.div5 = True          # 上电默认启用5分频
+        self.loopback = False
+
+        self.gpio_low = 0
+        self.gpio_high = 0
+        self.dir_low = 0
+        self.dir_high = 0
+
+        # 每次时钟输出调用 listener(gpio, data)，gpio = 高8位<<8 | 低8位
+        self.listeners: List[Callable[[int, bytes], None]] = []
+        # 每次字节时钟输入调用 reader(gpio, 长度) 取得输入数据 (None=全0)
+        self.reader: Optional[Callable[[int, int], bytes]] = None
+
+        self._pending = bytearray()
+        self._rx = deque()
+
+        # 统计
+        self.writes = 0
+        self.bytes_written = 0
+        self.bytes_clocked = 0
+        self.gpio_sets = 0
+        self.bus_time = 0.0
+
+    # ------------------------------------------------------------------
+    # ftd2xx 设备句柄接口
+    # ------------------------------------------------------------------
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.writes += 1
+        self.bytes_written += len(data)
+        if self.bit_mode == 0x02:
+            self._pending += data
+            self._parse()
+        return len(data)
+
+    def read(self, length: int) -> bytes:
+        n = min(length, len(self._rx))
+        return bytes(self._rx.popleft() for _ in range(n))
+
+    def getQueueStatus(self) -> int:
+        return len(self._rx)
+
+    def purge(self, mask: int = 3):
+        if mask & 1:
+            self._rx.clear()
+        if mask & 2:
+            self._pending.clear()
+
+    def setBitMode(self, mask: int, mode: int):
+        self.bit_mode = mode
+        self._pending.clear()
+
+    def setUSBParameters(self, in_size: int, out_size: int = 0):
+        pass
+
+    def setLatencyTimer(self, latency: int):
+        pass
+
+    def resetDevice(self):
+        self.__init__(self.serial, self.description)
+
+    def getDeviceInfo(self) -> tuple:
+        return self.description, self.serial, 0x04036010
+
+    def close(self):
+        pass
+
+    # ------------------------------------------------------------------
+    # MPSSE 解析
+    # ------------------------------------------------------------------
+    @property
+    def clock_hz(self) -> float:
+        """当前 SCLK 频率"""
+        base = BASE_CLOCK_DIV5 if self.div5 else BASE_CLOCK
+        return base / ((1 + self.divisor) * 2)
+
+    @property
+    def gpio(self) -> int:
+        return (self.gpio_high << 8) | self.gpio_low
+
+    def _clock(self, bits: int):
+        self.bus_time += bits / self.clock_hz
+
+    def _output(self, data: bytes):
+        self.bytes_clocked += len(data)
+        self._clock(len(data) * 8)
+        gpio = self.gpio
+        for listener in self.listeners:
+            listener(gpio, data)
+
+    def _input(self, length: int) -> bytes:
+        if self.reader is not None:
+            return self.reader(self.gpio, length)
+        return bytes(length)
+
+    def _parse(self):
+        buf = self._pending
+        i = 0
+        n = len(buf)
+        while i < n:
+            cmd = buf[i]
+            if cmd in (0x80, 0x82):
+                if i + 3 > n:
+                    break
+                if cmd == 0x80:
+                    self.gpio_low, self.dir_low = buf[i + 1], buf[i + 2]
+                else:
+                    self.gpio_high, self.dir_high = buf[i + 1], buf[i + 2]
+                self.gpio_sets += 1
+                i += 3
+            elif cmd in (0x81, 0x83):
+                self._rx.append(self.gpio_low if cmd == 0x81 else self.gpio_high)
+                i += 1
+            elif cmd == 0x86:
+                if i + 3 > n:
+                    break
+                self.divisor = buf[i + 1] | (buf[i + 2] << 8)
+                i += 3
+            elif cmd in _TWO_ARG_COMMANDS:
+                if i + 3 > n:
+                    break
+                i += 3
+            elif cmd in _NO_ARG_COMMANDS:
+                if cmd == 0x8A:
+                    self.div5 = False
+                elif cmd == 0x8B:
+                    self.div5 = True
+                elif cmd == 0x84:
+                    self.loopback = True
+                elif cmd == 0x85:
+                    self.loopback = False
+                i += 1
+            elif not cmd & 0x80 and not cmd & 0x02:
+                # 字节时钟: bit4=输出, bit5=输入
+                if i + 3 > n:
+                    break
+                length = (buf[i + 1] | (buf[i + 2] << 8)) + 1
+                out = cmd & 0x10
+                if out and i + 3 + length > n:
+                    break
+                if out:
+                    data = bytes(buf[i + 3:i + 3 + length])
+                    self._output(data)
+                    i += 3 + length
+                else:
+                    self._clock(length * 8)
+                    i += 3
+                if cmd & 0x20:
+                    self._rx.extend(data if (out and self.loopback) else self._input(length))
+            elif not cmd & 0x80:
+                # 位时钟 (含 TMS): 长度字节 = 位数-1
+                if i + 2 > n:
+                    break
+                bits = buf[i + 1] + 1
+                out = cmd & 0x50
+                if out and i + 3 > n:
+                    break
+                self._clock(bits)
+                if cmd & 0x20:
+                    self._rx.append(buf[i + 2] if (out and self.loopback) else 0)
+                i += 3 if out else 2
+            else:
+                # 无效命令: 回应 0xFA + 命令
+                self._rx.extend((0xFA, cmd))
+                i += 1
+        del buf[:i]
+
+    def stats(self) -> Dict[str, float]:
+        """获取统计信息"""
+        return {
+            'writes': self.writes,
+            'bytes_written': self.bytes_written,
+            'bytes_clocked': self.bytes_clocked,
+            'gpio_sets': self.gpio_sets,
+            'clock_hz': self.clock_hz,
+            'bus_time_s': self.bus_time,
+        }
+
+
+class UC1638Model:
+    """
+    UC1638 GRAM 模型: 作为模拟器的 listener/reader，按 A0/CS 解码命令与数据，
+    维护页/列地址与窗口程序，记录写入的 GRAM，并在读数据命令后返回 GRAM 内容
+
+    用法:
+        emu = FTDIEmulator()
+        gram = UC1638Model(emu)
+        ...
+        gram.page(3)     # 第3页 (屏幕列 0~127)
+    """
+
+    PAGES = 16
+    COLUMNS = 240       # 控制器列地址范围
+    COL_OFFSET = 55     # 屏幕第0列对应的列地址
+    WIDTH = 128
+
+    CMD_WRITE_DATA = 0x01
+    CMD_READ_DATA = 0x03
+
+    def __init__(self, emulator: Optional[FTDIEmulator] = None, a0_pin: int = 8, cs_pin: int = 10,
+                 dummy_reads: int = 1, error_rate: float = 0.0, seed: int = 0,
+                 max_clock_hz: Optional[float] = None):
+        """
+        Args:
+            emulator: 要挂接的模拟器
+            a0_pin / cs_pin: A0 与 CS (低有效) 所在的 GPIO 位
+            dummy_reads: 读数据命令后先返回的无效字节数
+            error_rate: 写入 GRAM 时每字节出错 (随机翻转一位) 的概率，用于模拟高 SCLK 下的传输错误
+            seed: 出错位置的随机种子
+            max_clock_hz: 只在 SCLK 高于该频率时按 error_rate 出错 (None=任何频率)
+        """
+        self.gram = bytearray(self.PAGES * self.COLUMNS)
+        self.a0_mask = 1 << a0_pin
+        self.cs_mask = 1 << cs_pin
+        self.dummy_reads = dummy_reads
+        self.error_rate = error_rate
+        self.max_clock_hz = max_clock_hz
+        self.emulator = None
+        self._random = random.Random(seed)
+
+        self.column = 0
+        self.page_addr = 0
+        self.window = (0, 0, self.COLUMNS - 1, self.PAGES - 1)   # 起始列, 起始页, 结束列, 结束页
+        self._window_regs = list(self.window)
+        self._mode = None          # None / 'write' / 'read'
+        self._param = None         # 等待参数的命令
+        self._dummy = 0
+
+        # 统计
+        self.data_written = 0
+        self.data_read = 0
+        self.errors = 0
+
+        if emulator is not None:
+            self.attach(emulator)
+
+    def attach(self, emulator: FTDIEmulator):
+        self.emulator = emulator
+        emulator.listeners.append(self.on_output)
+        emulator.reader = self.on_input
+
+    def page(self, page: int) -> bytes:
+        """屏幕可见部分的一页 GRAM"""
+        base = page * self.COLUMNS + self.COL_OFFSET
+        return bytes(self.gram[base:base + self.WIDTH])
+
+    def _advance(self):
+        # 窗口内自动换行换页
+        col1, page1, col2, page2 = self.window
+        self.column += 1
+        if self.column > col2:
+            self.column = col1
+            self.page_addr = self.page_addr + 1 if self.page_addr < page2 else page1
+
+    def _command(self, byte: int):
+        if self._param is not None:
+            cmd, self._param = self._param, None
+            if cmd == 0x04:
+                self.column = byte
+            elif cmd in (0xf4, 0xf5, 0xf6, 0xf7):
+                self._window_regs[(0xf4, 0xf5, 0xf6, 0xf7).index(cmd)] = byte
+            return
+        self._mode = None
+        if byte in (0x04, 0xf4, 0xf5, 0xf6, 0xf7):
+            self._param = byte
+        elif byte & 0xF0 == 0x60:
+            self.page_addr = (self.page_addr & 0xF0) | (byte & 0x0F)
+        elif byte & 0xF0 == 0x70:
+            self.page_addr = ((byte & 0x0F) << 4) | (self.page_addr & 0x0F)
+        elif byte == 0xf9:
+            col1, page1, col2, page2 = self._window_regs
+            self.window = (col1, page1, col2, page2)
+        elif byte == self.CMD_WRITE_DATA:
+            self._mode = 'write'
+        elif byte == self.CMD_READ_DATA:
+            self._mode = 'read'
+            self._dummy = self.dummy_reads
+
+    def on_output(self, gpio: int, data: bytes):
+        if gpio & self.cs_mask:
+            return
+        if not gpio & self.a0_mask:
+            # 命令 (带参数的命令，其参数以 A0=1 发送，也可能与命令同为 A0=0)
+            for byte in data:
+                self._command(byte)
+            return
+        error_rate = self.error_rate
+        if error_rate and self.max_clock_hz is not None and self.emulator is not None:
+            if self.emulator.clock_hz <= self.max_clock_hz:
+                error_rate = 0.0
+        for byte in data:
+            if self._param is not None:
+                self._command(byte)
+            elif self._mode == 'write':
+                if error_rate and self._random.random() < error_rate:
+                    byte ^= 1 << self._random.randrange(8)
+                    self.errors += 1
+                self.gram[(self.page_addr % self.PAGES) * self.COLUMNS + self.column % self.COLUMNS] = byte
+                self.data_written += 1
+                self._advance()
+
+    def on_input(self, gpio: int, length: int) -> bytes:
+        if gpio & self.cs_mask or not gpio & self.a0_mask or self._mode != 'read':
+            return bytes(length)
+        out = bytearray()
+        for _ in range(length):
+            if self._dummy:
+                self._dummy -= 1
+                out.append(0)
+                continue
+            out.append(self.gram[(self.page_addr % self.PAGES) * self.COLUMNS + self.column % self.COLUMNS])
+            self.data_read += 1
+            self._advance()
+        return bytes(out)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'data_written': self.data_written,
+            'data_read': self.data_read,
+            'errors': self.errors,
+        }
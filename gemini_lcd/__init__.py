@@ -0,0 +1,48 @@
+"""
+PMDB LCD 驱动包
+子模块:
+- gemini_lcd.fonts:       LCD 字体数据 (LCDFonts)
+- gemini_lcd.transport:   FTDI SPI 接口 (FTD2XXSPIInterface)
+- gemini_lcd.bus:         多片选 SPI 总线 (SPIBus, BusDevice)
+- gemini_lcd.controllers: PMDB LCD 驱动 (PMDBLCD)
+- gemini_lcd.metrics:     周期性统计快照 (StatsReporter)
+- gemini_lcd.verify:      后台 GRAM 校验 (GramVerifier)
+- gemini_lcd.app:         演示程序 (python -m gemini_lcd)
+
+子模块按首次访问的名字延迟导入，FTD2XX.DLL / ftd2xx 在 connect() 时才加载，
+只需要字体或显示缓冲区的工具不必承担这些开销。
+
+注意: 默认从 C:\\Users\\sesa696240\\Desktop\\PMDB 加载 FTD2XX.DLL，
+可用环境变量 FTD2XX_DLL_DIR 覆盖。
+"""
+
+import importlib
+
+# 名字 -> 所在子模块
+_LAZY = {
+    'LCDFonts': 'fonts',
+    'FTD2XXSPIInterface': 'transport',
+    'FTDI_AVAILABLE': 'transport',
+    'SPIBus': 'bus',
+    'BusDevice': 'bus',
+    'PMDBLCD': 'controllers',
+    'StatsReporter': 'metrics',
+    'GramVerifier': 'verify',
+    'main': 'app',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{submodule}'), name)
+    if name != 'FTDI_AVAILABLE':
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,95 @@
+"""
+PMDB LCD 演示程序
+运行: python -m gemini_lcd
+"""
+
+from lcd_scheduler import FrameScheduler
+
+from .controllers import PMDBLCD
+from .transport import FTD2XXSPIInterface
+
+
+def main():
+    """主函数 - 演示LCD驱动使用"""
+    import msvcrt
+    
+    print("PMDB LCD驱动演示 (合并版)")
+    print("=" * 50)
+    
+    # 创建SPI接口
+    spi = FTD2XXSPIInterface(device_index=0, use_ctypes=True)
+    
+    try:
+        # 连接设备
+        if not spi.connect():
+            print("设备连接失败")
+            return
+        
+        spi.configure_spi(0, 500000)
+        # 创建LCD驱动实例
+        lcd = PMDBLCD(spi)
+        
+        # 初始化LCD
+        if not lcd.pmdb_init():
+            print("LCD初始化失败")
+            return
+        
+        print("LCD初始化成功")
+        
+        #return
+        # 清屏
+        lcd.clear_screen(0)
+        
+        # 画一些图形
+        lcd.lcd_draw_rectangle(0, 0, 127, 127, 1) 
+        #lcd.lcd_draw_rectangle(10, 10, 50, 50, 1)  # 画矩形
+        lcd.draw_circle(80, 40, 20, 1)             # 画圆
+        lcd.lcd_draw_line(0, 0, 127, 127, 1)       # 画对角线
+        
+        # 显示文字
+        lcd.lcd_show_string(10, 60, "Hello", 1, 0, 12, 1)
+        lcd.lcd_show_string(10, 80, "PMDB LCD", 1, 0, 12, 1)
+        lcd.lcd_show_int_num(10, 100, 12345, 5, 1, 0, 12)
+        #lcd.lcd_show_float_num(10, 120, 3.14159, 6, 1, 0, 16)
+        
+        # 显示中文字符（简化版）
+        #lcd.lcd_show_chinese(60, 60, "测试", 1, 0, 16, 0)
+        
+        # 刷新显示
+        lcd.lcd_flush()
+        
+        spi.LCD_Command(0xc9)
+        spi.LCD_Data(0xad)  
+        
+        print("\n按ESC键退出程序...")
+        
+        # 等待用户按ESC键退出
+        iloop=0
+        # 帧调度器: 每0.5秒一帧，只局部刷新闪烁的文字区域
+        scheduler = FrameScheduler(lcd, fps=2)
+        
+        # 注意：此处原逻辑为 while False, 已修改为 while True 以保证程序运行
+        while True:
+            if iloop==0:
+                lcd.lcd_show_string(10, 80, "PMDB LCD", 1, 0, 12, 1)
+                iloop=1
+            else:
+                lcd.lcd_show_string(10, 80, "PMDB LCD", 0, 1, 12, 1)
+                iloop=0
+            scheduler.mark_dirty(10, 80, 10 + 8 * 6 - 1, 80 + 12 - 1)
+            scheduler.tick()
+            
+            if msvcrt.kbhit():
+                key = msvcrt.getch()
+                if key == b'\x1b':  # ESC键
+                    print("\n用户按了ESC键退出")
+                    break
+        print(f"帧统计: {scheduler.stats()}")
+        print("LCD显示测试完成")
+    except Exception as e:
+        print(f"测试过程中出错: {str(e)}")
+    
+    finally:
+        # 断开连接
+        spi.disconnect()
+        print("设备已断开连接")
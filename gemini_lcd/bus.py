@@ -0,0 +1,261 @@
+"""
+多片选 SPI 总线 (SPIBus)
+多块小屏共用 SCLK/MOSI (AD0/AD1) 与 RESET，每块屏在空闲的 ADBUS/ACBUS 引脚上有自己的 CS，
+A0 默认共用 (只有被选中的屏锁存数据)，也可单独分配。
+
+SPIBus 自己生成 MPSSE 命令流: 每次传输只在片选/A0 状态改变时插入 GPIO 设置命令，
+然后直接接时钟输出命令，batch() 内多块屏的传输交错合并为一次 USB 写入。
+broadcast() 同时拉低多个 CS，相同内容一遍写入多块屏。
+
+BusDevice 提供与 FTD2XXSPIInterface 相同的 LCD_Command/LCD_Data/LCD_DataN/LCD_Reset/batch
+接口，可直接传给 PMDBLCD。
+
+引脚编号与 set_gpio_pin 一致: 0-7 = AD0-AD7, 8-15 = AC0-AC7。
+
+注意: CS 分配在 ADBUS (AD3-AD7) 时，FTD2XXSPIInterface.spi_write 会改写低8位，
+此时该接口上的所有传输都必须经过 SPIBus。
+
+用法:
+    bus = SPIBus(spi)
+    left = PMDBLCD(bus.add_device('left', cs=10))
+    right = PMDBLCD(bus.add_device('right', cs=11))
+    both = PMDBLCD(bus.broadcast(['left', 'right']))
+    both.pmdb_init()          # 两块屏同时初始化
+    with bus.batch():
+        left.lcd_flush()
+        right.lcd_flush()     # 两块屏的数据在一次USB写入内发出
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Union
+
+from .transport import FTD2XXSPIInterface
+
+# 一条 MPSSE 时钟输出命令最多 65536 字节
+_MAX_CLOCK_BYTES = 0x10000
+
+
+class BusDevice:
+    """总线上的一个设备 (或广播组)，接口与 FTD2XXSPIInterface 的 LCD_* 方法相同"""
+
+    def __init__(self, bus: 'SPIBus', name: str, cs_mask: int, a0_mask: int):
+        self.bus = bus
+        self.name = name
+        self.cs_mask = cs_mask
+        self.a0_mask = a0_mask
+
+    @property
+    def is_connected(self) -> bool:
+        return self.bus.spi.is_connected
+
+    def batch(self):
+        return self.bus.batch()
+
+    def LCD_Command(self, command: int) -> bool:
+        self.bus.transfer(self, False, [command])
+        return True
+
+    def LCD_Data(self, data: int) -> bool:
+        self.bus.transfer(self, True, [data])
+        return True
+
+    def LCD_DataN(self, data_list: List[int]) -> bool:
+        self.bus.transfer(self, True, data_list)
+        return True
+
+    def LCD_Reset(self) -> bool:
+        """复位 (RESET 共用，总线上所有屏同时复位)"""
+        return self.bus.reset()
+
+
+class SPIBus:
+    """共享 SCLK/MOSI 的多片选 SPI 总线"""
+
+    # 可分配为 CS/A0 的引脚 (AD0-AD2 为 SCLK/MOSI/MISO)
+    FREE_PINS = (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15)
+
+    def __init__(self, spi: FTD2XXSPIInterface, a0: Optional[int] = None, reset: Optional[int] = None):
+        """
+        Args:
+            spi: 已连接并配置的 FTDI SPI 接口
+            a0: 共用的 A0 引脚 (默认 spi.PIN_A0)
+            reset: 共用的 RESET 引脚 (默认 spi.PIN_RESET)
+        """
+        self.spi = spi
+        self.a0_pin = spi.PIN_A0 if a0 is None else a0
+        self.reset_pin = spi.PIN_RESET if reset is None else reset
+        self.devices: Dict[str, BusDevice] = {}
+        self._used = {self.a0_pin, self.reset_pin}
+
+        # 当前输出状态 (None = 未知，下次传输时重新输出)
+        self._state = None
+        self._depth = 0
+
+        # 统计
+        self.transfers = 0
+        self.bytes_sent = 0
+        self.gpio_commands = 0
+
+    # ------------------------------------------------------------------
+    # 引脚分配
+    # ------------------------------------------------------------------
+    def _allocate(self, pin: Optional[int]) -> int:
+        if pin is None:
+            free = [p for p in self.FREE_PINS if p not in self._used]
+            if not free:
+                raise Exception("没有空闲的GPIO引脚")
+            pin = free[0]
+        elif pin not in self.FREE_PINS:
+            raise ValueError(f"引脚不可用: {pin}")
+        elif pin in self._used:
+            raise ValueError(f"引脚已被占用: {pin}")
+        self._used.add(pin)
+        # 设为输出、CS 空闲为高电平
+        self.spi.set_gpio_pin(pin, True)
+        return pin
+
+    def add_device(self, name: str, cs: Optional[int] = None, a0: Optional[int] = None) -> BusDevice:
+        """
+        添加设备
+
+        Args:
+            name: 设备名称
+            cs: CS 引脚 (默认分配第一个空闲引脚)
+            a0: 单独的 A0 引脚 (默认使用共用 A0)
+
+        Returns:
+            BusDevice: 可传给 PMDBLCD 的设备接口
+        """
+        if name in self.devices:
+            raise Exception(f"设备名称重复: {name}")
+        cs_pin = self._allocate(cs)
+        a0_pin = self.a0_pin if a0 is None else self._allocate(a0)
+        device = BusDevice(self, name, 1 << cs_pin, 1 << a0_pin)
+        self.devices[name] = device
+        self._state = None
+        return device
+
+    def broadcast(self, devices: Iterable[Union[str, BusDevice]], name: Optional[str] = None) -> BusDevice:
+        """
+        广播组: 同时选中多个设备，写入的内容到达组内所有屏
+
+        Args:
+            devices: 设备名称或 BusDevice
+            name: 组名称 (不加入 devices)
+        """
+        members = [self.devices[d] if isinstance(d, str) else d for d in devices]
+        if not members:
+            raise Exception("广播组为空")
+        cs_mask = a0_mask = 0
+        for member in members:
+            cs_mask |= member.cs_mask
+            a0_mask |= member.a0_mask
+        return BusDevice(self, name or '+'.join(m.name for m in members), cs_mask, a0_mask)
+
+    def _cs_all(self) -> int:
+        mask = 0
+        for device in self.devices.values():
+            mask |= device.cs_mask
+        return mask
+
+    # ------------------------------------------------------------------
+    # 命令流
+    # ------------------------------------------------------------------
+    @contextmanager
+    def batch(self):
+        """with块内所有设备的传输合并为一次USB写入 (可嵌套)，退出时释放所有CS"""
+        self._depth += 1
+        try:
+            with self.spi.batch():
+                yield self
+                if self._depth == 1:
+                    self._deselect()
+        finally:
+            self._depth -= 1
+
+    def _gpio(self, value: int) -> List[int]:
+        """输出16位GPIO状态 (SCLK 保持空闲电平，MOSI 为低)"""
+        spi = self.spi
+        cpol, cpha = spi._get_spi_config()
+        sclk = 0x00 if cpol == cpha else 0x01
+        low = (value & 0xF8) | sclk
+        high = (value >> 8) & 0xFF
+        spi.gpio_value_low = low
+        spi.gpio_value_high = high
+        self._state = value
+        self.gpio_commands += 1
+        spi.gpio_updates += 1
+        return [
+            spi.CMD_SET_DATA_BITS_LOW, low, spi.gpio_direction_low,
+            spi.CMD_SET_DATA_BITS_HIGH, high, spi.gpio_direction_high,
+        ]
+
+    def _idle_value(self) -> int:
+        """全部 CS 释放时的GPIO状态 (保留 RESET 等其他引脚当前电平)"""
+        spi = self.spi
+        return (spi.gpio_value_low | (spi.gpio_value_high << 8) | self._cs_all())
+
+    def _deselect(self):
+        idle = self._idle_value()
+        if self._state != idle:
+            self.spi._write_data(self._gpio(idle))
+
+    def transfer(self, device: BusDevice, a0: bool, data: List[int]):
+        """
+        向设备 (或广播组) 发送一次传输
+
+        Args:
+            device: 目标设备
+            a0: A0 电平 (False=命令, True=数据)
+            data: 数据
+        """
+        spi = self.spi
+        if not spi.is_connected:
+            raise Exception("设备未连接")
+        if not data:
+            return
+
+        value = self._idle_value() & ~device.cs_mask
+        value = (value | device.a0_mask) if a0 else (value & ~device.a0_mask)
+
+        cpol, cpha = spi._get_spi_config()
+        clock_cmd = spi.CMD_CLOCK_FALL_OUT_BYTES if cpol == cpha else spi.CMD_CLOCK_RISE_OUT_BYTES
+
+        commands = bytearray()
+        if self._state != value:
+            commands += bytes(self._gpio(value))
+        for start in range(0, len(data), _MAX_CLOCK_BYTES):
+            chunk = data[start:start + _MAX_CLOCK_BYTES]
+            length = len(chunk) - 1
+            commands += bytes((clock_cmd, length & 0xFF, (length >> 8) & 0xFF))
+            commands += bytes(chunk)
+        if self._depth == 0:
+            # 不在批量中: 传输结束立即释放 CS
+            idle = self._idle_value()
+            commands += bytes(self._gpio(idle))
+
+        spi._write_data(commands)
+        spi.payload_bytes += len(data)
+        self.transfers += 1
+        self.bytes_sent += len(data)
+
+    def reset(self) -> bool:
+        """拉低共用 RESET，复位总线上的所有屏"""
+        self._state = None
+        spi = self.spi
+        spi.set_gpio_pin(self.reset_pin, False)
+        self._deselect()
+        spi._sleep(0.02)
+        spi.set_gpio_pin(self.reset_pin, True)
+        self._deselect()
+        spi._sleep(0.02)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """获取统计信息"""
+        return {
+            'devices': len(self.devices),
+            'transfers': self.transfers,
+            'bytes_sent': self.bytes_sent,
+            'gpio_commands': self.gpio_commands,
+        }
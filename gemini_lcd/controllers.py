@@ -0,0 +1,1183 @@
+"""
+PMDB LCD 驱动 (PMDB_LCD)
+UC1638 控制器，128x128，页格式显示缓冲区。
+"""
+
+import functools
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lcd_image import image_to_bits, blit_bits_to_buffer, glyph_columns, blit_strip_to_buffer, render_strip
+from lcd_log import get_logger
+from lcd_text_cache import TextCache
+
+from .fonts import LCDFonts
+from .transport import FTD2XXSPIInterface
+
+log = get_logger(__name__)
+
+
+def _timed_render(fn):
+    """绘图方法计时 (计入 render_time)，嵌套调用只统计最外层"""
+    @functools.wraps(fn)
+    def timed(self, *args, **kwargs):
+        if self._render_depth:
+            return fn(self, *args, **kwargs)
+        self._render_depth = 1
+        start = time.perf_counter()
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            self._render_depth = 0
+            self.render_time += time.perf_counter() - start
+            self.render_calls += 1
+    return timed
+
+
+class PMDBLCD:
+    """PMDB LCD驱动类"""
+    
+    # 显示参数
+    PMDB_PAGES_16 = 16
+    PMDB_COLS = 128
+    PMDB_ROWS = 128  # 16页 * 8行 = 128行
+    COL_OFFSET = 55  # 屏幕第0列对应的控制器列地址
+    
+    # GRAM 读回 (verify_gram)
+    GRAM_READ_CMD = 0x03    # 读数据命令 (与写数据命令 0x01 对应)
+    GRAM_READ_DUMMY = 1     # 读数据命令后的无效字节数
+    
+    def __init__(self, spi_interface: FTD2XXSPIInterface):
+        """
+        初始化LCD驱动
+        
+        Args:
+            spi_interface: FTDI SPI接口实例
+        """
+        self.spi = spi_interface
+        self.contrast = 170
+        self.display_buffer = bytearray(self.PMDB_PAGES_16 * self.PMDB_COLS)
+        # 硬件滚动起始行 (0x40/0x50)。display_buffer按GRAM行序存放(环形缓冲),
+        # 逻辑行y对应GRAM行 (y + scroll_line) % PMDB_ROWS
+        self.scroll_line = 0
+        # 整串文字的页格式条带缓存 (lcd_show_string 命中时按页切片写入)
+        self.text_cache = TextCache()
+        
+        # 刷新与 GRAM 校验互斥 (GramVerifier 在后台线程中校验)
+        self.lock = threading.RLock()
+        # 最近写入 GRAM 的内容 (刷新时在 lock 内记录)，GRAM 校验与之比较，
+        # 而不是与可能还有未刷新绘图的 display_buffer 比较。
+        # 只有整页写入过的页才有完整记录 (初始化后 GRAM 内容未知)
+        self.gram_shadow = bytearray(len(self.display_buffer))
+        self._shadow_valid = [False] * self.PMDB_PAGES_16
+        
+        # 统计 (stats())
+        self._render_depth = 0
+        self.reset_stats()
+        
+    
+    
+    def init_controller_pmdb_uc1638(self) -> bool:
+        """
+        初始化UC1638控制器
+        
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            with self.lock:
+                # 系统复位 (GRAM 内容随之未知)
+                self._shadow_valid = [False] * self.PMDB_PAGES_16
+                self.spi.LCD_Command(0xe1)
+                self.spi.LCD_Data(0xe2)
+                time.sleep(0.002)
+                
+                # 设置显示模式
+                self.spi.LCD_Command(0xa4)  # 设置所有像素开启
+                self.spi.LCD_Command(0xa6)  # 正常显示模式
+                
+                # MTP控制
+                self.spi.LCD_Command(0xb8)
+                self.spi.LCD_Data(0x00)
+                
+                # 内部VLCD设置
+                self.spi.LCD_Command(0x2d)  # 设置泵控制
+                self.spi.LCD_Command(0x20)  # 设置温度补偿
+                self.spi.LCD_Command(0xea)  # 设置偏置
+                
+                # 设置对比度
+                self.spi.LCD_Command(0x81)  # 设置PM
+                self.spi.LCD_Data(self.contrast)  # 对比度值
+                
+                # 设置帧率
+                self.spi.LCD_Command(0xa3)  # 设置帧率
+                
+                # N_LINE反转
+                self.spi.LCD_Command(0xc8)
+                self.spi.LCD_Data(0x2F)
+                
+                # 设置RAM地址控制
+                self.spi.LCD_Command(0x89)  # CA/PA地址控制
+                self.spi.LCD_Command(0x95)  # 设置显示模式
+                
+                # 设置COM1
+                self.spi.LCD_Command(0x84)
+                
+                # 设置COM结束
+                self.spi.LCD_Command(0xf1)
+                self.spi.LCD_Data(127)  # COM结束地址
+                
+                # LCD映射控制
+                self.spi.LCD_Command(0xC4)  # My=0, Mx=1
+                
+                # 设置COM扫描功能
+                self.spi.LCD_Command(0x86)  # 隔行扫描
+                
+                # 滚动行设置
+                self.spi.LCD_Command(0x40)  # 无滚动
+                self.spi.LCD_Command(0x50)
+                self.scroll_line = 0
+                
+                # 设置列地址
+                self.spi.LCD_Command(0x04)
+                self.spi.LCD_Data(55)  # 起始列地址
+                
+                # 设置页地址
+                self.spi.LCD_Command(0x60 | 0)  # 页地址LSB
+                self.spi.LCD_Command(0x70)      # 页地址MSB
+                
+                # 设置窗口程序
+                self.spi.LCD_Command(0xf4)  # 窗口起始列
+                self.spi.LCD_Data(55)
+                self.spi.LCD_Command(0xf6)  # 窗口结束列
+                self.spi.LCD_Data(182)
+                self.spi.LCD_Command(0xf5)  # 窗口起始页
+                self.spi.LCD_Data(0)
+                self.spi.LCD_Command(0xf7)  # 窗口结束页
+                self.spi.LCD_Data(15)
+                self.spi.LCD_Command(0xf9)  # 窗口程序使能
+                
+                # 设置显示模式
+                self.spi.LCD_Command(0xc9)
+                self.spi.LCD_Data(0xad)  # 黑白模式
+                
+                return True
+            
+        except Exception as e:
+            log.error("UC1638初始化失败: %s", e)
+            return False
+    
+    def pmdb_init(self) -> bool:
+        """
+        初始化PMDB LCD
+        
+        Returns:
+            bool: 初始化是否成功
+        """
+        try:
+            with self.lock:
+                # LCD复位
+                #self.lcd_reset()
+                self.spi.LCD_Reset()
+                # 初始化控制器
+                return self.init_controller_pmdb_uc1638()
+            
+        except Exception as e:
+            log.error("PMDB初始化失败: %s", e)
+            return False
+
+    def recover(self, reflush: bool = True) -> bool:
+        """
+        通信出错后恢复: 先尝试快速重连 (spi.quick_connect())，面板仍保持初始化状态时
+        跳过复位与初始化，只重写显示缓冲区 (断开时可能有刷新被打断)；否则完整初始化并刷新
+
+        Args:
+            reflush: 快速重连成功时是否重写整屏
+
+        Returns:
+            bool: 恢复是否成功
+        """
+        try:
+            with self.lock:
+                if not self.spi.quick_connect():
+                    return False
+                if self.spi.resumed:
+                    return self.lcd_flush() if reflush else True
+                return self.pmdb_init() and self.lcd_flush()
+        except Exception as e:
+            log.error("LCD恢复失败: %s", e)
+            return False
+
+    def lcd_flush(self) -> bool:
+        """
+        刷新显示缓冲区到LCD
+        
+        Returns:
+            bool: 操作是否成功
+        """
+        return self.lcd_flush_pages(range(self.PMDB_PAGES_16))
+    
+    def lcd_flush_pages(self, pages) -> bool:
+        """
+        只刷新指定的GRAM页
+        
+        Args:
+            pages: GRAM页号序列 (0-15)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        pages = list(pages)
+        try:
+            start = time.perf_counter()
+            
+            with self.lock, self.spi.batch():
+                buffer = self.display_buffer
+                shadow = self.gram_shadow
+                for page in pages:
+                    base = page * self.PMDB_COLS
+                    shadow[base:base + self.PMDB_COLS] = buffer[base:base + self.PMDB_COLS]
+                    self._shadow_valid[page] = True
+                self._write_pages(pages, shadow)
+            
+            self.flushes += 1
+            self.flush_time += time.perf_counter() - start
+            return True
+            
+        except Exception as e:
+            log.error("LCD刷新失败: %s", e)
+            return False
+    
+    def _write_pages(self, pages, source):
+        """把 source (页格式，与显示缓冲区同布局) 中的整页写入 GRAM"""
+        for page in pages:
+            # 设置页地址
+            self.spi.LCD_Command(0x60 | (page & 0x0F))  # 页地址LSB
+            self.spi.LCD_Command(0x70 | (page >> 4))    # 页地址MSB
+            
+            # 设置列地址
+            self.spi.LCD_Command(0x04)
+            self.spi.LCD_Data(self.COL_OFFSET)  # 起始列地址
+            
+            # 发送数据
+            self.spi.LCD_Command(0x01)
+            page_data = source[page * self.PMDB_COLS:(page + 1) * self.PMDB_COLS]
+            self.spi.LCD_DataN(page_data)
+            self.flushed_bytes += len(page_data)
+    
+    def _set_window(self, col1: int, page1: int, col2: int, page2: int):
+        """设置窗口程序寄存器 (列为屏幕列坐标，内部加COL_OFFSET)"""
+        self.spi.LCD_Command(0xf4)  # 窗口起始列
+        self.spi.LCD_Data(self.COL_OFFSET + col1)
+        self.spi.LCD_Command(0xf6)  # 窗口结束列
+        self.spi.LCD_Data(self.COL_OFFSET + col2)
+        self.spi.LCD_Command(0xf5)  # 窗口起始页
+        self.spi.LCD_Data(page1)
+        self.spi.LCD_Command(0xf7)  # 窗口结束页
+        self.spi.LCD_Data(page2)
+        self.spi.LCD_Command(0xf9)  # 窗口程序使能
+    
+    def _write_window(self, x1: int, page1: int, x2: int, page2: int):
+        """把窗口重设为给定页对齐区域，并以一次数据突发写入该区域"""
+        self._set_window(x1, page1, x2, page2)
+        
+        # 地址指针指向窗口起点，写满一行后控制器在窗口内自动换页
+        self.spi.LCD_Command(0x60 | (page1 & 0x0F))  # 页地址LSB
+        self.spi.LCD_Command(0x70 | (page1 >> 4))    # 页地址MSB
+        self.spi.LCD_Command(0x04)
+        self.spi.LCD_Data(self.COL_OFFSET + x1)
+        
+        buffer = self.display_buffer
+        shadow = self.gram_shadow
+        region = bytearray()
+        for page in range(page1, page2 + 1):
+            base = page * self.PMDB_COLS
+            data = buffer[base + x1:base + x2 + 1]
+            shadow[base + x1:base + x2 + 1] = data
+            region += data
+        
+        self.spi.LCD_Command(0x01)
+        self.spi.LCD_DataN(region)
+        self.flushed_bytes += len(region)
+    
+    def flush_rect(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """
+        局部刷新: 把窗口程序寄存器重设为脏区域的页对齐包围盒，
+        以一次数据突发写入该区域，然后恢复全屏窗口，全部在一次USB写入内完成
+        
+        Args:
+            x1, y1: 起始坐标 (逻辑坐标，已考虑滚动偏移)
+            x2, y2: 结束坐标
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        x1 = max(0, x1)
+        y1 = max(0, y1)
+        x2 = min(self.PMDB_COLS - 1, x2)
+        y2 = min(self.PMDB_ROWS - 1, y2)
+        if x1 > x2 or y1 > y2:
+            return True
+        
+        try:
+            ram_y1 = (y1 + self.scroll_line) % self.PMDB_ROWS
+            ram_y2 = (y2 + self.scroll_line) % self.PMDB_ROWS
+            start = time.perf_counter()
+            
+            with self.lock, self.spi.batch():
+                if ram_y1 <= ram_y2:
+                    self._write_window(x1, ram_y1 >> 3, x2, ram_y2 >> 3)
+                else:
+                    # 跨越环形缓冲末尾: 拆成两个窗口
+                    self._write_window(x1, ram_y1 >> 3, x2, self.PMDB_PAGES_16 - 1)
+                    self._write_window(x1, 0, x2, ram_y2 >> 3)
+                
+                # 恢复全屏窗口
+                self._set_window(0, 0, self.PMDB_COLS - 1, self.PMDB_PAGES_16 - 1)
+            
+            self.flushes += 1
+            self.flush_time += time.perf_counter() - start
+            return True
+            
+        except Exception as e:
+            log.error("局部刷新失败: %s", e)
+            return False
+    
+    def lcd_flush_rows(self, y1: int, y2: int) -> bool:
+        """
+        只刷新覆盖逻辑行y1~y2的GRAM页 (已考虑滚动偏移)
+        
+        Args:
+            y1, y2: 起始/结束逻辑行
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        y1 = max(0, y1)
+        y2 = min(self.PMDB_ROWS - 1, y2)
+        if y1 > y2:
+            return True
+        
+        pages = []
+        for y in range(y1, y2 + 1):
+            page = ((y + self.scroll_line) % self.PMDB_ROWS) >> 3
+            if page not in pages:
+                pages.append(page)
+        return self.lcd_flush_pages(pages)
+    
+    def read_gram_pages(self, pages: Iterable[int]) -> Dict[int, bytes]:
+        """
+        读回控制器 GRAM 的整页数据 (全部页在一次USB往返内完成)
+        
+        Args:
+            pages: GRAM页号序列 (0-15)
+            
+        Returns:
+            Dict[int, bytes]: 页号 -> 该页 PMDB_COLS 字节
+        """
+        spi = self.spi
+        if not hasattr(spi, 'read_batch'):
+            raise Exception(f"接口 {type(spi).__name__} 不支持批量读")
+        
+        results = {}
+        with self.lock, spi.read_batch() as reads:
+            for page in pages:
+                spi.LCD_Command(0x60 | (page & 0x0F))  # 页地址LSB
+                spi.LCD_Command(0x70 | (page >> 4))    # 页地址MSB
+                spi.LCD_Command(0x04)
+                spi.LCD_Data(self.COL_OFFSET)
+                spi.LCD_Command(self.GRAM_READ_CMD)
+                results[page] = reads.receive_data(self.GRAM_READ_DUMMY + self.PMDB_COLS)
+        return {page: bytes(result.result()[self.GRAM_READ_DUMMY:]) for page, result in results.items()}
+    
+    def verify_gram(self, pages: Optional[Iterable[int]] = None, repair: bool = True) -> Optional[List[int]]:
+        """
+        读回 GRAM，按页与最近一次写入的内容 (gram_shadow) 比较 CRC，重写不一致的页
+        
+        比较对象是已刷新的内容而不是 display_buffer，尚未刷新的绘图不会被当成传输错误，
+        重写时也只写回原来刷新的内容，不会越过帧调度提前推送绘制到一半的页。
+        初始化后还没有整页刷新过的页内容未知，跳过不校验。
+        
+        Args:
+            pages: 要校验的GRAM页 (默认全部)
+            repair: 是否重写不一致的页
+            
+        Returns:
+            Optional[List[int]]: 不一致的页号，失败时为None
+        """
+        pages = list(range(self.PMDB_PAGES_16)) if pages is None else list(pages)
+        try:
+            with self.lock:
+                pages = [page for page in pages if self._shadow_valid[page]]
+                if not pages:
+                    return []
+                readback = self.read_gram_pages(pages)
+                shadow = self.gram_shadow
+                mismatched = [
+                    page for page in pages
+                    if zlib.crc32(readback[page]) != zlib.crc32(shadow[page * self.PMDB_COLS:(page + 1) * self.PMDB_COLS])
+                ]
+                self.verify_runs += 1
+                self.verified_pages += len(pages)
+                self.mismatched_pages += len(mismatched)
+                if mismatched:
+                    log.warning("GRAM校验不一致的页: %s", mismatched)
+                    if repair:
+                        with self.spi.batch():
+                            self._write_pages(mismatched, shadow)
+                        self.repaired_pages += len(mismatched)
+            return mismatched
+        except Exception as e:
+            log.error("GRAM校验失败: %s", e)
+            return None
+    
+    def set_scroll_line(self, line: int) -> bool:
+        """
+        设置硬件滚动起始行 (GRAM第line行显示在屏幕顶部)
+        
+        Args:
+            line: 滚动行 (0-127)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            with self.lock:
+                self.scroll_line = line % self.PMDB_ROWS
+                self.spi.LCD_Command(0x40 | (self.scroll_line & 0x0F))  # 滚动行LSB
+                self.spi.LCD_Command(0x50 | (self.scroll_line >> 4))    # 滚动行MSB
+                return True
+        except Exception as e:
+            log.error("设置滚动行失败: %s", e)
+            return False
+    
+    def lcd_scroll(self, lines: int, color: int = 0, flush: bool = True) -> bool:
+        """
+        硬件滚动: 只修改控制器起始行，并只重写新露出的行所在的GRAM页
+        
+        一行滚动只需2条滚动命令 + 1页(128字节)数据，而不是整帧2KB。
+        
+        Args:
+            lines: 滚动行数 (正数=内容上移、底部露出新行; 负数=内容下移、顶部露出新行)
+            color: 新露出行的填充颜色
+            flush: 是否立即刷新新露出的行 (先绘制新内容再调用lcd_flush_rows可省去一次传输)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        lines = max(-self.PMDB_ROWS, min(self.PMDB_ROWS, lines))
+        if lines == 0:
+            return True
+        
+        # 滚动命令与新露出行的刷新之间不插入其他线程的命令
+        with self.lock:
+            if not self.set_scroll_line(self.scroll_line + lines):
+                return False
+            
+            # 新露出的逻辑行
+            if lines > 0:
+                y1, y2 = self.PMDB_ROWS - lines, self.PMDB_ROWS - 1
+            else:
+                y1, y2 = 0, -lines - 1
+            self.lcd_fill(0, y1, self.PMDB_COLS - 1, y2, color)
+            
+            if flush:
+                return self.lcd_flush_rows(y1, y2)
+            return True
+    
+    @_timed_render
+    def lcd_fill(self, x1: int, y1: int, x2: int, y2: int, color: int) -> bool:
+        """
+        填充指定区域
+        
+        Args:
+            x1, y1: 起始坐标
+            x2, y2: 结束坐标
+            color: 颜色 (0或1)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 边界检查
+            if x1 > self.PMDB_COLS - 1:
+                x1 = self.PMDB_COLS - 1
+            if x2 > self.PMDB_COLS - 1:
+                x2 = self.PMDB_COLS - 1
+            if y1 > (self.PMDB_PAGES_16 << 3) - 1:
+                y1 = (self.PMDB_PAGES_16 << 3) - 1
+            if y2 > (self.PMDB_PAGES_16 << 3) - 1:
+                y2 = (self.PMDB_PAGES_16 << 3) - 1
+            
+            if self.scroll_line:
+                # 逻辑行映射到GRAM行，跨越环形缓冲末尾时拆成两段
+                ram_y1 = (y1 + self.scroll_line) % self.PMDB_ROWS
+                ram_y2 = (y2 + self.scroll_line) % self.PMDB_ROWS
+                if ram_y1 <= ram_y2:
+                    self._fill_ram(x1, ram_y1, x2, ram_y2, color)
+                else:
+                    self._fill_ram(x1, ram_y1, x2, self.PMDB_ROWS - 1, color)
+                    self._fill_ram(x1, 0, x2, ram_y2, color)
+            else:
+                self._fill_ram(x1, y1, x2, y2, color)
+            
+            return True
+            
+        except Exception as e:
+            log.error("填充区域失败: %s", e)
+            return False
+    
+    def _fill_ram(self, x1: int, y1: int, x2: int, y2: int, color: int):
+        """按GRAM行坐标填充 (不考虑滚动偏移)"""
+        color = color & 1
+        
+        page1 = y1 >> 3
+        page2 = y2 >> 3
+        row1 = y1 & 0x7
+        row2 = y2 & 0x7
+        
+        for page in range(page1, page2 + 1):
+            row_start = 0
+            row_end = 7
+            
+            if page == page1:
+                row_start = row1
+            if page == page2:
+                row_end = row2
+            
+            for col in range(x1, x2 + 1):
+                data = self.display_buffer[page * self.PMDB_COLS + col]
+                for row in range(row_start, row_end + 1):
+                    color_mask = 0x1 << row
+                    data = (data & ~color_mask) | (color << row)
+                self.display_buffer[page * self.PMDB_COLS + col] = data
+    
+    def lcd_draw_point(self, x: int, y: int, color: int) -> bool:
+        """
+        画点
+        
+        Args:
+            x, y: 坐标
+            color: 颜色 (0或1)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 边界检查
+            if x > self.PMDB_COLS - 1:
+                x = self.PMDB_COLS - 1
+            if y > self.PMDB_ROWS - 1:
+                y = self.PMDB_ROWS - 1
+            
+            color = color & 1
+            
+            if self.scroll_line:
+                y = (y + self.scroll_line) % self.PMDB_ROWS
+            
+            page = y >> 3
+            row = y & 0x7
+            
+            data = self.display_buffer[page * self.PMDB_COLS + x]
+            color_mask = 0x1 << row
+            data = (data & ~color_mask) | (color << row)
+            self.display_buffer[page * self.PMDB_COLS + x] = data
+            
+            return True
+            
+        except Exception as e:
+            log.error("画点失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_draw_line(self, x1: int, y1: int, x2: int, y2: int, color: int) -> bool:
+        """
+        画线
+        
+        Args:
+            x1, y1: 起始坐标
+            x2, y2: 结束坐标
+            color: 颜色 (0或1)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            delta_x = x2 - x1
+            delta_y = y2 - y1
+            u_row = x1
+            u_col = y1
+            
+            # 确定增量方向
+            if delta_x > 0:
+                incx = 1
+            elif delta_x == 0:
+                incx = 0
+            else:
+                incx = -1
+                delta_x = -delta_x
+            
+            if delta_y > 0:
+                incy = 1
+            elif delta_y == 0:
+                incy = 0
+            else:
+                incy = -1
+                delta_y = -delta_y
+            
+            # 选择最大距离
+            if delta_x > delta_y:
+                distance = delta_x
+            else:
+                distance = delta_y
+            
+            xerr = 0
+            yerr = 0
+            
+            for t in range(distance + 1):
+                self.lcd_draw_point(u_row, u_col, color)
+                xerr += delta_x
+                yerr += delta_y
+                
+                if xerr > distance:
+                    xerr -= distance
+                    u_row += incx
+                
+                if yerr > distance:
+                    yerr -= distance
+                    u_col += incy
+            
+            return True
+            
+        except Exception as e:
+            log.error("画线失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_draw_rectangle(self, x1: int, y1: int, x2: int, y2: int, color: int) -> bool:
+        """
+        画矩形
+        
+        Args:
+            x1, y1: 起始坐标
+            x2, y2: 结束坐标
+            color: 颜色 (0或1)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 画四条边
+            self.lcd_draw_line(x1, y1, x2, y1, color)  # 上边
+            self.lcd_draw_line(x1, y1, x1, y2, color)  # 左边
+            self.lcd_draw_line(x1, y2, x2, y2, color)  # 下边
+            self.lcd_draw_line(x2, y1, x2, y2, color)  # 右边
+            
+            return True
+            
+        except Exception as e:
+            log.error("画矩形失败: %s", e)
+            return False
+    
+    @_timed_render
+    def draw_circle(self, x0: int, y0: int, r: int, color: int) -> bool:
+        """
+        画圆
+        
+        Args:
+            x0, y0: 圆心坐标
+            r: 半径
+            color: 颜色 (0或1)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            a = 0
+            b = r
+            
+            while a <= b:
+                # 画8个对称点
+                self.lcd_draw_point(x0 - b, y0 - a, color)
+                self.lcd_draw_point(x0 + b, y0 - a, color)
+                self.lcd_draw_point(x0 - a, y0 + b, color)
+                self.lcd_draw_point(x0 - a, y0 - b, color)
+                self.lcd_draw_point(x0 + b, y0 + a, color)
+                self.lcd_draw_point(x0 + a, y0 - b, color)
+                self.lcd_draw_point(x0 + a, y0 + b, color)
+                self.lcd_draw_point(x0 - b, y0 + a, color)
+                
+                a += 1
+                if (a * a + b * b) > (r * r):
+                    b -= 1
+            
+            return True
+            
+        except Exception as e:
+            log.error("画圆失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_show_char(self, x: int, y: int, char: str, fc: int, bc: int, size: int, mode: int = 0) -> bool:
+        """
+        显示字符
+        
+        Args:
+            x, y: 显示位置
+            char: 要显示的字符
+            fc: 前景色
+            bc: 背景色
+            size: 字体大小
+            mode: 显示模式 (0=叠加模式, 1=覆盖模式)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            char_code = ord(char) - ord(' ')
+            size_x = size // 2
+            
+            # 根据字体大小选择对应的字体数据
+            if size == 12:
+                # 6x12字体
+                font_data = LCDFonts.get_ascii_1206_font(char_code)
+                font_width = 6
+                font_height = 12
+            elif size == 16:
+                # 8x16字体
+                font_data = LCDFonts.get_ascii_1608_font(char_code)
+                font_width = 8
+                font_height = 16
+            elif size == 24:
+                # 12x24字体
+                font_data = LCDFonts.get_ascii_2412_font(char_code)
+                font_width = 12
+                font_height = 24
+            elif size == 32:
+                # 16x32字体
+                font_data = LCDFonts.get_ascii_3216_font(char_code)
+                font_width = 16
+                font_height = 32
+            else:
+                log.warning("不支持的字体大小: %s", size)
+                return False
+            
+            # 绘制字符
+            for i in range(font_height):
+                if i < len(font_data):
+                    for j in range(font_width):
+                        if font_data[i] & (0x01 << j):
+                            self.lcd_draw_point(x + j, y + i, fc)
+                        elif not mode:  # 叠加模式
+                            self.lcd_draw_point(x + j, y + i, bc)
+            
+            return True
+            
+        except Exception as e:
+            log.error("显示字符失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_show_string(self, x: int, y: int, text: str, fc: int, bc: int, size: int, mode: int = 0) -> bool:
+        """
+        显示字符串
+        
+        Args:
+            x, y: 显示位置
+            text: 要显示的字符串
+            fc: 前景色
+            bc: 背景色
+            size: 字体大小
+            mode: 显示模式
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            if self.text_cache is not None and self.text_cache.draw(self, x, y, text, fc, bc, size, mode):
+                return True
+            
+            for char in text:
+                self.lcd_show_char(x, y, char, fc, bc, size, mode)
+                x += size // 2
+            
+            return True
+            
+        except Exception as e:
+            log.error("显示字符串失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_show_int_num(self, x: int, y: int, num: int, length: int, fc: int, bc: int, size: int) -> bool:
+        """
+        显示整数
+        
+        Args:
+            x, y: 显示位置
+            num: 要显示的数字
+            length: 显示位数
+            fc: 前景色
+            bc: 背景色
+            size: 字体大小
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            size_x = size // 2
+            enshow = 0
+            
+            for t in range(length):
+                temp = (num // (10 ** (length - t - 1))) % 10
+                
+                if enshow == 0 and t < (length - 1):
+                    if temp == 0:
+                        self.lcd_show_char(x + t * size_x, y, ' ', fc, bc, size, 0)
+                        continue
+                    else:
+                        enshow = 1
+                
+                self.lcd_show_char(x + t * size_x, y, chr(temp + 48), fc, bc, size, 0)
+            
+            return True
+            
+        except Exception as e:
+            log.error("显示整数失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_show_float_num(self, x: int, y: int, num: float, length: int, fc: int, bc: int, size: int) -> bool:
+        """
+        显示浮点数
+        
+        Args:
+            x, y: 显示位置
+            num: 要显示的数字
+            length: 显示位数
+            fc: 前景色
+            bc: 背景色
+            size: 字体大小
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            size_x = size // 2
+            num *= 10
+            num_int = int(num)
+            
+            for t in range(length):
+                temp = (num_int // (10 ** (length - t - 1))) % 10
+                
+                if t == (length - 1):
+                    self.lcd_show_char(x + (length - 1) * size_x, y, '.', fc, bc, size, 0)
+                    t += 1
+                    length += 1
+                
+                self.lcd_show_char(x + t * size_x, y, chr(temp + 48), fc, bc, size, 0)
+            
+            return True
+            
+        except Exception as e:
+            log.error("显示浮点数失败: %s", e)
+            return False
+    
+    def get_char_columns(self, char: str, size: int) -> Optional[Tuple[List[int], int, int]]:
+        """
+        获取字符的按列位掩码 (用于预渲染字形条带)
+        
+        Args:
+            char: 字符
+            size: 字体大小 (12/16/24/32)
+            
+        Returns:
+            (columns, 宽, 高)，不支持的字体大小返回None
+        """
+        char_code = ord(char) - ord(' ')
+        if size == 12:
+            return glyph_columns(LCDFonts.get_ascii_1206_font(char_code), 6), 6, 12
+        # 16/24/32 号字体的图集本身就是按列存放，无需转置 (图集在首次使用时才导入)
+        from LCD_FONTS import atlas_columns
+        columns = atlas_columns(size, char_code)
+        if columns is None:
+            return None
+        return list(columns), len(columns), size
+    
+    def strip_shift(self, y: int) -> int:
+        """逻辑行 y 在显存页内的行偏移 (考虑硬件滚动)"""
+        return ((y + self.scroll_line) % self.PMDB_ROWS) & 0x7
+    
+    @_timed_render
+    def blit_strip(self, strip, x: int, y: int) -> bool:
+        """
+        将预渲染的页格式条带 (lcd_image.PageStrip) 整页写入显示缓冲区
+        
+        Args:
+            strip: 按 strip_shift(y) 渲染的条带
+            x, y: 左上角逻辑坐标 (横向越界自动裁剪，纵向须完全在屏内)
+            
+        Returns:
+            bool: 是否写入 (行偏移不符或纵向越界时返回False，由调用方退回逐点绘制)
+        """
+        if y < 0 or y + strip.height > self.PMDB_ROWS or strip.shift != self.strip_shift(y):
+            return False
+        ram_y = (y + self.scroll_line) % self.PMDB_ROWS
+        blit_strip_to_buffer(self.display_buffer, self.PMDB_COLS, strip, x, ram_y >> 3,
+                             self.PMDB_PAGES_16, wrap=True)
+        return True
+    
+    @_timed_render
+    def blit_image(self, img, x: int = 0, y: int = 0, invert: bool = False) -> bool:
+        """
+        将1bit图像整体写入显示缓冲区 (向量化打包，替代逐点lcd_draw_point)
+        
+        Args:
+            img: PIL "1" 模式图像或二维bool数组 (True/非零=点亮)
+            x, y: 左上角坐标 (支持任意y偏移，越界部分自动裁剪)
+            invert: 是否反相
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            self._blit_bits(image_to_bits(img, invert), x, y)
+            return True
+        except Exception as e:
+            log.error("写入图像失败: %s", e)
+            return False
+    
+    def _blit_bits(self, bits, x: int, y: int):
+        """按逻辑坐标写入bool点阵，滚动后跨越环形缓冲末尾时拆成两段"""
+        if not self.scroll_line:
+            blit_bits_to_buffer(self.display_buffer, self.PMDB_COLS, self.PMDB_ROWS, bits, x, y)
+            return
+        
+        # 先在逻辑坐标系内做纵向裁剪
+        top = max(0, -y)
+        bottom = min(bits.shape[0], self.PMDB_ROWS - y)
+        if top >= bottom:
+            return
+        bits = bits[top:bottom]
+        ram_y = (y + top + self.scroll_line) % self.PMDB_ROWS
+        split = self.PMDB_ROWS - ram_y
+        blit_bits_to_buffer(self.display_buffer, self.PMDB_COLS, self.PMDB_ROWS, bits[:split], x, ram_y)
+        if bits.shape[0] > split:
+            blit_bits_to_buffer(self.display_buffer, self.PMDB_COLS, self.PMDB_ROWS, bits[split:], x, 0)
+    
+    @_timed_render
+    def blit_grayscale(self, img, x: int = 0, y: int = 0, method: str = 'bayer8', invert: bool = False) -> bool:
+        """
+        将灰度图像抖动为1bpp后写入显示缓冲区
+        
+        Args:
+            img: PIL图像或二维灰度数组 (0=黑, 255=白)
+            x, y: 左上角坐标
+            method: 抖动方式 ('threshold', 'bayer4', 'bayer8', 'diffusion')
+            invert: 是否反相
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            from lcd_dither import dither  # 按需导入 (依赖numpy)
+            self._blit_bits(dither(img, method, invert), x, y)
+            return True
+        except Exception as e:
+            log.error("写入灰度图像失败: %s", e)
+            return False
+    
+    @_timed_render
+    def load_frame(self, frame: bytes) -> bool:
+        """
+        载入整帧页格式数据 (如lcd_dither.dither_sequence预抖动的结果)
+        
+        Args:
+            frame: 长度为 页数*列数 (2048) 的页格式数据
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        if len(frame) != len(self.display_buffer):
+            log.error("帧数据长度错误: %s", len(frame))
+            return False
+        self.display_buffer[:] = frame
+        return True
+    
+    @_timed_render
+    def clear_screen(self, color: int = 0) -> bool:
+        """
+        清屏
+        
+        Args:
+            color: 清屏颜色 (0=黑色, 1=白色)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            self.lcd_fill(0, 0, self.PMDB_COLS - 1, self.PMDB_ROWS - 1, color)
+            return True
+        except Exception as e:
+            log.error("清屏失败: %s", e)
+            return False
+
+    def reset_stats(self):
+        """清零统计计数"""
+        self.flushes = 0           # 整屏/局部刷新次数
+        self.flushed_bytes = 0     # 实际发送的显示数据字节
+        self.flush_time = 0.0
+        self.render_calls = 0      # 绘图调用次数 (不含单独画点)
+        self.render_time = 0.0
+        self.verify_runs = 0       # GRAM 校验
+        self.verified_pages = 0
+        self.mismatched_pages = 0
+        self.repaired_pages = 0
+    
+    def stats(self) -> dict:
+        """
+        获取统计信息 (自创建或上次 reset_stats() 起)
+    
+        Returns:
+            dict: 刷新次数、发送的显示字节与同样次数整屏刷新的字节 (dirty_ratio 越小，
+                  局部刷新节省越多)、刷新与绘图耗时、GRAM 校验的页数与不一致/重写的页数
+        """
+        full_bytes = self.flushes * len(self.display_buffer)
+        return {
+            'flushes': self.flushes,
+            'flushed_bytes': self.flushed_bytes,
+            'full_frame_bytes': full_bytes,
+            'dirty_ratio': self.flushed_bytes / full_bytes if full_bytes else 0.0,
+            'flush_time_s': self.flush_time,
+            'render_calls': self.render_calls,
+            'render_time_s': self.render_time,
+            'verify_runs': self.verify_runs,
+            'verified_pages': self.verified_pages,
+            'mismatched_pages': self.mismatched_pages,
+            'repaired_pages': self.repaired_pages,
+        }
+    
+    def set_contrast(self, contrast: int) -> bool:
+        """
+        设置对比度
+        
+        Args:
+            contrast: 对比度值 (0-255)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            with self.lock:
+                self.contrast = max(0, min(255, contrast))
+                self.spi.LCD_Command(0x81)
+                self.spi.LCD_Data(self.contrast)
+                return True
+        except Exception as e:
+            log.error("设置对比度失败: %s", e)
+            return False
+    
+    
+    @_timed_render
+    def lcd_show_chinese(self, x: int, y: int, text: str, fc: int, bc: int, size: int, mode: int = 0) -> bool:
+        """
+        显示中文字符
+        
+        Args:
+            x, y: 显示位置
+            text: 要显示的中文字符串
+            fc: 前景色
+            bc: 背景色
+            size: 字体大小
+            mode: 显示模式 (0=叠加模式, 1=覆盖模式)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 中文字符显示需要特殊处理
+            # 这里暂时用简单实现
+            for i, char in enumerate(text):
+                if ord(char) > 127:  # 中文字符
+                    self.lcd_show_chinese_char(x + i * size, y, char, fc, bc, size, mode)
+                else:  # ASCII字符
+                    self.lcd_show_char(x + i * (size // 2), y, char, fc, bc, size, mode)
+            
+            return True
+            
+        except Exception as e:
+            log.error("显示中文字符失败: %s", e)
+            return False
+    
+    @_timed_render
+    def lcd_show_chinese_char(self, x: int, y: int, char: str, fc: int, bc: int, size: int, mode: int = 0) -> bool:
+        """
+        显示单个中文字符
+        
+        Args:
+            x, y: 显示位置
+            char: 要显示的中文字符
+            fc: 前景色
+            bc: 背景色
+            size: 字体大小
+            mode: 显示模式
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 已注册内存映射字库时: 字形按页格式条带整页写入
+            from lcd_cjk_font import chinese_columns
+            columns = chinese_columns(size, char)
+            if columns is not None:
+                strip = render_strip(columns, size, self.strip_shift(y), fc, bc, 1 if mode else 0)
+                if self.blit_strip(strip, x, y):
+                    return True
+            
+            # 获取中文字符的字节数据
+            char_bytes = char.encode('utf-8')
+            
+            # 根据字体大小选择对应的字体数据
+            if size == 12:
+                # 12x12中文字体
+                font_data = LCDFonts.get_chinese_12x12_font(char_bytes)
+                font_width = 12
+                font_height = 12
+            elif size == 16:
+                # 16x16中文字体
+                font_data = LCDFonts.get_chinese_16x16_font(char_bytes)
+                font_width = 16
+                font_height = 16
+            elif size == 24:
+                # 24x24中文字体
+                font_data = LCDFonts.get_chinese_24x24_font(char_bytes)
+                font_width = 24
+                font_height = 24
+            elif size == 32:
+                # 32x32中文字体
+                font_data = LCDFonts.get_chinese_32x32_font(char_bytes)
+                font_width = 32
+                font_height = 32
+            else:
+                log.warning("不支持的中文字体大小: %s", size)
+                return False
+            
+            # 绘制中文字符
+            for i in range(font_height):
+                if i < len(font_data):
+                    for j in range(font_width):
+                        if font_data[i] & (0x01 << j):
+                            self.lcd_draw_point(x + j, y + i, fc)
+                        elif not mode:  # 叠加模式
+                            self.lcd_draw_point(x + j, y + i, bc)
+            
+            return True
+            
+        except Exception as e:
+            log.error("显示中文字符失败: %s", e)
+            return False
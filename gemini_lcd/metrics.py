@@ -0,0 +1,96 @@
+"""
+统计快照 (StatsReporter)
+按固定间隔调用各对象的 stats()，把快照连同与上次快照的差值交给回调，
+用于监控部署设备的吞吐量与链路饱和。
+
+用法:
+    reporter = StatsReporter({'spi': spi, 'lcd': lcd}, print, interval=10.0)
+    reporter.start()
+    ...
+    reporter.stop()
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from lcd_log import get_logger
+
+log = get_logger(__name__)
+
+
+class StatsReporter:
+    """周期性统计快照"""
+
+    def __init__(self, sources: Dict[str, object], callback: Callable[[dict], object], interval: float = 10.0):
+        """
+        Args:
+            sources: 名称 -> 提供 stats() 的对象 (FTD2XXSPIInterface、PMDBLCD、FrameScheduler 等)
+            callback: callback(快照)，在后台线程中调用
+            interval: 快照间隔 (秒)
+        """
+        if interval <= 0:
+            raise ValueError(f"快照间隔必须大于0: {interval}")
+        self.sources = dict(sources)
+        self.callback = callback
+        self.interval = interval
+        self._last: Dict[str, dict] = {}
+        self._last_time: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def snapshot(self) -> dict:
+        """
+        立即采集一次快照
+
+        Returns:
+            dict: {'time', 'interval_s', 名称: stats(), 名称 + '_delta': 与上次快照的数值差}
+        """
+        now = time.time()
+        result = {
+            'time': now,
+            'interval_s': now - self._last_time if self._last_time is not None else 0.0,
+        }
+        for name, source in self.sources.items():
+            stats = source.stats()
+            last = self._last.get(name, {})
+            result[name] = stats
+            result[f'{name}_delta'] = {
+                key: value - last.get(key, 0)
+                for key, value in stats.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            }
+            self._last[name] = stats
+        self._last_time = now
+        return result
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.callback(self.snapshot())
+            except Exception as e:
+                log.error("统计快照失败: %s", e)
+
+    def start(self):
+        """启动后台快照线程"""
+        if self._thread is not None:
+            return
+        self.snapshot()  # 基准，第一次回调给出的就是一个间隔内的差值
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='lcd-stats', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止后台快照线程"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
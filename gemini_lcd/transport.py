@@ -0,0 +1,1541 @@
+"""
+FTDI SPI 接口 (FTDI_SPI_INTERFACE)
+FTD2XX.DLL / ftd2xx 库在 connect() 时才加载，导入本模块不依赖 Windows 环境。
+"""
+
+import math
+import os
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from ctypes import (
+    c_ulong, c_uint, c_ushort, c_ubyte, c_char, c_void_p,
+    c_char_p, c_int, c_long, POINTER, byref, create_string_buffer
+)
+
+from lcd_log import get_logger, hexlist
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+log = get_logger(__name__)
+
+# FTD2XX DLL 默认路径 (环境变量 FTD2XX_DLL_DIR 未设置时使用)
+DEFAULT_DLL_DIR = r'C:\Users\sesa696240\Desktop\PMDB'
+
+_ftd2xx = None
+
+
+def _load_ftd2xx():
+    """导入 ftd2xx 库 (首次调用时导入)，未安装时返回None"""
+    global _ftd2xx
+    if _ftd2xx is None:
+        os.environ.setdefault('FTD2XX_DLL_DIR', DEFAULT_DLL_DIR)
+        try:
+            import ftd2xx
+            _ftd2xx = ftd2xx
+        except ImportError:
+            _ftd2xx = False
+    return _ftd2xx or None
+
+
+def __getattr__(name):
+    # FTDI_AVAILABLE 按需检测，避免导入时加载 ftd2xx
+    if name == 'FTDI_AVAILABLE':
+        return _load_ftd2xx() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class ReadBatch:
+    """
+    批量读操作队列 (由 FTD2XXSPIInterface.read_batch() 创建)
+    
+    每个操作立即把MPSSE命令追加到接口的批量缓冲，返回 Future；
+    批量结束时统一发送并读取，Future 的结果为该操作读到的字节列表。
+    """
+    
+    def __init__(self, spi: 'FTD2XXSPIInterface'):
+        self.spi = spi
+        self._ops: List[Tuple[int, 'Future']] = []
+        self.total = 0
+    
+    def _queue(self, commands: List[int], length: int) -> 'Future':
+        # concurrent.futures 会带入 threading/logging，只在真正读时导入
+        from concurrent.futures import Future
+        self.spi._write_data(commands)
+        future = Future()
+        self._ops.append((length, future))
+        self.total += length
+        return future
+    
+    def read(self, length: int) -> 'Future':
+        """SPI读 length 字节"""
+        if length <= 0:
+            raise ValueError(f"读取长度必须大于0: {length}")
+        return self._queue(self.spi._read_commands(length), length)
+    
+    def transfer(self, data: List[int]) -> 'Future':
+        """SPI全双工传输，结果为同时收到的字节"""
+        if not data:
+            raise ValueError("传输数据为空")
+        return self._queue(self.spi._transfer_commands(data), len(data))
+    
+    def receive_data(self, count: int = 1) -> 'Future':
+        """LCD数据读 (A0=1，读取期间CS有效，读完释放)"""
+        spi = self.spi
+        spi.set_a0(True)
+        spi.set_cs_main(False)
+        spi.gpio_high_output()  # output a0 and cs in the same MPSSE group
+        future = self.read(count)
+        spi.set_cs_main(True)
+        spi.gpio_high_output()
+        return future
+    
+    def read_gpio(self) -> 'Future':
+        """读取GPIO电平，结果为 [低8位, 高8位]"""
+        spi = self.spi
+        return self._queue([spi.CMD_READ_DATA_BITS_LOW, spi.CMD_READ_DATA_BITS_HIGH], 2)
+    
+    def _execute(self):
+        if not self._ops:
+            return
+        spi = self.spi
+        spi._write_data([spi.CMD_SEND_IMMEDIATE])
+        try:
+            data = spi._read_exact(self.total)
+        except Exception as e:
+            for _, future in self._ops:
+                future.set_exception(e)
+            raise
+        offset = 0
+        for length, future in self._ops:
+            future.set_result(list(data[offset:offset + length]))
+            offset += length
+    
+    def _cancel(self):
+        for _, future in self._ops:
+            future.cancel()
+
+
+class FTD2XXSPIInterface:
+    """基于FTD2XX.DLL的SPI接口实现"""
+    
+    # FT_STATUS 错误代码
+    FT_OK = 0
+    FT_INVALID_HANDLE = 1
+    FT_DEVICE_NOT_FOUND = 2
+    FT_DEVICE_NOT_OPENED = 3
+    FT_IO_ERROR = 4
+    FT_INSUFFICIENT_RESOURCES = 5
+    FT_INVALID_PARAMETER = 6
+    FT_INVALID_BAUD_RATE = 7
+    FT_DEVICE_NOT_OPENED_FOR_ERASE = 8
+    FT_DEVICE_NOT_OPENED_FOR_WRITE = 9
+    FT_FAILED_TO_WRITE_DEVICE = 10
+    FT_EEPROM_READ_FAILED = 11
+    FT_EEPROM_WRITE_FAILED = 12
+    FT_EEPROM_ERASE_FAILED = 13
+    FT_EEPROM_NOT_PRESENT = 14
+    FT_EEPROM_NOT_PROGRAMMED = 15
+    FT_INVALID_ARGS = 16
+    FT_NOT_SUPPORTED = 17
+    FT_OTHER_ERROR = 18
+    FT_DEVICE_LIST_NOT_READY = 19
+    
+    # 设备类型
+    FT_DEVICE_2232H = 6
+    
+    # FT_OpenEx / FT_ListDevices 标志
+    FT_OPEN_BY_SERIAL_NUMBER = 1
+    FT_OPEN_BY_DESCRIPTION = 2
+    FT_LIST_NUMBER_ONLY = 0x80000000
+    FT_LIST_BY_INDEX = 0x40000000
+    
+    # 位模式
+    FT_BITMODE_RESET = 0x00
+    FT_BITMODE_ASYNC_BITBANG = 0x01
+    FT_BITMODE_MPSSE = 0x02
+    FT_BITMODE_SYNC_BITBANG = 0x04
+    FT_BITMODE_MCU_HOST = 0x08
+    FT_BITMODE_FAST_SERIAL = 0x10
+    FT_BITMODE_CBUS_BITBANG = 0x20
+    FT_BITMODE_SYNC_FIFO = 0x40
+    
+    # MPSSE命令定义
+    CMD_SET_DATA_BITS_LOW = 0x80
+    CMD_SET_DATA_BITS_HIGH = 0x82
+    CMD_READ_DATA_BITS_LOW = 0x81
+    CMD_READ_DATA_BITS_HIGH = 0x83
+    CMD_SET_CLOCK_DIVISOR = 0x86
+    CMD_SET_LOOPBACK = 0x84
+    CMD_DISABLE_LOOPBACK = 0x85
+    CMD_SEND_IMMEDIATE = 0x87
+    CMD_WAIT_ON_HIGH = 0x88
+    CMD_WAIT_ON_LOW = 0x89
+    CMD_CLOCK_RISE_OUT_BYTES = 0x10
+    CMD_CLOCK_FALL_OUT_BYTES = 0x11
+    CMD_CLOCK_RISE_IN_BYTES = 0x20
+    CMD_CLOCK_FALL_IN_BYTES = 0x24
+    CMD_CLOCK_FALL_OUT_RISE_IN_BYTES = 0x31
+    CMD_CLOCK_RISE_OUT_FALL_IN_BYTES = 0x34
+    CMD_CLOCK_RISE_OUT_BITS = 0x12
+    CMD_CLOCK_FALL_OUT_BITS = 0x13
+    CMD_CLOCK_RISE_IN_BITS = 0x22
+    CMD_CLOCK_FALL_IN_BITS = 0x26
+    CMD_CLOCK_FALL_OUT_RISE_IN_BITS = 0x33
+    CMD_CLOCK_RISE_OUT_FALL_IN_BITS = 0x36
+    
+    # MPSSE 主时钟 (初始化时发送 0x8A 禁用5分频): SCLK = 60MHz / ((1 + 分频) * 2)
+    BASE_CLOCK = 60000000
+    
+    # SPI模式定义
+    SPI_MODE_0 = 0  # CPOL=0, CPHA=0
+    SPI_MODE_1 = 1  # CPOL=0, CPHA=1
+    SPI_MODE_2 = 2  # CPOL=1, CPHA=0
+    SPI_MODE_3 = 3  # CPOL=1, CPHA=1
+    
+    def __init__(self, device_index: int = 0, use_ctypes: bool = False, serial: Optional[str] = None,
+                 backend=None):
+        """
+        初始化FTD2XX SPI接口
+        
+        Args:
+            device_index: 设备索引
+            use_ctypes: 是否使用ctypes直接调用DLL（默认使用ftd2xx库）
+            serial: 按序列号打开 (优先于 device_index)。FT2232H 的两个通道
+                    序列号为 <芯片序列号>A / <芯片序列号>B
+            backend: 代替真实设备的句柄对象 (提供 ftd2xx 设备句柄的 write/read/
+                     setBitMode/purge 等方法，如 ftdi_emulator.FTDIEmulator)
+        """
+        self.device_index = device_index
+        self.serial = serial
+        self.backend = backend
+        # 后端对象按 ftd2xx 设备句柄方式访问
+        self.use_ctypes = use_ctypes and backend is None
+        self.device_handle = None
+        self.is_connected = False
+        # 上次 quick_connect() 是否沿用了设备中已有的配置 (面板无需重新初始化)
+        self.resumed = False
+        
+        # SPI配置
+        self.spi_mode = self.SPI_MODE_0
+        self.clock_speed = 1000000  # 1MHz
+        self.clock_divisor = 0
+        
+        # 引脚定义
+        self.PIN_SCLK = 0   # AD0
+        self.PIN_MOSI = 1   # AD1
+        self.PIN_MISO = 2   # AD2
+        self.PIN_CS0 = 3    # AD3
+        self.PIN_CS1 = 4    # AD4
+        self.PIN_CS2 = 5    # AD5
+        self.PIN_CS3 = 6    # AD6
+        self.PIN_CS4 = 7    # AD7
+        
+        # GPIO引脚定义 (高8位)
+        self.PIN_A0 = 8     # AD8
+        self.PIN_RESET = 9  # AD9
+        self.PIN_CS = 10    # AD10
+        
+        # GPIO状态 (低8位和高8位)
+        self.gpio_direction_low = 0x00
+        self.gpio_value_low = 0x00
+        self.gpio_direction_high = 0x00
+        self.gpio_value_high = 0x00
+        
+        # 批量写入缓冲 (batch()期间的_write_data合并为一次USB写入)
+        self._batch_buffer = None
+        self._batch_depth = 0
+        
+        # DLL 在 connect() 时才加载
+        self.ftd2xx_dll = None
+        
+        # 录制 (lcd_capture.CaptureWriter)，每次USB写入前记录
+        self.capture = None
+        
+        # 统计 (stats())
+        self.reset_stats()
+    
+    def _init_dll(self):
+        """初始化FTD2XX DLL"""
+        try:
+            from ctypes import windll
+            
+            # 尝试加载DLL
+            dll_dir = os.environ.get('FTD2XX_DLL_DIR', DEFAULT_DLL_DIR)
+            dll_paths = [
+                os.path.join(dll_dir, 'FTD2XX.DLL'),
+                'FTD2XX.DLL',
+                'ftd2xx.dll'
+            ]
+            
+            self.ftd2xx_dll = None
+            for dll_path in dll_paths:
+                try:
+                    self.ftd2xx_dll = windll.LoadLibrary(dll_path)
+                    log.info("成功加载DLL: %s", dll_path)
+                    break
+                except OSError:
+                    continue
+            
+            if not self.ftd2xx_dll:
+                raise Exception("无法加载FTD2XX.DLL")
+            
+            # 设置函数原型
+            self._setup_dll_functions()
+            
+        except Exception as e:
+            raise Exception(f"初始化DLL失败: {str(e)}")
+    
+    def _setup_dll_functions(self):
+        """设置DLL函数原型"""
+        # FT_Open
+        self.ftd2xx_dll.FT_Open.argtypes = [c_int, POINTER(c_void_p)]
+        self.ftd2xx_dll.FT_Open.restype = c_ulong
+        
+        # FT_OpenEx
+        self.ftd2xx_dll.FT_OpenEx.argtypes = [c_char_p, c_ulong, POINTER(c_void_p)]
+        self.ftd2xx_dll.FT_OpenEx.restype = c_ulong
+        
+        # FT_ListDevices
+        self.ftd2xx_dll.FT_ListDevices.argtypes = [c_void_p, c_void_p, c_ulong]
+        self.ftd2xx_dll.FT_ListDevices.restype = c_ulong
+        
+        # FT_Close
+        self.ftd2xx_dll.FT_Close.argtypes = [c_void_p]
+        self.ftd2xx_dll.FT_Close.restype = c_ulong
+        
+        # FT_Write
+        self.ftd2xx_dll.FT_Write.argtypes = [c_void_p, c_void_p, c_ulong, POINTER(c_ulong)]
+        self.ftd2xx_dll.FT_Write.restype = c_ulong
+        
+        # FT_Read
+        self.ftd2xx_dll.FT_Read.argtypes = [c_void_p, c_void_p, c_ulong, POINTER(c_ulong)]
+        self.ftd2xx_dll.FT_Read.restype = c_ulong
+        
+        # FT_SetBitMode
+        self.ftd2xx_dll.FT_SetBitMode.argtypes = [c_void_p, c_ubyte, c_ubyte]
+        self.ftd2xx_dll.FT_SetBitMode.restype = c_ulong
+        
+        # FT_SetUSBParameters
+        self.ftd2xx_dll.FT_SetUSBParameters.argtypes = [c_void_p, c_ulong, c_ulong]
+        self.ftd2xx_dll.FT_SetUSBParameters.restype = c_ulong
+        
+        # FT_SetLatencyTimer
+        self.ftd2xx_dll.FT_SetLatencyTimer.argtypes = [c_void_p, c_ubyte]
+        self.ftd2xx_dll.FT_SetLatencyTimer.restype = c_ulong
+        
+        # FT_Purge
+        self.ftd2xx_dll.FT_Purge.argtypes = [c_void_p, c_ulong]
+        self.ftd2xx_dll.FT_Purge.restype = c_ulong
+        
+        # FT_GetDeviceInfo
+        self.ftd2xx_dll.FT_GetDeviceInfo.argtypes = [c_void_p, POINTER(c_ulong), c_char_p, c_char_p, c_void_p]
+        self.ftd2xx_dll.FT_GetDeviceInfo.restype = c_ulong
+        
+        # FT_GetQueueStatus
+        self.ftd2xx_dll.FT_GetQueueStatus.argtypes = [c_void_p, POINTER(c_ulong)]
+        self.ftd2xx_dll.FT_GetQueueStatus.restype = c_ulong
+        
+        # FT_ResetDevice
+        self.ftd2xx_dll.FT_ResetDevice.argtypes = [c_void_p]
+        self.ftd2xx_dll.FT_ResetDevice.restype = c_ulong
+    
+    def _clear_input_buffer(self):
+        """清空输入缓冲区（基于官方C代码）"""
+        try:
+            if self.use_ctypes:
+                # 使用ctypes检查队列状态
+                queue_status = c_ulong()
+                status = self.ftd2xx_dll.FT_GetQueueStatus(self.device_handle, byref(queue_status))
+                
+                if status == self.FT_OK and queue_status.value > 0:
+                    log.debug("  发现缓冲区中有 %s 字节残留数据，正在清理...", queue_status.value)
+                    
+                    # 读取并清空缓冲区
+                    buffer_size = min(queue_status.value, 1024)  # 限制读取大小
+                    buffer = create_string_buffer(buffer_size)
+                    bytes_read = c_ulong()
+                    
+                    read_status = self.ftd2xx_dll.FT_Read(
+                        self.device_handle,
+                        buffer,
+                        c_ulong(buffer_size),
+                        byref(bytes_read)
+                    )
+                    
+                    if read_status == self.FT_OK:
+                        log.debug("  ✓ 成功清理 %s 字节残留数据", bytes_read.value)
+                    else:
+                        log.warning("  ⚠ 清理残留数据失败，状态码: %s", read_status)
+                else:
+                    log.debug("  ✓ 缓冲区已清空")
+            else:
+                # 使用ftd2xx库
+                if hasattr(self.device_handle, 'getQueueStatus'):
+                    queue_status = self.device_handle.getQueueStatus()
+                    if queue_status > 0:
+                        log.debug("  发现缓冲区中有 %s 字节残留数据，正在清理...", queue_status)
+                        # 读取并清空缓冲区
+                        buffer_size = min(queue_status, 1024)
+                        self.device_handle.read(buffer_size)
+                        log.debug("  ✓ 成功清理 %s 字节残留数据", buffer_size)
+                    else:
+                        log.debug("  ✓ 缓冲区已清空")
+                else:
+                    log.debug("  ✓ 跳过缓冲区检查（ftd2xx库版本不支持）")
+                    
+        except Exception as e:
+            log.warning("  ⚠ 缓冲区清理过程中出错: %s", e)
+    
+    def connect(self) -> bool:
+        """
+        连接到FTDI设备
+        
+        Returns:
+            bool: 连接是否成功
+        """
+        try:
+            if self.backend is not None:
+                return self._connect_backend()
+            if self.use_ctypes:
+                return self._connect_ctypes()
+            else:
+                return self._connect_ftd2xx()
+        except Exception as e:
+            log.error("连接失败: %s", e)
+            return False
+    
+    def _open_device(self):
+        """打开设备并设置USB参数 (不改变位模式与引脚状态)"""
+        if self.backend is not None:
+            self.device_handle = self.backend
+            self.device_handle.setUSBParameters(65536, 65536)
+            self.device_handle.setLatencyTimer(1)
+            return
+        
+        if self.use_ctypes:
+            if not self.ftd2xx_dll:
+                self._init_dll()
+            
+            handle = c_void_p()
+            if self.serial is not None:
+                status = self.ftd2xx_dll.FT_OpenEx(self.serial.encode('ascii'),
+                                                   c_ulong(self.FT_OPEN_BY_SERIAL_NUMBER), byref(handle))
+            else:
+                status = self.ftd2xx_dll.FT_Open(c_int(self.device_index), byref(handle))
+            
+            if status != self.FT_OK:
+                raise Exception(f"打开设备失败，状态码: {status}")
+            
+            self.device_handle = handle
+            self.ftd2xx_dll.FT_SetUSBParameters(self.device_handle, c_ulong(65536), c_ulong(65536))
+            self.ftd2xx_dll.FT_SetLatencyTimer(self.device_handle, c_ubyte(1))
+            return
+        
+        ftd2xx = _load_ftd2xx()
+        if ftd2xx is None:
+            raise Exception("ftd2xx库未安装")
+        log.debug("正在打开设备 %s...", self._device_name())
+        if self.serial is not None:
+            self.device_handle = ftd2xx.openEx(self.serial.encode('ascii'),
+                                               self.FT_OPEN_BY_SERIAL_NUMBER)
+        else:
+            self.device_handle = ftd2xx.open(self.device_index)
+        log.debug("设备打开成功")
+        
+        log.debug("设置USB参数...")
+        self.device_handle.setUSBParameters(65536, 65536)
+        self.device_handle.setLatencyTimer(1)
+        log.debug("USB参数设置成功")
+    
+    def _close_handle(self):
+        """关闭设备句柄 (忽略错误)"""
+        if self.device_handle:
+            try:
+                if self.use_ctypes:
+                    self.ftd2xx_dll.FT_Close(self.device_handle)
+                else:
+                    self.device_handle.close()
+            except Exception:
+                pass
+        self.device_handle = None
+        self.is_connected = False
+    
+    def _purge(self):
+        """清空收发缓冲区 (PURGE_RX | PURGE_TX)"""
+        if self.use_ctypes:
+            self.ftd2xx_dll.FT_Purge(self.device_handle, c_ulong(0x01 | 0x02))
+        else:
+            self.device_handle.purge(0x01 | 0x02)
+    
+    def _queue_status(self) -> int:
+        """接收队列中等待读取的字节数"""
+        if self.use_ctypes:
+            queue_status = c_ulong()
+            status = self.ftd2xx_dll.FT_GetQueueStatus(self.device_handle, byref(queue_status))
+            if status != self.FT_OK:
+                raise Exception(f"获取队列状态失败，状态码: {status}")
+            return queue_status.value
+        return self.device_handle.getQueueStatus()
+    
+    def _connect_ctypes(self) -> bool:
+        """使用ctypes连接设备"""
+        self._open_device()
+        
+        # 复位位模式
+        self.ftd2xx_dll.FT_SetBitMode(self.device_handle, c_ubyte(0x00), c_ubyte(self.FT_BITMODE_RESET))
+        self._sleep(0.01)
+        
+        # 设置为MPSSE模式
+        self.ftd2xx_dll.FT_SetBitMode(self.device_handle, c_ubyte(0x00), c_ubyte(self.FT_BITMODE_MPSSE))
+        self._sleep(0.01)
+        
+        # 清空缓冲区 - 先检查并读取残留数据
+        self._clear_input_buffer()
+        
+        # 然后执行标准清空操作
+        self.ftd2xx_dll.FT_Purge(self.device_handle, c_ulong(0x01 | 0x02))  # PURGE_RX | PURGE_TX
+        
+        # 初始化MPSSE
+        self._initialize_mpsse()
+        
+        self.is_connected = True
+        log.info("FTDI设备连接成功 (ctypes)，%s", self._device_name())
+        return True
+    
+    def _connect_backend(self) -> bool:
+        """连接到后端对象 (模拟器等)，按真实设备相同的顺序初始化"""
+        self._open_device()
+        self.device_handle.setBitMode(0x00, self.FT_BITMODE_RESET)
+        self.device_handle.setBitMode(0x00, self.FT_BITMODE_MPSSE)
+        self.device_handle.purge(0x01 | 0x02)
+        self._initialize_mpsse()
+        self.is_connected = True
+        log.info("FTDI设备连接成功 (后端: %s)", type(self.backend).__name__)
+        return True
+    
+    def _connect_ftd2xx(self) -> bool:
+        """使用ftd2xx库连接设备"""
+        ftd2xx = _load_ftd2xx()
+        if ftd2xx is None:
+            raise Exception("ftd2xx库未安装")
+        
+        try:
+            # 打开设备并设置USB参数
+            self._open_device()
+            
+            # 复位位模式
+            log.debug("复位位模式...")
+            self.device_handle.setBitMode(0x00, 0x00)  # 复位
+            self._sleep(0.01)
+            log.debug("位模式复位成功")
+            
+            # 设置为MPSSE模式
+            log.debug("设置为MPSSE模式...")
+            self.device_handle.setBitMode(0x00, 0x02)  # MPSSE模式
+            self._sleep(0.01)
+            log.debug("MPSSE模式设置成功")
+            
+            # 清空缓冲区
+            log.debug("清空缓冲区...")
+            self._clear_input_buffer()
+            self.device_handle.purge(ftd2xx.defines.PURGE_RX | ftd2xx.defines.PURGE_TX)
+            log.debug("缓冲区清空成功")
+            
+            # 初始化MPSSE
+            log.debug("初始化MPSSE...")
+            self._initialize_mpsse()
+            log.debug("MPSSE初始化成功")
+            
+            self.is_connected = True
+            log.info("FTDI设备连接成功 (ftd2xx)，%s", self._device_name())
+            return True
+            
+        except Exception as e:
+            log.error("连接过程中出错: %s", e)
+            import traceback
+            traceback.print_exc()
+            if self.device_handle:
+                try:
+                    self.device_handle.close()
+                except:
+                    pass
+                self.device_handle = None
+            raise e
+    
+    def quick_connect(self) -> bool:
+        """
+        快速重连: 重新打开设备后先探测 MPSSE 是否仍处于同步状态
+        (0xAA 无效命令应回应 0xFA 0xAA)，并一次读回 GPIO 电平。
+        仍同步且 RESET 为高 (面板未被复位) 时，只重发不带延时的 MPSSE 配置并沿用引脚电平，
+        不切换位模式、不复位面板，断开后几毫秒即可恢复且屏幕不闪；
+        否则回退到完整的 connect()。
+        
+        Returns:
+            bool: 连接是否成功 (是否沿用了原配置见 self.resumed)
+        """
+        self.resumed = False
+        self.reconnects += 1
+        try:
+            self._close_handle()
+            self._open_device()
+            gpio = self._probe_mpsse()
+            if gpio is not None and gpio >> self.PIN_RESET & 1:
+                self._restore_mpsse(gpio)
+                self.is_connected = True
+                self.resumed = True
+                self.quick_resumes += 1
+                log.info("FTDI设备快速重连成功 (沿用MPSSE配置)，GPIO: 0x%04x", gpio)
+                return True
+            log.info("MPSSE未同步或面板已复位，执行完整连接")
+        except Exception as e:
+            log.warning("快速重连失败，执行完整连接: %s", e)
+        self._close_handle()
+        return self.connect()
+    
+    def _probe_mpsse(self, timeout: float = 0.05) -> Optional[int]:
+        """
+        探测 MPSSE 同步状态并读回 GPIO
+        
+        Returns:
+            Optional[int]: 高8位<<8 | 低8位的引脚电平，未同步时为None
+        """
+        # 先丢弃残留的接收数据，避免把旧数据当成回应
+        self._purge()
+        self._write_data([0xAA, 0x81, 0x83, self.CMD_SEND_IMMEDIATE])
+        # 不在 MPSSE 模式时设备不会回应，轮询队列而不是阻塞在 FT_Read
+        deadline = time.perf_counter() + timeout
+        while self._queue_status() < 4:
+            if time.perf_counter() > deadline:
+                log.debug("  MPSSE同步探测超时")
+                return None
+            time.sleep(0.001)
+        data = self._read_data(self._queue_status())
+        if len(data) != 4 or data[:2] != b'\xfa\xaa':
+            log.debug("  MPSSE同步探测回应异常: %s", hexlist(data))
+            return None
+        return data[3] << 8 | data[2]
+    
+    def _restore_mpsse(self, gpio: int):
+        """
+        按当前设置重发 MPSSE 配置 (不延时)，高8位沿用读回的电平并释放 CS，
+        防止断开前被打断的传输让 CS 保持有效
+        """
+        cpol, cpha = self._get_spi_config()
+        self.clock_divisor = self.divisor_for_clock(self.clock_speed)
+        self.gpio_direction_low = 0x0b
+        self.gpio_value_low = 0x00 if cpol == 0 else 0x01
+        self.gpio_direction_high = 0x07
+        self.gpio_value_high = (gpio >> 8 | 1 << (self.PIN_CS - 8)) & self.gpio_direction_high
+        self._write_data([
+            0x8A, 0x97, 0x8D,
+            self.CMD_SET_CLOCK_DIVISOR,
+            self.clock_divisor & 0xFF,
+            (self.clock_divisor >> 8) & 0xFF,
+            self.CMD_DISABLE_LOOPBACK,
+            self.CMD_SET_DATA_BITS_LOW, self.gpio_value_low, self.gpio_direction_low,
+            self.CMD_SET_DATA_BITS_HIGH, self.gpio_value_high, self.gpio_direction_high,
+        ])
+    
+    def _device_name(self) -> str:
+        if self.serial is not None:
+            return f"序列号: {self.serial}"
+        return f"索引: {self.device_index}"
+    
+    def list_devices(self) -> List[str]:
+        """
+        列出已连接设备的序列号 (FT2232H 每个通道一项，如 FT1234A、FT1234B)
+        
+        Returns:
+            List[str]: 按设备索引排列的序列号，失败时返回空列表
+        """
+        try:
+            if not self.use_ctypes:
+                ftd2xx = _load_ftd2xx()
+                if ftd2xx is None:
+                    raise Exception("ftd2xx库未安装")
+                serials = ftd2xx.listDevices(self.FT_OPEN_BY_SERIAL_NUMBER) or []
+                return [s.decode('ascii', errors='ignore') for s in serials]
+            
+            if not self.ftd2xx_dll:
+                self._init_dll()
+            count = c_ulong()
+            status = self.ftd2xx_dll.FT_ListDevices(byref(count), None, c_ulong(self.FT_LIST_NUMBER_ONLY))
+            if status != self.FT_OK:
+                raise Exception(f"获取设备数量失败，状态码: {status}")
+            serials = []
+            for index in range(count.value):
+                buffer = create_string_buffer(64)
+                status = self.ftd2xx_dll.FT_ListDevices(
+                    c_void_p(index), buffer,
+                    c_ulong(self.FT_LIST_BY_INDEX | self.FT_OPEN_BY_SERIAL_NUMBER)
+                )
+                if status == self.FT_OK:
+                    serials.append(buffer.value.decode('ascii', errors='ignore'))
+            return serials
+        except Exception as e:
+            log.error("列出设备失败: %s", e)
+            return []
+    
+    def disconnect(self):
+        """断开连接"""
+        self.stop_capture()
+        try:
+            if self.device_handle:
+                if self.use_ctypes:
+                    self.ftd2xx_dll.FT_Close(self.device_handle)
+                else:
+                    self.device_handle.close()
+                self.device_handle = None
+            self.is_connected = False
+            log.info("FTDI设备已断开连接")
+        except Exception as e:
+            log.error("断开连接时出错: %s", e)
+    
+    def _initialize_mpsse(self):
+        """初始化MPSSE"""
+        try:
+            # 发送同步序列
+            log.debug("  发送第一个同步序列...")
+            sync_commands = [0xAA, 0x00]
+            self._write_data(sync_commands)
+            self._sleep(0.01)
+            log.debug("  ✓ 第一个同步序列发送成功")
+            
+            # 再次发送同步序列确保设备进入MPSSE模式
+            log.debug("  发送第二个同步序列...")
+            sync_commands = [0xAB, 0x00]
+            self._write_data(sync_commands)
+            self._sleep(0.01)
+            log.debug("  ✓ 第二个同步序列发送成功")
+            
+            # 额外的MPSSE配置（基于官方代码）
+            log.debug("  配置MPSSE参数...")
+            mpsse_config = [
+                0x8A,  # 确保禁用时钟分频5 (60MHz主时钟)
+                0x97,  # 确保关闭自适应时钟
+                0x8D,  # 禁用3相数据时钟
+            ]
+            self._write_data(mpsse_config)
+            self._sleep(0.02)  # 20ms延时
+            log.debug("  ✓ MPSSE参数配置完成")
+            
+            # 计算时钟分频器
+            self.clock_divisor = self.divisor_for_clock(self.clock_speed)
+            log.debug("  时钟分频器: %s (目标频率: %sHz)", self.clock_divisor, self.clock_speed)
+            
+            # 设置引脚方向
+            cpol, cpha = self._get_spi_config()
+            
+            # 根据CPOL设置初始时钟状态
+            if cpol == 0:
+                low_value = 0x00  # 时钟AD0空闲时为低电平
+            else:
+                low_value = 0x01  # 时钟AD0空闲时为高电平 
+            
+            # 设置引脚方向：SCLK(AD0)=输出, MOSI(AD1)=输出, MISO(AD2)=输入
+            # 根据官方代码，使用0x0b (bit0=SK输出, bit1=DO输出, bit3=GPIOL0输出)
+            low_direction = 0x0b  # bit 0(SCLK)和bit 1(MOSI)为输出，bit 3为输出，bit 2(MISO)为输入
+            
+            # 设置高8位GPIO方向：A0(AD8)=输出, RESET(AD9)=输出, CS(AD10)=输出
+            high_direction = 0x07  # bit 0(A0), bit 1(RESET), bit 2(CS)为输出
+            high_value = 0x07  # 初始值都为低电平
+            
+            init_commands = [
+                # 设置时钟分频器
+                self.CMD_SET_CLOCK_DIVISOR,
+                self.clock_divisor & 0xFF,
+                (self.clock_divisor >> 8) & 0xFF,
+                
+                # 禁用环回
+                self.CMD_DISABLE_LOOPBACK,
+                
+                 # 设置GPIO方向 (低8位)
+                self.CMD_SET_DATA_BITS_LOW,
+                low_value,
+                low_direction,
+                
+                 # 设置GPIO方向 (高8位)
+                self.CMD_SET_DATA_BITS_HIGH,
+                high_value,
+                high_direction,
+
+               
+            ]
+            
+            log.debug("  发送MPSSE初始化命令: %s", hexlist(init_commands))
+            self._write_data(init_commands)
+            self._sleep(0.01)
+            log.debug("  ✓ 初始化命令发送成功")
+            
+            # 更新GPIO状态
+            self.gpio_direction_low = low_direction
+            self.gpio_value_low = low_value
+            self.gpio_direction_high = high_direction
+            self.gpio_value_high = high_value
+            
+        except Exception as e:
+            log.error("  ✗ MPSSE初始化失败: %s", e)
+            raise e
+    
+             
+    @contextmanager
+    def batch(self):
+        """
+        批量写入: with块内的所有MPSSE命令合并为一次USB写入 (可嵌套)
+        
+        用法:
+            with spi.batch():
+                spi.LCD_Command(...)
+                spi.LCD_DataN(...)
+        """
+        if self._batch_depth == 0:
+            self._batch_buffer = bytearray()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                data = self._batch_buffer
+                self._batch_buffer = None
+                if data:
+                    self._write_data(data)
+    
+    def _flush_batch(self):
+        """立即发送批量缓冲中已积累的命令 (读操作前调用)"""
+        batch_buffer = self._batch_buffer
+        if batch_buffer:
+            self._batch_buffer = None
+            try:
+                self._write_data(batch_buffer)
+            finally:
+                batch_buffer.clear()
+                self._batch_buffer = batch_buffer
+    
+    def _write_data(self, data: List[int]):
+        """写入数据到设备"""
+        if self._batch_buffer is not None:
+            self._batch_buffer.extend(data)
+            return
+        
+        if not self.device_handle:
+            raise Exception("设备句柄无效")
+        
+        data_bytes = bytes(data)
+        
+        if self.capture is not None:
+            self.capture.write(data_bytes)
+        
+        start = time.perf_counter()
+        if self.use_ctypes:
+            bytes_written = c_ulong()
+            status = self.ftd2xx_dll.FT_Write(
+                self.device_handle, 
+                data_bytes, 
+                c_ulong(len(data_bytes)), 
+                byref(bytes_written)
+            )
+            if status != self.FT_OK:
+                raise Exception(f"写入失败，状态码: {status}")
+        else:
+            self.device_handle.write(data_bytes)
+        self.write_time += time.perf_counter() - start
+        self.usb_writes += 1
+        self.bytes_written += len(data_bytes)
+    
+    def _read_data(self, length: int) -> bytes:
+        """从设备读取数据"""
+        if not self.device_handle:
+            raise Exception("设备句柄无效")
+        
+        # 读之前必须先把批量缓冲中的命令发出去
+        self._flush_batch()
+        
+        if self.use_ctypes:
+            buffer = create_string_buffer(length)
+            bytes_read = c_ulong()
+            status = self.ftd2xx_dll.FT_Read(
+                self.device_handle,
+                buffer,
+                c_ulong(length),
+                byref(bytes_read)
+            )
+            if status != self.FT_OK:
+                raise Exception(f"读取失败，状态码: {status}")
+            data = buffer.raw[:bytes_read.value]
+        else:
+            data = self.device_handle.read(length)
+        self.bytes_read += len(data)
+        return data
+    
+    def _sleep(self, seconds: float):
+        """延时 (计入统计)"""
+        self.sleeps += 1
+        self.sleep_time += seconds
+        time.sleep(seconds)
+    
+    def reset_stats(self):
+        """清零统计计数"""
+        self.usb_writes = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.payload_bytes = 0     # SPI 数据字节 (其余为 MPSSE 命令与 GPIO 开销)
+        self.gpio_updates = 0
+        self.write_time = 0.0      # 阻塞在 FT_Write 中的时间 (秒)
+        self.sleeps = 0
+        self.sleep_time = 0.0
+        self.reconnects = 0        # quick_connect() 次数
+        self.quick_resumes = 0     # 其中沿用原配置的次数
+        self._stats_start = time.perf_counter()
+    
+    def stats(self) -> dict:
+        """
+        获取统计信息 (自创建或上次 reset_stats() 起)
+        
+        Returns:
+            dict: USB写入次数、读写字节数、有效数据与开销字节、GPIO更新次数、
+                  FT_Write 阻塞时间与占比 (接近1表示链路饱和)、延时次数与时长、
+                  快速重连次数与其中沿用原配置的次数
+        """
+        elapsed = time.perf_counter() - self._stats_start
+        return {
+            'elapsed_s': elapsed,
+            'usb_writes': self.usb_writes,
+            'bytes_written': self.bytes_written,
+            'bytes_read': self.bytes_read,
+            'payload_bytes': self.payload_bytes,
+            'overhead_bytes': max(0, self.bytes_written - self.payload_bytes),
+            'payload_ratio': self.payload_bytes / self.bytes_written if self.bytes_written else 0.0,
+            'gpio_updates': self.gpio_updates,
+            'write_time_s': self.write_time,
+            'write_busy': self.write_time / elapsed if elapsed > 0 else 0.0,
+            'throughput_Bps': self.bytes_written / elapsed if elapsed > 0 else 0.0,
+            'sleeps': self.sleeps,
+            'sleep_time_s': self.sleep_time,
+            'reconnects': self.reconnects,
+            'quick_resumes': self.quick_resumes,
+        }
+    
+    def start_capture(self, path: str):
+        """
+        开始录制: 之后每次USB写入的数据连同时间戳写入录制文件 (lcd_capture 格式)
+        
+        Args:
+            path: 录制文件路径
+        """
+        from lcd_capture import CaptureWriter
+        self.stop_capture()
+        self.capture = CaptureWriter(path)
+    
+    def stop_capture(self):
+        """停止录制并关闭录制文件"""
+        if self.capture is not None:
+            self.capture.close()
+            self.capture = None
+    
+    def configure_spi(self, mode: int, clock_speed: int) -> bool:
+        """
+        配置SPI参数
+        
+        Args:
+            mode: SPI模式 (0-3)
+            clock_speed: 时钟频率 (Hz)
+            
+        Returns:
+            bool: 配置是否成功
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        if mode not in [0, 1, 2, 3]:
+            raise ValueError(f"不支持的SPI模式: {mode}")
+        
+        self.spi_mode = mode
+        self.clock_speed = clock_speed
+        
+        # 重新初始化MPSSE
+        self._initialize_mpsse()
+        
+        log.info("SPI配置: 模式=%s, 频率=%sHz", mode, clock_speed)
+        return True
+    
+    @classmethod
+    def divisor_for_clock(cls, clock_speed: float) -> int:
+        """不超过 clock_speed 的最快SCLK对应的分频值"""
+        divisor = math.ceil(cls.BASE_CLOCK / (2 * clock_speed) - 1e-9) - 1
+        return max(0, min(0xFFFF, divisor))
+    
+    @classmethod
+    def clock_for_divisor(cls, divisor: int) -> float:
+        """分频值对应的SCLK频率 (Hz)"""
+        return cls.BASE_CLOCK / ((1 + divisor) * 2)
+    
+    def set_clock_divisor(self, divisor: int) -> bool:
+        """
+        直接设置时钟分频 (不重新初始化MPSSE)，clock_speed 同步为对应的实际频率
+        
+        Args:
+            divisor: 分频值 (0-65535)，SCLK = 60MHz / ((1 + divisor) * 2)
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        divisor = max(0, min(0xFFFF, divisor))
+        self.clock_divisor = divisor
+        self.clock_speed = self.clock_for_divisor(divisor)
+        self._write_data([self.CMD_SET_CLOCK_DIVISOR, divisor & 0xFF, (divisor >> 8) & 0xFF])
+        return True
+    
+    def _get_spi_config(self) -> Tuple[int, int]:
+        """获取SPI配置参数"""
+        mode_configs = {
+            0: (0, 0),  # CPOL=0, CPHA=0
+            1: (0, 1),  # CPOL=0, CPHA=1
+            2: (1, 0),  # CPOL=1, CPHA=0
+            3: (1, 1),  # CPOL=1, CPHA=1
+        }
+        return mode_configs[self.spi_mode]
+    
+    def spi_write(self, data: List[int]) -> bool:
+        """
+        SPI写操作
+        
+        Args:
+            data: 要发送的数据列表
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        if not data:
+            return True
+        
+        cpol, cpha = self._get_spi_config()
+        #print(f"cpol, cpha=: {cpol,cpha}")
+        # 构造SPI传输命令
+        commands = []
+        
+        # 设置引脚方向
+        low_direction = 0x0b  # SCLK和MOSI为输出，MISO为输入，bit3为输出
+        low_value_start = 0x00 if cpol == cpha else 0x01  # 根据CPOL设置初始时钟AD0状态
+        low_value_end = 0x00 if cpol == 0 else 0x01  # 根据CPOL设置初始时钟AD0状态
+        
+        commands.extend([
+            self.CMD_SET_DATA_BITS_LOW,
+            low_value_start,
+            low_direction,
+        ])
+        
+        # 添加数据长度和SPI命令
+        data_len = len(data) - 1
+        
+        if cpol == cpha: #模式0 or 模式3
+            commands.extend([
+                self.CMD_CLOCK_FALL_OUT_BYTES, #CMD_CLOCK_RISE_OUT_BYTES,
+                data_len & 0xFF,
+                (data_len >> 8) & 0xFF,
+            ])
+        
+        else:  # 模式1 or 模式2
+            commands.extend([
+                self.CMD_CLOCK_RISE_OUT_BYTES,
+                data_len & 0xFF,
+                (data_len >> 8) & 0xFF,
+            ])
+        
+        # 添加数据
+        commands.extend(data)
+        self.payload_bytes += len(data)
+        
+        # Resume Clock State
+        #commands.extend([
+        #   self.CMD_SET_DATA_BITS_LOW,
+        #   low_value_end,
+        #   low_direction,
+        #   ])
+        # 发送命令
+        self._write_data(commands)
+        return True
+    
+    def _read_commands(self, length: int) -> List[int]:
+        """构造读取 length 字节的MPSSE命令 (结束时恢复SCLK空闲电平)"""
+        cpol, cpha = self._get_spi_config()
+        
+        # 设置引脚方向
+        low_direction = 0x0b  # SCLK和MOSI为输出，MISO为输入，bit3为输出
+        low_value_start = 0x00 if cpol == cpha else 0x01  # 根据CPOL设置初始时钟AD0状态
+        low_value_end = 0x00 if cpol == 0 else 0x01  # 根据CPOL设置初始时钟AD0状态
+        
+        # 模式0/3 上升沿采样，模式1/2 下降沿采样
+        read_cmd = self.CMD_CLOCK_RISE_IN_BYTES if cpol == cpha else self.CMD_CLOCK_FALL_IN_BYTES
+        data_len = length - 1
+        return [
+            self.CMD_SET_DATA_BITS_LOW, low_value_start, low_direction,
+            read_cmd, data_len & 0xFF, (data_len >> 8) & 0xFF,
+            #resume SCLK to initial state
+            self.CMD_SET_DATA_BITS_LOW, low_value_end, low_direction,
+        ]
+    
+    def _transfer_commands(self, data: List[int]) -> List[int]:
+        """构造全双工传输 data 的MPSSE命令 (结束时恢复SCLK空闲电平)"""
+        cpol, cpha = self._get_spi_config()
+        
+        # 设置引脚方向
+        low_direction = 0x0b  # SCLK和MOSI为输出，MISO为输入，bit3为输出
+        low_value_start = 0x00 if cpol == cpha else 0x01  # 根据CPOL设置初始时钟AD0状态
+        low_value_end = 0x00 if cpol == 0 else 0x01  # 根据CPOL设置初始时钟AD0状态
+        
+        # 模式0/3 下降沿输出上升沿采样，模式1/2 相反
+        if cpol == cpha:
+            transfer_cmd = self.CMD_CLOCK_FALL_OUT_RISE_IN_BYTES
+        else:
+            transfer_cmd = self.CMD_CLOCK_RISE_OUT_FALL_IN_BYTES
+        data_len = len(data) - 1
+        commands = [
+            self.CMD_SET_DATA_BITS_LOW, low_value_start, low_direction,
+            transfer_cmd, data_len & 0xFF, (data_len >> 8) & 0xFF,
+        ]
+        # 添加数据
+        commands.extend(data)
+        self.payload_bytes += len(data)
+        # resume SCLK to initial state
+        commands.extend([self.CMD_SET_DATA_BITS_LOW, low_value_end, low_direction])
+        return commands
+    
+    def _read_exact(self, length: int, timeout: float = 1.0) -> bytes:
+        """读取恰好 length 字节 (FT_Read 可能分次返回)，超时抛出异常"""
+        data = self._read_data(length)
+        if len(data) >= length:
+            return data
+        data = bytearray(data)
+        deadline = time.perf_counter() + timeout
+        while len(data) < length:
+            if time.perf_counter() > deadline:
+                raise Exception(f"读取超时: 期望 {length} 字节，收到 {len(data)} 字节")
+            data += self._read_data(length - len(data))
+        return bytes(data)
+    
+    @contextmanager
+    def read_batch(self):
+        """
+        批量读: with块内排队的读/传输操作与其他命令合并为一次USB写入，
+        以 SEND_IMMEDIATE 结束，再用一次读取取回全部数据并按操作切分
+        
+        用法:
+            with spi.read_batch() as reads:
+                spi.LCD_Command(0x30)
+                status = reads.receive_data()
+                block = reads.read(16)
+            status.result(), block.result()
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        self._clear_input_buffer()
+        reads = ReadBatch(self)
+        with self.batch():
+            try:
+                yield reads
+            except BaseException:
+                reads._cancel()
+                raise
+            reads._execute()
+    
+    def spi_read(self, length: int) -> List[int]:
+        """
+        SPI读操作
+        
+        Args:
+            length: 要读取的字节数
+            
+        Returns:
+            List[int]: 读取到的数据
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        if length <= 0:
+            return []
+        
+        # 读取响应数据
+        try:
+            with self.read_batch() as reads:
+                result = reads.read(length)
+            return result.result()
+        except Exception as e:
+            log.error("SPI读操作失败: %s", e)
+            
+            return []
+    
+    def spi_transfer(self, data: List[int]) -> List[int]:
+        """
+        SPI全双工传输
+        
+        Args:
+            data: 要发送的数据列表
+            
+        Returns:
+            List[int]: 接收到的数据列表
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        if not data:
+            return []
+        
+        # 读取响应数据
+        try:
+            with self.read_batch() as reads:
+                result = reads.transfer(data)
+            return result.result()
+        except Exception as e:
+            log.error("SPI传输失败: %s", e)
+            
+            return []
+    
+    def spi_write_read(self, write_data: List[int], read_length: int) -> List[int]:
+        """
+        SPI写后读操作
+        
+        Args:
+            write_data: 要发送的数据
+            read_length: 要读取的字节数
+            
+        Returns:
+            List[int]: 读取到的数据
+        """
+        # 先发送数据
+        if write_data:
+            self.spi_write(write_data)
+        
+        # 再读取数据
+        return self.spi_read(read_length)
+    
+    
+    def set_gpio_pin(self, pin: int, state: bool) -> bool:
+        if pin < 0 or pin > 15:
+            raise ValueError(f"GPIO引脚超出范围: {pin}")
+        # 更新GPIO状态
+        if pin <= 7:  # 低8位
+            if state:
+                self.gpio_value_low |= (1 << pin)
+            else:
+                self.gpio_value_low &= ~(1 << pin)
+            self.gpio_direction_low |= (1 << pin)  # 设置为输出
+        else:  # 高8位
+            pin_bit = pin - 8
+            if state:
+                self.gpio_value_high |= (1 << pin_bit)
+            else:
+                self.gpio_value_high &= ~(1 << pin_bit)
+            self.gpio_direction_high |= (1 << pin_bit)  # 设置为输出
+
+        return True
+    def gpio_output(self) -> bool:
+        """
+        设置GPIO引脚状态
+        
+        Args:
+            pin: GPIO引脚 (0-15)
+            state: 状态 (True=高电平, False=低电平)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        # 发送命令
+        commands = [
+            self.CMD_SET_DATA_BITS_LOW,
+            self.gpio_value_low,
+            self.gpio_direction_low,
+            self.CMD_SET_DATA_BITS_HIGH,
+            self.gpio_value_high,
+            self.gpio_direction_high,
+        ]
+        
+        self.gpio_updates += 1
+        self._write_data(commands)
+        return True
+        
+    def gpio_high_output(self) -> bool:
+        """
+        设置GPIO引脚状态
+        
+        Args:
+            pin: GPIO引脚 (0-15)
+            state: 状态 (True=高电平, False=低电平)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        # 发送命令
+        commands = [
+            self.CMD_SET_DATA_BITS_LOW,
+            self.gpio_value_low,
+            self.gpio_direction_low,
+            self.CMD_SET_DATA_BITS_HIGH,
+            self.gpio_value_high,
+            self.gpio_direction_high,
+        ]
+        
+        self.gpio_updates += 1
+        self._write_data(commands)
+        return True
+    def set_gpio_direction(self, pin: int, direction: int) -> bool:
+        """
+        设置GPIO引脚方向
+        
+        Args:
+            pin: GPIO引脚 (0-15)
+            direction: 方向 (0=输入, 1=输出)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        if pin < 0 or pin > 15:
+            raise ValueError(f"GPIO引脚超出范围: {pin}")
+        
+        # 更新GPIO方向
+        if pin <= 7:  # 低8位
+            if direction:
+                self.gpio_direction_low |= (1 << pin)
+            else:
+                self.gpio_direction_low &= ~(1 << pin)
+        else:  # 高8位
+            pin_bit = pin - 8
+            if direction:
+                self.gpio_direction_high |= (1 << pin_bit)
+            else:
+                self.gpio_direction_high &= ~(1 << pin_bit)
+        
+        self.gpio_output() 
+        
+        return True
+    
+    def read_gpio_pin(self, pin: int) -> Optional[bool]:
+        """
+        读取GPIO引脚状态
+        
+        Args:
+            pin: GPIO引脚 (0-15)
+            
+        Returns:
+            Optional[bool]: GPIO状态，None表示读取失败
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        
+        if pin < 0 or pin > 15:
+            raise ValueError(f"GPIO引脚超出范围: {pin}")
+        
+        try:
+            # 发送读取命令
+            commands = [
+                self.CMD_READ_DATA_BITS_LOW,
+                self.CMD_READ_DATA_BITS_HIGH,
+                self.CMD_SEND_IMMEDIATE,
+            ]
+            self._write_data(commands)
+            
+            # 读取响应 (2字节：低8位和高8位)
+            response = self._read_data(2)
+            if len(response) >= 2:
+                low_byte = response[0]
+                high_byte = response[1]
+                
+                if pin <= 7:  # 低8位
+                    return bool(low_byte & (1 << pin))
+                else:  # 高8位
+                    pin_bit = pin - 8
+                    return bool(high_byte & (1 << pin_bit))
+            return None
+        except Exception as e:
+            log.error("读取GPIO%s失败: %s", pin, e)
+            return None
+    
+    def set_a0(self, state: bool) -> bool:
+        """
+        设置A0引脚状态
+        
+        Args:
+            state: 状态 (True=高电平, False=低电平)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        return self.set_gpio_pin(self.PIN_A0, state)
+    
+    def set_reset(self, state: bool) -> bool:
+        """
+        设置RESET引脚状态
+        
+        Args:
+            state: 状态 (True=高电平, False=低电平)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        return self.set_gpio_pin(self.PIN_RESET, state)
+    
+    def set_cs_main(self, state: bool) -> bool:
+        """
+        设置主CS引脚状态 (AD10)
+        
+        Args:
+            state: 状态 (True=低电平选中, False=高电平未选中)
+            
+        Returns:
+            bool: 操作是否成功
+        """
+        return self.set_gpio_pin(self.PIN_CS, state)
+    
+    def LCD_Reset(self) -> bool:
+        """
+        复位设备 (拉低RESET引脚)
+        
+        Returns:
+            bool: 操作是否成功
+        """
+        try:
+            # 拉低RESET
+            self.set_reset(False)
+            self.gpio_high_output()
+            self._sleep(0.02)  # 保持10ms
+            # 拉高RESET
+            self.set_reset(True)
+            self.gpio_high_output()
+            self._sleep(0.02)  # 等待设备稳定
+            return True
+        except Exception as e:
+            log.error("设备复位失败: %s", e)
+            return False
+        
+    def LCD_Command(self, command: int) -> bool:
+        """
+        发送LCD命令
+        
+        Args:
+            command: LCD命令
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        self.set_a0(False)  # in order to save time, only change the flag
+        self.gpio_high_output() # output a0 and cs in the same MPSSE group
+        self.set_cs_main(False) # in order to save time, only change the flag
+        self.gpio_high_output() # output a0 and cs in the same MPSSE group
+        self.spi_write([command])
+        self.set_cs_main(True) # output a0 and cs in the same MPSSE group
+        self.gpio_high_output()
+        return True
+    
+    def LCD_Data(self, data: int) -> bool:
+        """
+        发送LCD数据
+        
+        Args:
+            data: LCD数据
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        self.set_a0(True) # in order to save time, only change the flag
+        self.gpio_high_output() # output a0 and cs in the same MPSSE group
+        self.set_cs_main(False) # in order to save time, only change the flag
+        self.gpio_high_output() # output a0 and cs in the same MPSSE group
+        self.spi_write([data])
+        self.set_cs_main(True)
+        self.gpio_high_output() # output a0 and cs in the same MPSSE group
+        return True
+    
+    def LCD_DataN(self, data_list: List[int]) -> bool:
+        """
+        发送LCD数据
+        
+        Args:
+            data_list: LCD数据列表
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        self.set_a0(True) # in order to save time, only change the flag
+        self.gpio_high_output() # output a0 and cs in the same MPSSE group
+        self.set_cs_main(False) # in order to save time, only change the flag
+        self.gpio_high_output()  # output a0 and cs in the same MPSSE group
+        self.spi_write(data_list)
+        self.set_cs_main(True)  
+        self.gpio_high_output()  # output a0 and cs in the same MPSSE group
+        return True
+    
+    def LCD_ReceiveData(self) -> int:
+        """
+        从LCD读取1字节数据 (GPIO切换与读取在一次USB往返内完成)
+        """
+        return self.LCD_ReceiveDataN(1)[0]
+    
+    def LCD_ReceiveDataN(self, count: int) -> List[int]:
+        """
+        从LCD连续读取 count 字节数据 (一次USB往返)
+        
+        Args:
+            count: 字节数
+        """
+        if not self.is_connected:
+            raise Exception("设备未连接")
+        with self.read_batch() as reads:
+            result = reads.receive_data(count)
+        return result.result()
+    
+    def get_device_info(self) -> dict:
+        """获取设备信息"""
+        if not self.is_connected:
+            return {}
+        
+        try:
+            if self.use_ctypes:
+                # 使用ctypes获取设备信息
+                device_type = c_ulong()
+                device_id = c_ulong()
+                serial_number = create_string_buffer(16)
+                description = create_string_buffer(64)
+                
+                status = self.ftd2xx_dll.FT_GetDeviceInfo(
+                    self.device_handle,
+                    byref(device_type),
+                    serial_number,
+                    description,
+                    byref(device_id)
+                )
+                
+                if status == self.FT_OK:
+                    return {
+                        "device_index": self.device_index,
+                        "serial": self.serial,
+                        "device_type": device_type.value,
+                        "device_id": device_id.value,
+                        "serial_number": serial_number.value.decode('utf-8', errors='ignore'),
+                        "description": description.value.decode('utf-8', errors='ignore'),
+                        "spi_mode": self.spi_mode,
+                        "clock_speed": self.clock_speed,
+                    }
+            else:
+                # 使用ftd2xx库获取设备信息
+                info = self.device_handle.getDeviceInfo()
+                return {
+                    "device_index": self.device_index,
+                    "description": info[0],
+                    "serial_number": info[1],
+                    "device_id": info[2],
+                    "spi_mode": self.spi_mode,
+                    "clock_speed": self.clock_speed,
+                }
+        except Exception as e:
+            log.error("获取设备信息失败: %s", e)
+            return {}
+
@@ -0,0 +1,114 @@
+"""
+后台 GRAM 校验 (GramVerifier)
+按占空比在后台线程中轮流读回若干 GRAM 页，与最近刷新到 GRAM 的内容比较 CRC，重写不一致的页
+(尚未刷新的绘图不算不一致)。
+用于在较高 SCLK 下运行时发现并修复传输错误导致的花屏。
+
+用法:
+    verifier = GramVerifier(lcd, duty=0.05)    # 最多占用 5% 的时间
+    verifier.start()
+    ...
+    verifier.stop()
+    print(lcd.stats()['mismatched_pages'])
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from lcd_log import get_logger
+
+log = get_logger(__name__)
+
+
+class GramVerifier:
+    """后台 GRAM 校验"""
+
+    def __init__(self, lcd, duty: float = 0.05, pages_per_step: int = 4, repair: bool = True,
+                 on_mismatch: Optional[Callable[[List[int]], object]] = None):
+        """
+        Args:
+            lcd: PMDBLCD 驱动实例
+            duty: 校验占用时间的比例 (0~1]，每步之后按本步耗时休眠 耗时*(1-duty)/duty
+            pages_per_step: 每步校验的页数 (轮流覆盖全部页)
+            repair: 是否重写不一致的页
+            on_mismatch: 发现不一致时调用 on_mismatch(页号列表)
+        """
+        if not 0 < duty <= 1:
+            raise ValueError(f"占空比必须在 (0, 1] 之间: {duty}")
+        self.lcd = lcd
+        self.duty = duty
+        self.pages_per_step = max(1, pages_per_step)
+        self.repair = repair
+        self.on_mismatch = on_mismatch
+        self._next_page = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 统计
+        self.steps = 0
+        self.failures = 0
+        self.busy_time = 0.0
+
+    def step(self) -> Optional[List[int]]:
+        """
+        校验下一组页
+
+        Returns:
+            Optional[List[int]]: 不一致的页号，失败时为None
+        """
+        total = self.lcd.PMDB_PAGES_16
+        pages = [(self._next_page + i) % total for i in range(min(self.pages_per_step, total))]
+        self._next_page = (self._next_page + len(pages)) % total
+
+        start = time.perf_counter()
+        mismatched = self.lcd.verify_gram(pages, self.repair)
+        self.busy_time += time.perf_counter() - start
+        self.steps += 1
+        if mismatched is None:
+            self.failures += 1
+        elif mismatched and self.on_mismatch is not None:
+            self.on_mismatch(mismatched)
+        return mismatched
+
+    def _run(self):
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                self.step()
+            except Exception as e:
+                log.error("后台GRAM校验失败: %s", e)
+            elapsed = time.perf_counter() - start
+            self._stop.wait(elapsed * (1 - self.duty) / self.duty)
+
+    def start(self):
+        """启动后台校验线程"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='lcd-gram-verify', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止后台校验线程"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> Dict[str, float]:
+        """获取统计信息"""
+        return {
+            'steps': self.steps,
+            'failures': self.failures,
+            'busy_time_s': self.busy_time,
+            'duty': self.duty,
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -4,11 +4,11 @@ P3Plus LCD
 
 import os
 import time
-import msvcrt
 from typing import List, Optional, Tuple, Union
 from ctypes import (
-    windll, c_ulong, c_ubyte, c_char_p, c_void_p, c_int, POINTER, byref, create_string_buffer
+    c_ulong, c_ubyte, c_char_p, c_void_p, c_int, POINTER, byref, create_string_buffer
 )
+from lcd_scheduler import FrameScheduler
 
 # 路径配置
 os.environ['FTD2XX_DLL_DIR'] = r'C:\Users\sesa696240\Desktop\PMDB'
@@ -108,6 +108,7 @@ class FTD2XXSPIInterface:
     
     def _init_dll(self):
         """初始化DLL"""
+        from ctypes import windll  # 仅 Windows 可用，连接时才导入
         dll_names = [
             r'C:\Users\sesa696240\Desktop\PMDB\FTD2XX.DLL',
             'FTD2XX.DLL',
@@ -555,6 +556,7 @@ class PMDBLCD:
 # 主程序
 # ==========================================
 def main():
+    import msvcrt  # 仅 Windows 可用，演示程序运行时才导入
     print("LCD Driver Demo (Fixed & Optimized)")
     spi = None
     try:
@@ -583,14 +585,16 @@ def main():
         lcd.show_string(10, 10, "Fixed & Optimized!", 12)
         lcd.flush()
 
-        # 主循环
+        # 主循环 (帧调度器控制节拍: 每0.5秒一帧)
+        scheduler = FrameScheduler(lcd, fps=2)
         blink_flag = False
         while True:
             # 清除原位置字符
             lcd.show_string(10, 30, "Blinking...", 12, 0)
             # 绘制新状态字符
             lcd.show_string(10, 30, "Blinking...", 12, 1 if blink_flag else 0)
-            lcd.flush()
+            scheduler.mark_all()
+            scheduler.tick()
             
             blink_flag = not blink_flag
 
@@ -600,8 +604,6 @@ def main():
                 if key == b'\x1b':  # ESC键
                     print("退出程序...")
                     break
-            
-            time.sleep(0.5)
 
     except Exception as e:
         print(f"程序运行错误: {e}")
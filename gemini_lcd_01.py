@@ -14,11 +14,13 @@ P3PLUS LCD 驱动最终完整版
 
 import os
 import time
-import msvcrt
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 from ctypes import (
-    windll, c_ulong, c_ubyte, c_void_p, c_int, POINTER, byref
+    c_ulong, c_ubyte, c_void_p, c_int, POINTER, byref
 )
+from lcd_image import blit_image_to_buffer, glyph_columns, blit_strip_to_buffer
+from lcd_scheduler import FrameScheduler
+from lcd_text_cache import TextCache
 
 # 配置 DLL 路径
 os.environ['FTD2XX_DLL_DIR'] = r'C:\Users\sesa696240\Desktop\P3PLUS'
@@ -122,6 +124,7 @@ class FTD2XXSPIInterface:
     def _init_dll(self):
         """加载 FTD2XX.DLL 并定义 ctypes 函数原型"""
         try:
+            from ctypes import windll  # 仅 Windows 可用，连接时才导入
             dll_paths = [r'C:\Users\sesa696240\Desktop\P3PLUS\FTD2XX.DLL', 'FTD2XX.DLL', 'ftd2xx.dll']
             self.ftd2xx_dll = None
             for path in dll_paths:
@@ -274,7 +277,9 @@ class P3PLUSLCD:
     def __init__(self, spi_interface: FTD2XXSPIInterface):
         self.spi = spi_interface
         # 显存缓冲区: 128列 * 16页 = 2048 Bytes
-        self.display_buffer = [0] * (self.P3PLUS_PAGES_16 * self.P3PLUS_COLS)
+        self.display_buffer = bytearray(self.P3PLUS_PAGES_16 * self.P3PLUS_COLS)
+        # 文字条带 LRU 缓存: 静态标签重绘只需按页切片写入
+        self.text_cache = TextCache()
         
     def P3PLUS_init(self) -> bool:
         """初始化 UC1638 控制器寄存器"""
@@ -352,9 +357,21 @@ class P3PLUSLCD:
     def clear_screen(self, color: int = 0) -> bool:
         """清空显存"""
         val = 0xFF if color else 0x00
-        self.display_buffer = [val] * (self.P3PLUS_PAGES_16 * self.P3PLUS_COLS)
+        self.display_buffer[:] = bytes([val]) * len(self.display_buffer)
         return True
 
+    def blit_image(self, img, x: int = 0, y: int = 0, invert: bool = False) -> bool:
+        """
+        图像快速写入: 1bit 图像/bool 数组经 packbits 向量化打包为页格式，
+        直接合并进显存 (支持任意 y 偏移与越界裁剪)。
+        """
+        try:
+            blit_image_to_buffer(self.display_buffer, self.P3PLUS_COLS, self.P3PLUS_ROWS, img, x, y, invert)
+            return True
+        except Exception as e:
+            print(f"图像写入失败: {str(e)}")
+            return False
+
     def lcd_draw_point(self, x: int, y: int, color: int) -> bool:
         """画点逻辑: 计算 Page 和 Bit 偏移"""
         if x < 0 or x >= self.P3PLUS_COLS or y < 0 or y >= self.P3PLUS_ROWS: return False
@@ -460,7 +477,27 @@ class P3PLUSLCD:
                     self.lcd_draw_point(x + j, y + i, bc)
         return True
 
+    def get_char_columns(self, char: str, size: int) -> Optional[Tuple[List[int], int, int]]:
+        """字形按列位掩码 (columns, 宽, 高)，用于预渲染条带；仅支持 12 号字体"""
+        if size != 12: return None
+        return glyph_columns(LCDFonts.get_ascii_1206_font(ord(char)), 6), 6, 12
+
+    def strip_shift(self, y: int) -> int:
+        """行 y 在页内的行偏移"""
+        return y & 0x7
+
+    def blit_strip(self, strip, x: int, y: int) -> bool:
+        """
+        预渲染条带整页写入: 每页一次切片赋值/整数掩码合并，替代逐点 lcd_draw_point。
+        纵向越界或行偏移不符时返回 False。
+        """
+        if y < 0 or y + strip.height > self.P3PLUS_ROWS or strip.shift != (y & 0x7): return False
+        blit_strip_to_buffer(self.display_buffer, self.P3PLUS_COLS, strip, x, y >> 3, self.P3PLUS_PAGES_16)
+        return True
+
     def lcd_show_string(self, x: int, y: int, text: str, fc: int, bc: int, size: int, mode: int = 0) -> bool:
+        if self.text_cache is not None and self.text_cache.draw(self, x, y, text, fc, bc, size, mode):
+            return True
         for char in text:
             self.lcd_show_char(x, y, char, fc, bc, size, mode)
             x += size // 2 # 移动光标
@@ -512,6 +549,7 @@ class P3PLUSLCD:
 # 4. 主程序入口
 # ============================================================================
 def main():
+    import msvcrt  # 仅 Windows 可用，演示程序运行时才导入
     print("P3PLUS LCD 图案切换演示程序")
     print("-----------------------------------")
     print("状态 1: 几何图形与文字演示")
@@ -526,6 +564,7 @@ def main():
         print("错误: 无法连接 FTDI 设备，请检查 USB 连接或驱动。")
         return
     
+    scheduler = None
     try:
         lcd = P3PLUSLCD(spi)
         if not lcd.P3PLUS_init():
@@ -540,6 +579,8 @@ def main():
         STATE_SPLIT = 2
         
         current_state = STATE_DEMO
+        # 帧调度器: 10Hz 节拍 (兼作 ESC 按键轮询周期)，每个状态只刷新一次
+        scheduler = FrameScheduler(lcd, fps=10)
         
         while True:
             # 记录本轮状态开始时间
@@ -555,27 +596,27 @@ def main():
                 lcd.lcd_show_string(10, 60, "Hello", 1, 0, 12, 1)
                 lcd.lcd_show_string(10, 80, "P3PLUS LCD", 1, 0, 12, 1)
                 lcd.lcd_show_int_num(10, 100, 12345, 5, 1, 0, 12)
-                lcd.lcd_flush()
+                scheduler.mark_all()
                 
             elif current_state == STATE_CHECKERBOARD:
                 print(f"[{time.strftime('%H:%M:%S')}] 切换至: 棋盘格")
                 lcd.draw_checkerboard()
-                lcd.lcd_flush()
+                scheduler.mark_all()
                 
             elif current_state == STATE_SPLIT:
                 print(f"[{time.strftime('%H:%M:%S')}] 切换至: 分屏显示")
                 lcd.draw_split_screen()
-                lcd.lcd_flush()
+                scheduler.mark_all()
             
             # --- 延时循环 (5秒) ---
-            # 使用 0.1s 短延时轮询，确保 ESC 键能被及时响应，而不是阻塞 sleep 5秒
+            # 每帧轮询一次 ESC 键，脏标记在第一帧被刷新，之后的帧不产生传输
             exit_flag = False
             while (time.time() - start_time) < 5.0:
+                scheduler.tick()
                 if msvcrt.kbhit():
                     if msvcrt.getch() == b'\x1b': # ESC ASCII Code
                         exit_flag = True
                         break
-                time.sleep(0.1)
             
             if exit_flag:
                 print("检测到 ESC 键，程序退出。")
@@ -592,6 +633,8 @@ def main():
     finally:
         spi.disconnect()
         print("SPI 连接已安全断开。")
+        if scheduler is not None:
+            print(f"帧统计: {scheduler.stats()}")
 
 if __name__ == "__main__":
     main()
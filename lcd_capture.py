@@ -0,0 +1,262 @@
+"""
+MPSSE 录制与回放
+录制每次USB写入的原始 MPSSE 数据与时间戳，之后通过真实设备或模拟器回放，
+以固定的工作负载比较不同驱动版本的写入次数、字节数与耗时。
+
+文件格式 (小端):
+    文件头: 魔数 'MPSSECAP', 版本 (2字节), 录制开始时间 (8字节 double, Unix 时间)
+    记录:   距上一条记录的间隔 (4字节, 微秒) + 长度 (4字节) + 数据
+
+录制:
+    spi.start_capture('demo.cap')           # FTD2XXSPIInterface
+    capture_method(driver, '_write_raw', 'mirror.cap')   # bluebrid 驱动等任意写函数
+
+回放:
+    python lcd_capture.py info demo.cap
+    python lcd_capture.py replay demo.cap --emulate
+    python lcd_capture.py replay demo.cap --device-index 0 --timing original
+"""
+
+import argparse
+import json
+import struct
+import time
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+MAGIC = b'MPSSECAP'
+VERSION = 1
+FILE_HEADER = struct.Struct('<8sHd')
+RECORD_HEADER = struct.Struct('<II')
+_MAX_DELTA_US = 0xFFFFFFFF
+
+
+class CaptureWriter:
+    """录制文件写入器"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'wb')
+        self.started = time.time()
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, self.started))
+        self._last = time.perf_counter()
+
+        # 统计
+        self.writes = 0
+        self.bytes = 0
+
+    def write(self, data: bytes):
+        """记录一次写入"""
+        now = time.perf_counter()
+        delta_us = min(_MAX_DELTA_US, int((now - self._last) * 1000000))
+        self._last = now
+        self._file.write(RECORD_HEADER.pack(delta_us, len(data)))
+        self._file.write(data)
+        self.writes += 1
+        self.bytes += len(data)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_capture(path: str) -> Iterator[Tuple[float, bytes]]:
+    """
+    读取录制文件
+
+    Yields:
+        (距录制开始的时间 (秒), 数据)
+    """
+    with open(path, 'rb') as f:
+        header = f.read(FILE_HEADER.size)
+        if len(header) != FILE_HEADER.size:
+            raise Exception(f"录制文件头不完整: {path}")
+        magic, version, _ = FILE_HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise Exception(f"不是录制文件或版本不支持: {path}")
+
+        t = 0.0
+        while True:
+            record = f.read(RECORD_HEADER.size)
+            if len(record) < RECORD_HEADER.size:
+                return
+            delta_us, length = RECORD_HEADER.unpack(record)
+            data = f.read(length)
+            if len(data) < length:
+                return  # 录制中断时最后一条不完整
+            t += delta_us / 1000000
+            yield t, data
+
+
+def capture_info(path: str) -> Dict[str, float]:
+    """录制文件摘要: 写入次数、字节数、时长"""
+    writes = 0
+    total = 0
+    largest = 0
+    duration = 0.0
+    for t, data in read_capture(path):
+        writes += 1
+        total += len(data)
+        largest = max(largest, len(data))
+        duration = t
+    return {
+        'writes': writes,
+        'bytes': total,
+        'max_write': largest,
+        'duration_s': duration,
+    }
+
+
+def capture_method(obj, name: str, path: str) -> CaptureWriter:
+    """
+    录制任意对象的写函数 (如 bluebrid 驱动的 _write_raw)
+
+    替换实例上的方法: 先记录数据再调用原方法。调用 writer.close() 结束录制。
+
+    Args:
+        obj: 驱动实例
+        name: 写函数名，第一个参数为要写入的数据
+        path: 录制文件路径
+    """
+    writer = CaptureWriter(path)
+    original = getattr(obj, name)
+
+    def recorded(data, *args, **kwargs):
+        if not writer._file.closed:
+            writer.write(bytes(data))
+        return original(data, *args, **kwargs)
+
+    setattr(obj, name, recorded)
+    return writer
+
+
+def _replay_target(backend) -> Tuple[Callable, Callable]:
+    """
+    回放目标的写函数与接收队列排空函数
+
+    FTD2XXSPIInterface 已处于 MPSSE 模式；原始设备句柄/模拟器先复位并切换到
+    MPSSE 模式 (与 FTD2XXSPIInterface 连接时相同)，否则写入不会被当作命令解析。
+    """
+    if hasattr(backend, '_write_data'):
+        def drain():
+            pending = backend._queue_status()
+            if pending:
+                backend._read_data(pending)
+        return backend._write_data, drain
+
+    backend.setBitMode(0x00, 0x00)  # 复位
+    backend.setBitMode(0x00, 0x02)  # MPSSE模式
+    backend.purge(0x01 | 0x02)
+
+    def drain():
+        pending = backend.getQueueStatus()
+        if pending:
+            backend.read(pending)
+    return backend.write, drain
+
+
+def replay(path: str, backend, timing: str = 'max', speed: float = 1.0,
+           chunk: Optional[int] = None) -> Dict[str, float]:
+    """
+    回放录制文件
+
+    Args:
+        path: 录制文件路径
+        backend: 已连接的 FTD2XXSPIInterface，或 ftd2xx 设备句柄/模拟器 (回放前切换到 MPSSE 模式)
+        timing: 'max'=尽快发送; 'original'=按录制时的间隔发送
+        speed: original 模式下的速度倍数
+        chunk: 把连续写入合并到不超过 chunk 字节后再发送 (仅 max 模式，None=按原样)
+
+    Returns:
+        Dict[str, float]: 写入次数、字节数、回放耗时与录制时长
+    """
+    if timing not in ('max', 'original'):
+        raise ValueError(f"不支持的回放时序: {timing}")
+    write, drain = _replay_target(backend)
+
+    writes = 0
+    total = 0
+    duration = 0.0
+    pending = bytearray()
+    start = time.perf_counter()
+    for t, data in read_capture(path):
+        duration = t
+        total += len(data)
+        if timing == 'original':
+            delay = start + t / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        elif chunk:
+            if len(pending) + len(data) > chunk and pending:
+                write(bytes(pending))
+                drain()
+                writes += 1
+                pending.clear()
+            pending += data
+            continue
+        write(data)
+        # 录制中的读命令 (回环探测、读 GRAM 等) 会产生回读数据，及时取走以免占满接收缓冲区
+        drain()
+        writes += 1
+    if pending:
+        write(bytes(pending))
+        writes += 1
+    drain()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'writes': writes,
+        'bytes': total,
+        'wall_time_s': elapsed,
+        'captured_s': duration,
+        'throughput_Bps': total / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MPSSE 录制文件查看与回放')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    info = sub.add_parser('info', help='显示录制文件摘要')
+    info.add_argument('capture')
+
+    play = sub.add_parser('replay', help='回放录制文件')
+    play.add_argument('capture')
+    play.add_argument('--emulate', action='store_true', help='回放到 MPSSE 模拟器')
+    play.add_argument('--device-index', type=int, default=0, help='FTDI 设备索引')
+    play.add_argument('--serial', help='按序列号打开设备')
+    play.add_argument('--timing', choices=('max', 'original'), default='max')
+    play.add_argument('--speed', type=float, default=1.0)
+    play.add_argument('--chunk', type=int, default=None, help='合并写入的最大字节数')
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        print(json.dumps(capture_info(args.capture), indent=2))
+        return
+
+    from gemini_lcd import FTD2XXSPIInterface
+    emulator = None
+    if args.emulate:
+        from ftdi_emulator import FTDIEmulator
+        emulator = FTDIEmulator()
+    spi = FTD2XXSPIInterface(device_index=args.device_index, use_ctypes=True,
+                             serial=args.serial, backend=emulator)
+    if not spi.connect():
+        print("设备连接失败")
+        return
+    try:
+        result = replay(args.capture, spi, args.timing, args.speed, args.chunk)
+        if emulator is not None:
+            result['emulator'] = emulator.stats()
+        print(json.dumps(result, indent=2))
+    finally:
+        spi.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+"""
+中文点阵字库 (内存映射)
+字库文件通过 mmap 只读映射，按需取字，不把数 MB 的文件读入内存；
+最近使用的字形解码为按列位掩码后放入一个小的 LRU 缓存。
+
+支持两种文件格式:
+- HZK (GB2312 区位码排列，如 HZK12/HZK16/HZK24): 偏移 = (94 * (区-1) + (位-1)) * 每字字节数，
+  每行 ceil(size/8) 字节，高位在左。HZK24S/K/H 等为按列取模且从第16区开始，
+  使用 column_major=True, first_zone=16。
+- Unicode 字库 (font_compiler.py --cjk 生成): 文件头 + 按码点直接寻址的索引表 + 页格式字形，
+  码点 -> 偏移为 O(1) 查表。
+
+用法:
+    register_font(16, 'HZK16')            # HZK 格式
+    register_font(24, 'cjk24.bin')        # Unicode 字库 (按文件头自动识别)
+    lcd.lcd_show_chinese(0, 0, "温度", 1, 0, 16)
+"""
+
+import mmap
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+STORE_MAGIC = b'LCDCJK1\0'
+# 文件头: 魔数, 字号, 首码点, 末码点, 字形数
+STORE_HEADER = struct.Struct('<8sHIII')
+STORE_MISSING = 0xFFFFFFFF
+
+
+class CJKFont:
+    """内存映射的中文点阵字库"""
+
+    def __init__(self, path: str, size: int = 16, column_major: bool = False,
+                 first_zone: int = 1, cache_size: int = 256):
+        """
+        Args:
+            path: 字库文件路径
+            size: 字号 (字形为 size x size)，Unicode 字库以文件头为准
+            column_major: HZK 文件是否按列取模 (HZK24S 等)
+            first_zone: HZK 文件的起始区号 (HZK24 系列为16)
+            cache_size: 解码字形的 LRU 缓存条数
+        """
+        self.path = path
+        self.size = size
+        self.column_major = column_major
+        self.first_zone = first_zone
+        self.cache_size = cache_size
+
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        self._cache: "OrderedDict[str, Optional[Tuple[int, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self._map[:len(STORE_MAGIC)] == STORE_MAGIC:
+            self.format = 'store'
+            _, self.size, self.first_cp, self.last_cp, self.count = STORE_HEADER.unpack_from(self._map, 0)
+            self._index_offset = STORE_HEADER.size
+            self._glyph_offset = self._index_offset + (self.last_cp - self.first_cp + 1) * 4
+            self.glyph_bytes = self.size * ((self.size + 7) >> 3)
+        else:
+            self.format = 'hzk'
+            self.row_bytes = (self.size + 7) >> 3
+            self.glyph_bytes = self.row_bytes * self.size
+            self.count = len(self._map) // self.glyph_bytes
+
+    def close(self):
+        """关闭映射"""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # 码点 -> 偏移
+    # ------------------------------------------------------------------
+    def _offset(self, char: str) -> Optional[int]:
+        """字形在文件中的偏移，字库中没有该字时返回None"""
+        if self.format == 'store':
+            cp = ord(char)
+            if not self.first_cp <= cp <= self.last_cp:
+                return None
+            (glyph,) = struct.unpack_from('<I', self._map, self._index_offset + (cp - self.first_cp) * 4)
+            if glyph == STORE_MISSING:
+                return None
+            return self._glyph_offset + glyph * self.glyph_bytes
+
+        try:
+            code = char.encode('gb2312')
+        except UnicodeEncodeError:
+            return None
+        if len(code) != 2:
+            return None
+        zone = code[0] - 0xA0
+        pos = code[1] - 0xA0
+        index = 94 * (zone - self.first_zone) + (pos - 1)
+        if index < 0 or index >= self.count:
+            return None
+        return index * self.glyph_bytes
+
+    # ------------------------------------------------------------------
+    # 解码
+    # ------------------------------------------------------------------
+    def _decode(self, offset: int) -> Tuple[int, ...]:
+        size = self.size
+        data = self._map[offset:offset + self.glyph_bytes]
+
+        if self.format == 'store':
+            # 页格式: 第 k 页第 j 列的字节
+            pages = (size + 7) >> 3
+            return tuple(
+                int.from_bytes(bytes(data[k * size + j] for k in range(pages)), 'little')
+                for j in range(size)
+            )
+
+        row_bytes = self.row_bytes
+        nbits = row_bytes * 8
+        if self.column_major:
+            # 每列 row_bytes 字节，高位在上
+            return tuple(
+                _reverse_bits(int.from_bytes(data[j * row_bytes:(j + 1) * row_bytes], 'big'), nbits)
+                for j in range(size)
+            )
+
+        # 每行 row_bytes 字节，高位在左 -> 转置为按列
+        columns = [0] * size
+        for i in range(size):
+            row = int.from_bytes(data[i * row_bytes:(i + 1) * row_bytes], 'big')
+            if not row:
+                continue
+            for j in range(size):
+                if row & (1 << (nbits - 1 - j)):
+                    columns[j] |= 1 << i
+        return tuple(columns)
+
+    def get_columns(self, char: str) -> Optional[Tuple[int, ...]]:
+        """
+        获取字形的按列位掩码 (bit i = 第i行)，字库中没有该字时返回None
+        """
+        with self._lock:
+            if char in self._cache:
+                self._cache.move_to_end(char)
+                self.hits += 1
+                return self._cache[char]
+
+            self.misses += 1
+            offset = self._offset(char)
+            columns = None if offset is None else self._decode(offset)
+            self._cache[char] = columns
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return columns
+
+    def get_rows(self, char: str) -> List[int]:
+        """
+        获取字形的按行取模数据 (每行一个整数，bit0 为最左列，与 LCDFonts 约定一致)
+        字库中没有该字时返回全0
+        """
+        columns = self.get_columns(char)
+        rows = [0] * self.size
+        if columns is None:
+            return rows
+        for j, col in enumerate(columns):
+            for i in range(self.size):
+                if (col >> i) & 1:
+                    rows[i] |= 1 << j
+        return rows
+
+
+def _reverse_bits(value: int, nbits: int) -> int:
+    result = 0
+    for _ in range(nbits):
+        result = (result << 1) | (value & 1)
+        value >>= 1
+    return result
+
+
+def write_store(path: str, size: int, glyphs: Dict[int, List[int]]):
+    """
+    写入 Unicode 字库文件
+
+    Args:
+        path: 输出路径
+        size: 字号
+        glyphs: 码点 -> 按列位掩码 (size 列)
+    """
+    codepoints = sorted(glyphs)
+    first_cp, last_cp = codepoints[0], codepoints[-1]
+    index = [STORE_MISSING] * (last_cp - first_cp + 1)
+    pages = (size + 7) >> 3
+
+    data = bytearray()
+    for number, cp in enumerate(codepoints):
+        index[cp - first_cp] = number
+        columns = glyphs[cp]
+        for k in range(pages):
+            data.extend((col >> (k << 3)) & 0xFF for col in columns)
+
+    with open(path, 'wb') as f:
+        f.write(STORE_HEADER.pack(STORE_MAGIC, size, first_cp, last_cp, len(codepoints)))
+        f.write(struct.pack(f'<{len(index)}I', *index))
+        f.write(data)
+
+
+# ==========================================
+# 按字号注册的字库 (供 LCDFonts.get_chinese_* 与驱动使用)
+# ==========================================
+
+_FONTS: Dict[int, CJKFont] = {}
+
+
+def register_font(size: int, font, **kwargs) -> CJKFont:
+    """
+    注册某字号的中文字库
+
+    Args:
+        size: 字号 (12/16/24/32)
+        font: CJKFont 实例或字库文件路径
+        **kwargs: 传给 CJKFont 的参数 (column_major, first_zone, cache_size)
+    """
+    if not isinstance(font, CJKFont):
+        font = CJKFont(font, size, **kwargs)
+    _FONTS[size] = font
+    return font
+
+
+def get_font(size: int) -> Optional[CJKFont]:
+    """获取已注册的字库"""
+    return _FONTS.get(size)
+
+
+def chinese_columns(size: int, char: str) -> Optional[Tuple[int, ...]]:
+    """按列位掩码，未注册字库或字库中没有该字时返回None"""
+    font = _FONTS.get(size)
+    return font.get_columns(char) if font is not None else None
+
+
+def chinese_rows(size: int, char) -> List[int]:
+    """
+    按行取模数据，未注册字库或字库中没有该字时返回全0
+
+    Args:
+        char: 字符 (str) 或其 UTF-8 字节
+    """
+    if isinstance(char, (bytes, bytearray)):
+        char = char.decode('utf-8')
+    font = _FONTS.get(size)
+    return font.get_rows(char) if font is not None else [0] * size
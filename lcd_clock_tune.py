@@ -0,0 +1,236 @@
+"""
+SCLK 自动调优
+按分频值从快到慢扫描 (SCLK = 60MHz / ((1 + 分频) * 2))，每档写入若干测试图案并校验
+(默认读回 GRAM 比较，也可传入自定义校验函数，例如人工确认或外部采集)，
+找出连续稳定区间中最快的一档，按余量退后若干档后选定，并按设备序列号保存。
+
+用法:
+    python lcd_clock_tune.py --serial FT6ZK1A
+    python lcd_clock_tune.py --emulate --error-above 15000000     # 模拟 15MHz 以上出错
+    python lcd_clock_tune.py --serial FT6ZK1A -o report.json --rounds 3 --margin 1
+
+    from lcd_clock_tune import tune, apply_saved
+    result = tune(spi, lcd)            # 扫描并保存
+    apply_saved(spi)                   # 之后连接时直接使用保存的分频
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from lcd_log import get_logger
+
+log = get_logger(__name__)
+
+# 保存文件 (环境变量 LCD_CLOCK_FILE 覆盖)
+DEFAULT_STORE = os.path.join(os.path.expanduser('~'), '.gemini_lcd_clock.json')
+
+# 默认扫描的分频值: 30, 15, 10, 7.5, 6, 5, 4.29, 3.75, 3, 2, 1 MHz
+DEFAULT_DIVISORS = (0, 1, 2, 3, 4, 5, 6, 7, 9, 14, 29)
+
+
+def _store_path(path: Optional[str]) -> str:
+    return path or os.environ.get('LCD_CLOCK_FILE', DEFAULT_STORE)
+
+
+def test_patterns(size: int, seed: int = 0) -> Dict[str, bytes]:
+    """测试图案: 交替位、递增字节、随机数据 (暴露串扰、位移与随机位错)"""
+    rng = random.Random(seed)
+    return {
+        'checker': bytes((0x55, 0xAA)) * (size // 2),
+        'ramp': bytes(range(256)) * (size // 256),
+        'random': bytes(rng.getrandbits(8) for _ in range(size)),
+    }
+
+
+def readback_checker(lcd) -> bool:
+    """读回全部 GRAM 页，与显示缓冲区比较"""
+    readback = lcd.read_gram_pages(range(lcd.PMDB_PAGES_16))
+    buffer = lcd.display_buffer
+    cols = lcd.PMDB_COLS
+    return all(readback[page] == buffer[page * cols:(page + 1) * cols] for page in readback)
+
+
+def device_serial(spi) -> str:
+    """设备序列号 (打开时指定的序列号，否则从设备信息读取)"""
+    if getattr(spi, 'serial', None):
+        return spi.serial
+    info = spi.get_device_info()
+    return str(info.get('serial_number') or f"index{getattr(spi, 'device_index', 0)}")
+
+
+def tune(spi, lcd, checker: Optional[Callable[[object], bool]] = None,
+         divisors: Iterable[int] = DEFAULT_DIVISORS, rounds: int = 2, margin: int = 1,
+         save: bool = True, store: Optional[str] = None) -> Dict[str, object]:
+    """
+    扫描分频值并选定最快的稳定档
+
+    Args:
+        spi: 已连接的 FTD2XXSPIInterface
+        lcd: 已初始化的 PMDBLCD
+        checker: checker(lcd) -> bool，在每次写入图案后调用 (默认读回 GRAM 比较)
+        divisors: 扫描的分频值
+        rounds: 每档每个图案写入校验的次数
+        margin: 选定时从最快稳定档再退后的档数
+        save: 是否按序列号保存结果
+        store: 保存文件路径
+
+    Returns:
+        Dict[str, object]: 各档结果、选定的分频与频率 (没有稳定档时 divisor 为 None)
+    """
+    checker = checker or readback_checker
+    divisors = sorted(set(divisors))
+    original_buffer = bytes(lcd.display_buffer)
+    original_divisor = spi.clock_divisor
+    patterns = test_patterns(len(lcd.display_buffer))
+
+    sweep: List[Dict[str, object]] = []
+    chosen = None
+    try:
+        for divisor in divisors:
+            spi.set_clock_divisor(divisor)
+            passed = 0
+            failed = 0
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for pattern in patterns.values():
+                    lcd.display_buffer[:] = pattern
+                    ok = lcd.lcd_flush()
+                    try:
+                        ok = ok and checker(lcd)
+                    except Exception as e:
+                        log.error("校验失败 (分频 %s): %s", divisor, e)
+                        ok = False
+                    if ok:
+                        passed += 1
+                    else:
+                        failed += 1
+            sweep.append({
+                'divisor': divisor,
+                'clock_hz': spi.clock_for_divisor(divisor),
+                'passed': passed,
+                'failed': failed,
+                'time_s': time.perf_counter() - start,
+            })
+            log.info("分频 %3d (%6.2f MHz): %s", divisor, spi.clock_for_divisor(divisor) / 1e6,
+                     '通过' if not failed else f'失败 {failed}/{passed + failed}')
+
+        # 从最慢一档往快找连续通过的区间，取其最快一档再退后 margin 档
+        stable = None
+        for index in range(len(sweep) - 1, -1, -1):
+            if sweep[index]['failed']:
+                break
+            stable = index
+        chosen = None if stable is None else sweep[min(len(sweep) - 1, stable + margin)]
+    finally:
+        # 中途出错或被中断时恢复原分频，不停留在最后扫描的 (可能出错的) 档
+        lcd.display_buffer[:] = original_buffer
+        spi.set_clock_divisor(chosen['divisor'] if chosen else original_divisor)
+        lcd.lcd_flush()
+
+    result = {
+        'serial': device_serial(spi),
+        'sweep': sweep,
+        'fastest_stable_hz': sweep[stable]['clock_hz'] if stable is not None else None,
+        'divisor': chosen['divisor'] if chosen else None,
+        'clock_hz': chosen['clock_hz'] if chosen else None,
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+    if chosen and save:
+        save_divisor(result['serial'], result, store)
+    return result
+
+
+def load_store(store: Optional[str] = None) -> Dict[str, dict]:
+    """读取保存文件 (序列号 -> 结果)"""
+    path = _store_path(store)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_divisor(serial: str, result: Dict[str, object], store: Optional[str] = None):
+    """按序列号保存选定的分频"""
+    data = load_store(store)
+    data[serial] = {
+        'divisor': result['divisor'],
+        'clock_hz': result['clock_hz'],
+        'fastest_stable_hz': result.get('fastest_stable_hz'),
+        'time': result.get('time'),
+    }
+    path = _store_path(store)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_divisor(serial: str, store: Optional[str] = None) -> Optional[int]:
+    """保存的分频值 (没有时为None)"""
+    entry = load_store(store).get(serial)
+    return entry['divisor'] if entry else None
+
+
+def apply_saved(spi, store: Optional[str] = None) -> bool:
+    """
+    对已连接的接口应用保存的分频
+
+    Returns:
+        bool: 是否找到并应用了保存的分频
+    """
+    divisor = load_divisor(device_serial(spi), store)
+    if divisor is None:
+        return False
+    return spi.set_clock_divisor(divisor)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SCLK 自动调优 (按设备序列号保存最快的稳定分频)')
+    parser.add_argument('--device-index', type=int, default=0, help='FTDI 设备索引')
+    parser.add_argument('--serial', help='按序列号打开设备')
+    parser.add_argument('--emulate', action='store_true', help='使用 MPSSE 模拟器与 UC1638 模型')
+    parser.add_argument('--error-above', type=float, default=15000000,
+                        help='模拟器: SCLK 高于该频率时写入出错 (Hz)')
+    parser.add_argument('--divisors', type=int, nargs='+', default=list(DEFAULT_DIVISORS), help='扫描的分频值')
+    parser.add_argument('--rounds', type=int, default=2, help='每档每个图案的次数')
+    parser.add_argument('--margin', type=int, default=1, help='从最快稳定档退后的档数')
+    parser.add_argument('--store', help='保存文件 (默认 ~/.gemini_lcd_clock.json)')
+    parser.add_argument('--no-save', action='store_true', help='不保存结果')
+    parser.add_argument('-o', '--output', help='扫描报告 JSON 路径')
+    args = parser.parse_args()
+
+    from gemini_lcd import FTD2XXSPIInterface, PMDBLCD
+    emulator = None
+    if args.emulate:
+        from ftdi_emulator import FTDIEmulator, UC1638Model
+        emulator = FTDIEmulator()
+        UC1638Model(emulator, error_rate=0.001, max_clock_hz=args.error_above)
+    spi = FTD2XXSPIInterface(device_index=args.device_index, use_ctypes=True,
+                             serial=args.serial, backend=emulator)
+    if not spi.connect():
+        print("设备连接失败")
+        return
+    try:
+        lcd = PMDBLCD(spi)
+        if not lcd.pmdb_init():
+            print("LCD初始化失败")
+            return
+        result = tune(spi, lcd, divisors=args.divisors, rounds=args.rounds, margin=args.margin,
+                      save=not args.no_save and emulator is None, store=args.store)
+        if result['divisor'] is None:
+            print("没有稳定的分频档")
+        else:
+            print(f"最快稳定: {result['fastest_stable_hz'] / 1e6:.2f} MHz, "
+                  f"选定: 分频 {result['divisor']} ({result['clock_hz'] / 1e6:.2f} MHz)")
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2)
+    finally:
+        spi.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,391 @@
+"""
+LCD 显示守护进程
+常驻进程持有已连接的 FTD2XXSPIInterface 与已初始化的 PMDBLCD，
+通过本地 socket 接收整帧/脏区域/对比度/统计请求，短生命周期的客户端脚本
+无需重新打开设备、复位 MPSSE 与重新初始化屏幕即可更新显示。
+
+默认使用 Unix 域 socket (/tmp/gemini_lcd.sock)；平台不支持 AF_UNIX 时
+退回 127.0.0.1:47800 的 TCP。
+
+协议 (小端):
+    请求: 操作码 (1字节) + 负载长度 (4字节) + 负载
+    应答: 状态 (1字节, 0=成功) + 负载长度 (4字节) + 负载 (统计为 JSON，失败为错误信息)
+
+    OP_FRAME    整帧页格式数据 (页数*列数 字节)
+    OP_RECT     x1, y1, x2, y2 (各1字节) + 覆盖区域的页数据 (页优先, 每页 x2-x1+1 字节)
+    OP_CONTRAST 对比度 (1字节)
+    OP_STATS    无负载，返回统计 JSON
+    OP_PING     无负载
+
+用法:
+    python lcd_daemon.py                     # 启动守护进程
+    python lcd_daemon.py --tcp 47800         # 使用 TCP
+
+    client = LCDClient()
+    client.push_frame(frame)
+    client.push_rect(10, 20, 57, 35, lcd_buffer)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+OP_FRAME = 1
+OP_RECT = 2
+OP_CONTRAST = 3
+OP_STATS = 4
+OP_PING = 5
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+HEADER = struct.Struct('<BI')
+RECT_HEADER = struct.Struct('<BBBB')
+
+DEFAULT_SOCKET = '/tmp/gemini_lcd.sock'
+DEFAULT_TCP = ('127.0.0.1', 47800)
+
+Address = Union[str, Tuple[str, int]]
+
+
+def default_address() -> Address:
+    """平台支持 AF_UNIX 时使用 Unix 域 socket，否则使用本机 TCP"""
+    return DEFAULT_SOCKET if hasattr(socket, 'AF_UNIX') else DEFAULT_TCP
+
+
+def _recv_exact(sock: socket.socket, length: int) -> bytes:
+    """读取定长数据，对端关闭时抛出 ConnectionError"""
+    buf = bytearray(length)
+    view = memoryview(buf)
+    got = 0
+    while got < length:
+        n = sock.recv_into(view[got:], length - got)
+        if n == 0:
+            raise ConnectionError("连接已关闭")
+        got += n
+    return bytes(buf)
+
+
+def _cols_rows(lcd) -> Tuple[int, int]:
+    for cols, rows in (('PMDB_COLS', 'PMDB_ROWS'), ('P3PLUS_COLS', 'P3PLUS_ROWS')):
+        if hasattr(lcd, cols):
+            return getattr(lcd, cols), getattr(lcd, rows)
+    return 128, 128
+
+
+# ==========================================
+# 守护进程
+# ==========================================
+
+class _Handler(socketserver.BaseRequestHandler):
+    """每个客户端连接一个处理线程，同一连接上可连续发送多个请求"""
+
+    def handle(self):
+        daemon = self.server.daemon_ref
+        daemon.clients += 1
+        sock = self.request
+        try:
+            while True:
+                try:
+                    op, length = HEADER.unpack(_recv_exact(sock, HEADER.size))
+                    payload = _recv_exact(sock, length) if length else b''
+                except ConnectionError:
+                    return
+
+                try:
+                    reply = daemon.dispatch(op, payload)
+                    sock.sendall(HEADER.pack(STATUS_OK, len(reply)) + reply)
+                except Exception as e:
+                    message = str(e).encode('utf-8')
+                    sock.sendall(HEADER.pack(STATUS_ERROR, len(message)) + message)
+        finally:
+            daemon.clients -= 1
+
+
+if hasattr(socket, 'AF_UNIX'):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LCDDaemon:
+    """持有 LCD 驱动的显示守护进程"""
+
+    def __init__(self, lcd, address: Optional[Address] = None):
+        """
+        Args:
+            lcd: 已初始化的 LCD 驱动实例 (PMDBLCD)
+            address: Unix socket 路径或 (主机, 端口)，默认见 default_address()
+        """
+        self.lcd = lcd
+        self.address = address or default_address()
+        self.cols, self.rows = _cols_rows(lcd)
+        self.frame_size = self.cols * self.rows // 8
+        self._lock = threading.Lock()
+        self._server = None
+
+        # 统计
+        self.started = time.time()
+        self.clients = 0
+        self.requests = 0
+        self.frames = 0
+        self.rects = 0
+        self.bytes_received = 0
+        self.busy_time = 0.0
+
+    # ------------------------------------------------------------------
+    # 请求处理
+    # ------------------------------------------------------------------
+    def dispatch(self, op: int, payload: bytes) -> bytes:
+        """处理一个请求，返回应答负载"""
+        start = time.perf_counter()
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += len(payload)
+            try:
+                if op == OP_FRAME:
+                    self._push_frame(payload)
+                elif op == OP_RECT:
+                    self._push_rect(payload)
+                elif op == OP_CONTRAST:
+                    if len(payload) != 1 or not self.lcd.set_contrast(payload[0]):
+                        raise Exception("设置对比度失败")
+                elif op == OP_STATS:
+                    return json.dumps(self.stats()).encode('utf-8')
+                elif op == OP_PING:
+                    pass
+                else:
+                    raise Exception(f"未知操作码: {op}")
+                return b''
+            finally:
+                self.busy_time += time.perf_counter() - start
+
+    def _lcd_lock(self):
+        """驱动的刷新锁 (与 GramVerifier 等后台线程互斥)，没有时不加锁"""
+        lock = getattr(self.lcd, 'lock', None)
+        return lock if lock is not None else contextlib.nullcontext()
+
+    def _push_frame(self, frame: bytes):
+        if len(frame) != self.frame_size:
+            raise Exception(f"帧数据长度错误: {len(frame)}")
+        with self._lcd_lock():
+            self.lcd.display_buffer[:] = frame
+            if getattr(self.lcd, 'scroll_line', 0):
+                self.lcd.set_scroll_line(0)
+            if self.lcd.lcd_flush() is False:
+                raise Exception("刷新失败")
+        self.frames += 1
+
+    def _push_rect(self, payload: bytes):
+        if len(payload) < RECT_HEADER.size:
+            raise Exception("区域请求长度错误")
+        x1, y1, x2, y2 = RECT_HEADER.unpack_from(payload)
+        if x1 > x2 or y1 > y2 or x2 >= self.cols or y2 >= self.rows:
+            raise Exception(f"区域越界: {(x1, y1, x2, y2)}")
+        width = x2 - x1 + 1
+        page1, page2 = y1 >> 3, y2 >> 3
+        data = payload[RECT_HEADER.size:]
+        if len(data) != width * (page2 - page1 + 1):
+            raise Exception(f"区域数据长度错误: {len(data)}")
+
+        with self._lcd_lock():
+            self._write_pages(x1, page1, page2, width, data)
+            flush_rect = getattr(self.lcd, 'flush_rect', None)
+            ok = flush_rect(x1, y1, x2, y2) if flush_rect is not None else self.lcd.lcd_flush()
+        if ok is False:
+            raise Exception("刷新失败")
+        self.rects += 1
+
+    def _write_pages(self, x1: int, page1: int, page2: int, width: int, data: bytes):
+        """
+        把逻辑页 page1~page2 的数据写入显示缓冲区。显示缓冲区按显存行序存放，
+        逻辑行 y 对应显存行 (y + scroll_line) % rows (与 flush_rect 的映射相同)
+        """
+        buffer = self.lcd.display_buffer
+        cols = self.cols
+        pages = self.rows >> 3
+        scroll = getattr(self.lcd, 'scroll_line', 0) % self.rows
+        if scroll & 7 == 0:
+            # 滚动行页对齐: 逐页切片复制
+            for i, page in enumerate(range(page1, page2 + 1)):
+                start = (page + (scroll >> 3)) % pages * cols + x1
+                buffer[start:start + width] = data[i * width:(i + 1) * width]
+            return
+        # 滚动行不是8的倍数: 逻辑页跨两个显存页，按行搬移位
+        for y in range(page1 << 3, (page2 + 1) << 3):
+            src = ((y >> 3) - page1) * width
+            src_bit = 1 << (y & 7)
+            ram_y = (y + scroll) % self.rows
+            dst = (ram_y >> 3) * cols + x1
+            dst_bit = 1 << (ram_y & 7)
+            for i in range(width):
+                if data[src + i] & src_bit:
+                    buffer[dst + i] |= dst_bit
+                else:
+                    buffer[dst + i] &= ~dst_bit & 0xFF
+
+    def stats(self) -> Dict[str, float]:
+        """获取统计信息"""
+        return {
+            'uptime_s': time.time() - self.started,
+            'clients': self.clients,
+            'requests': self.requests,
+            'frames': self.frames,
+            'rects': self.rects,
+            'bytes_received': self.bytes_received,
+            'avg_request_ms': self.busy_time / self.requests * 1000 if self.requests else 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 运行
+    # ------------------------------------------------------------------
+    def start(self):
+        """创建监听 socket"""
+        if isinstance(self.address, str):
+            if os.path.exists(self.address):
+                self._remove_stale_socket()
+            self._server = _UnixServer(self.address, _Handler)
+        else:
+            self._server = _TCPServer(self.address, _Handler)
+        self._server.daemon_ref = self
+
+    def _remove_stale_socket(self):
+        """删除上次异常退出留下的 socket 文件；仍有守护进程在监听时拒绝启动"""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.address)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.address)
+            return
+        finally:
+            probe.close()
+        raise Exception(f"守护进程已在运行: {self.address}")
+
+    def serve_forever(self):
+        """阻塞运行，直到 shutdown()"""
+        if self._server is None:
+            self.start()
+        print(f"LCD守护进程已启动: {self.address}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+
+# ==========================================
+# 客户端
+# ==========================================
+
+class LCDClient:
+    """守护进程客户端 (连接保持打开，可连续发送请求)"""
+
+    def __init__(self, address: Optional[Address] = None, timeout: float = 5.0):
+        self.address = address or default_address()
+        if isinstance(self.address, str):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.settimeout(timeout)
+        self.sock.connect(self.address)
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _request(self, op: int, payload: bytes = b'') -> bytes:
+        self.sock.sendall(HEADER.pack(op, len(payload)) + payload)
+        status, length = HEADER.unpack(_recv_exact(self.sock, HEADER.size))
+        reply = _recv_exact(self.sock, length) if length else b''
+        if status != STATUS_OK:
+            raise Exception(f"守护进程返回错误: {reply.decode('utf-8', errors='ignore')}")
+        return reply
+
+    def push_frame(self, frame) -> None:
+        """推送整帧页格式数据并整屏刷新"""
+        self._request(OP_FRAME, bytes(frame))
+
+    def push_rect(self, x1: int, y1: int, x2: int, y2: int, buffer, cols: int = 128) -> None:
+        """
+        推送区域 (包含端点) 并局部刷新
+
+        Args:
+            buffer: 客户端的整帧页格式缓冲区，从中取出覆盖区域的页数据
+            cols: 缓冲区宽度
+        """
+        width = x2 - x1 + 1
+        data = bytearray(RECT_HEADER.pack(x1, y1, x2, y2))
+        for page in range(y1 >> 3, (y2 >> 3) + 1):
+            start = page * cols + x1
+            data += buffer[start:start + width]
+        self._request(OP_RECT, bytes(data))
+
+    def set_contrast(self, contrast: int) -> None:
+        self._request(OP_CONTRAST, bytes([max(0, min(255, contrast))]))
+
+    def stats(self) -> Dict[str, float]:
+        return json.loads(self._request(OP_STATS).decode('utf-8'))
+
+    def ping(self) -> float:
+        """往返时间 (秒)"""
+        start = time.perf_counter()
+        self._request(OP_PING)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PMDB LCD 显示守护进程')
+    parser.add_argument('--socket', default=None, help=f'Unix socket 路径 (默认 {DEFAULT_SOCKET})')
+    parser.add_argument('--tcp', type=int, default=None, help='改用本机 TCP 端口')
+    parser.add_argument('--device-index', type=int, default=0, help='FTDI 设备索引')
+    parser.add_argument('--clock', type=int, default=500000, help='SPI 时钟 (Hz)')
+    args = parser.parse_args()
+
+    from gemini_lcd import FTD2XXSPIInterface, PMDBLCD
+
+    if args.tcp is not None:
+        address = ('127.0.0.1', args.tcp)
+    else:
+        address = args.socket or default_address()
+
+    spi = FTD2XXSPIInterface(device_index=args.device_index, use_ctypes=True)
+    if not spi.connect():
+        print("设备连接失败")
+        return
+    try:
+        spi.configure_spi(0, args.clock)
+        lcd = PMDBLCD(spi)
+        if not lcd.pmdb_init():
+            print("LCD初始化失败")
+            return
+        LCDDaemon(lcd, address).serve_forever()
+    except KeyboardInterrupt:
+        print("守护进程退出")
+    finally:
+        spi.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+灰度图像抖动 (Dithering) 模块
+将灰度图像转换为 1bpp 点阵，输出可直接写入 PMDBLCD 显示缓冲区的页格式数据。
+
+支持的抖动方式:
+- 'threshold': 固定阈值
+- 'bayer4' / 'bayer8': Bayer 有序抖动 (完全向量化)
+- 'diffusion': 误差扩散 (按行向量化)
+
+约定: 灰度 0=黑, 255=白; 越暗的像素越倾向于点亮 (bit=1)。
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from lcd_image import NUMPY_AVAILABLE, pack_pages
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+DITHER_METHODS = ('threshold', 'bayer4', 'bayer8', 'diffusion')
+
+
+def _bayer_matrix(size: int) -> "np.ndarray":
+    """递归生成 size x size 的 Bayer 矩阵，归一化到 (0, 1)"""
+    m = np.zeros((1, 1), dtype=np.float32)
+    while m.shape[0] < size:
+        m = np.block([
+            [4 * m + 0, 4 * m + 2],
+            [4 * m + 3, 4 * m + 1],
+        ])
+    return (m + 0.5) / (size * size)
+
+
+# 阈值图按帧尺寸缓存，只保留最近用到的几种尺寸 (返回的数组只读、调用方共享)
+_THRESHOLD_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_THRESHOLD_CACHE_SIZE)
+def _bayer_thresholds(size: int, height: int, width: int) -> "np.ndarray":
+    """获取铺满 (height, width) 的 Bayer 阈值图 (0-255)，按尺寸缓存"""
+    m = _bayer_matrix(size) * 255.0
+    th = m[np.arange(height)[:, None] % size, np.arange(width)[None, :] % size]
+    th.flags.writeable = False
+    return th
+
+
+def to_gray(img) -> "np.ndarray":
+    """
+    将 PIL 图像或二维数组转换为 float32 灰度数组 (0-255)
+    """
+    if not NUMPY_AVAILABLE:
+        raise Exception("未安装numpy库，无法使用抖动功能")
+
+    if hasattr(img, 'mode'):  # PIL.Image
+        if img.mode != 'L':
+            img = img.convert('L')
+        gray = np.asarray(img, dtype=np.float32)
+    else:
+        gray = np.asarray(img, dtype=np.float32)
+
+    if gray.ndim != 2:
+        raise ValueError(f"灰度图像必须是二维数据, 当前维度: {gray.ndim}")
+    return gray
+
+
+def dither_threshold(gray: "np.ndarray", level: int = 128) -> "np.ndarray":
+    """固定阈值二值化"""
+    return gray < level
+
+
+def dither_ordered(gray: "np.ndarray", size: int = 8) -> "np.ndarray":
+    """Bayer 有序抖动 (size=4 或 8)，整幅图一次比较完成"""
+    if size not in (4, 8):
+        raise ValueError(f"不支持的Bayer矩阵尺寸: {size}")
+    height, width = gray.shape
+    return gray < _bayer_thresholds(size, height, width)
+
+
+@lru_cache(maxsize=_THRESHOLD_CACHE_SIZE)
+def _row_thresholds(height: int, width: int, period: int = 16, step: int = 7) -> "np.ndarray":
+    """
+    误差扩散用的阈值调制图 (0-255)
+
+    每行都是 0..period-1 位反转序列的完整一轮 (行内阈值均匀分布，整行量化
+    无偏)，逐行错位 step 列以打散竖向纹理。按尺寸缓存。
+    """
+    bits = period.bit_length() - 1
+    seq = np.array([int(format(i, f'0{bits}b')[::-1], 2) for i in range(period)], dtype=np.float32)
+    seq = (seq + 0.5) / period * 255.0
+    cols = np.arange(width)[None, :] + np.arange(height)[:, None] * step
+    th = seq[cols % period]
+    th.flags.writeable = False
+    return th
+
+
+def dither_diffusion(gray: "np.ndarray", serpentine: bool = True) -> "np.ndarray":
+    """
+    按行向量化的误差扩散
+
+    经典 Floyd-Steinberg 在行内存在逐像素依赖，无法向量化。这里整行一次
+    量化，行内的 7/16 误差并入下一行，误差按 3:5:1 分配到下一行的左下/
+    正下/右下 (serpentine=True 时逐行镜像方向)。为避免平坦区域整行同时
+    翻转形成条纹，量化阈值使用逐行错位的位反转序列调制。
+    """
+    height, width = gray.shape
+    work = gray.astype(np.float32, copy=True)
+    out = np.empty((height, width), dtype=bool)
+    th = _row_thresholds(height, width)
+
+    w_side_a = 3.0 / 9.0
+    w_down = 5.0 / 9.0
+    w_side_b = 1.0 / 9.0
+
+    for r in range(height):
+        row = work[r]
+        lit = row < th[r]
+        out[r] = lit
+        if r + 1 == height:
+            break
+
+        err = row - np.where(lit, 0.0, 255.0)
+        nxt = work[r + 1]
+        nxt += err * w_down
+        if serpentine and (r & 1):
+            # 奇数行: 较大权重给右下
+            nxt[1:] += err[:-1] * w_side_a
+            nxt[:-1] += err[1:] * w_side_b
+        else:
+            nxt[:-1] += err[1:] * w_side_a
+            nxt[1:] += err[:-1] * w_side_b
+
+    return out
+
+
+def dither(img, method: str = 'bayer8', invert: bool = False) -> "np.ndarray":
+    """
+    将灰度图像抖动为 bool 点阵 (True=点亮)
+
+    Args:
+        img: PIL 图像或二维数组 (0=黑, 255=白)
+        method: 'threshold' / 'bayer4' / 'bayer8' / 'diffusion'
+        invert: 是否反相
+
+    Returns:
+        np.ndarray: 形状为 (高, 宽) 的 bool 数组
+    """
+    gray = to_gray(img)
+
+    if method == 'threshold':
+        bits = dither_threshold(gray)
+    elif method == 'bayer4':
+        bits = dither_ordered(gray, 4)
+    elif method == 'bayer8':
+        bits = dither_ordered(gray, 8)
+    elif method == 'diffusion':
+        bits = dither_diffusion(gray)
+    else:
+        raise ValueError(f"不支持的抖动方式: {method}")
+
+    return ~bits if invert else bits
+
+
+def dither_to_pages(img, method: str = 'bayer8', invert: bool = False) -> bytes:
+    """
+    抖动并直接打包为页格式 (每页 8 行，列优先，LSB 在上)
+
+    Returns:
+        bytes: 长度为 页数 * 宽 的页数据，可直接用于 PMDBLCD.load_frame()
+    """
+    data, _ = pack_pages(dither(img, method, invert))
+    return data.tobytes()
+
+
+def _dither_frame_worker(args) -> bytes:
+    """进程池工作函数 (必须是模块级函数以便序列化)"""
+    img, method, invert = args
+    return dither_to_pages(img, method, invert)
+
+
+def dither_sequence(frames: Sequence, method: str = 'bayer8', invert: bool = False,
+                    processes: Optional[int] = None) -> List[bytes]:
+    """
+    使用进程池批量预抖动图像序列
+
+    Args:
+        frames: 图像序列 (PIL 图像或二维数组，需可序列化)
+        method: 抖动方式
+        invert: 是否反相
+        processes: 进程数 (None=CPU核数, 0/1=在当前进程内顺序处理)
+
+    Returns:
+        List[bytes]: 每帧的页格式数据，顺序与输入一致
+    """
+    if method not in DITHER_METHODS:
+        raise ValueError(f"不支持的抖动方式: {method}")
+
+    jobs = [(frame, method, invert) for frame in frames]
+    if processes is not None and processes <= 1:
+        return [_dither_frame_worker(job) for job in jobs]
+
+    # 与 ProcessPoolExecutor 的默认值一致 (Windows 上最多 61 个进程)
+    workers = processes or min(os.cpu_count() or 1, 61)
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_dither_frame_worker, jobs, chunksize=chunksize))
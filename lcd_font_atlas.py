@@ -0,0 +1,304 @@
+"""
+LCD 字模图集 (由 font_compiler.py 自动生成，请勿手动修改)
+
+源字体: SourceCodePro-Bold.ttf
+格式: 每个字符 页数*宽 字节，页优先、列次之，字节内 LSB 在上
+"""
+
+FIRST_CHAR = 32
+CHAR_COUNT = 95
+
+# 字号: (宽, 高, 图集数据)
+ATLAS = {
+    16: (8, 16, bytes.fromhex(
+        '00000000000000000000000000000000'  # ' '
+        '000000f8f80000000000000e0e0e0000'  # '!'
+        '007c7c00007c7c000000000000000000'  # '"'
+        '0020f83820f8200000090f010f070100'  # '#'
+        '00e0f0dc9cb01000000c09393b0f0700'  # '$'
+        '003078783080a09800040300070f080f'  # '%'
+        '0000f0f8c878300000070f090b0f0e0f'  # '&'
+        '0000007c7c0000000000000000000000'  # "'"
+        '000000f0f80c0600000000030f1c1000'  # '('
+        '0000060ef8f000000000101c0f030000'  # ')'
+        '004040c0f0f0c0400000020301010302'  # '*'
+        '008080e0e08080000000000707000000'  # '+'
+        '00000000000000000000006e3e1c0000'  # ','
+        '00808080808080000000000000000000'  # '-'
+        '00000000000000000000000e0e0e0000'  # '.'
+        '00000000e07c0c000040781f03000000'  # '/'
+        '00e0f0988818f0e00003070c080c0703'  # '0'
+        '001010f8f80000000008080f0f080800'  # '1'
+        '0010180888f8f00000080c0e0b090808'  # '2'
+        '00188888c8787000000c0808090f0700'  # '3'
+        '0000c0e038f8f80000030302020f0f02'  # '4'
+        '00787848c8c88800000c08080c070700'  # '5'
+        '00e0f098888898080003070d08080f07'  # '6'
+        '00080808c8f838080000000f0f000000'  # '7'
+        '007078c8c8f8700000070f08090f0700'  # '8'
+        '0070f8888898f0e000080c08080c0703'  # '9'
+        '00000070707000000000000e0e0e0000'  # ':'
+        '000000e0e0e0e0000000004e6e3e1c00'  # ';'
+        '0000c0c060203018000000010302060c'  # '<'
+        '00202020202020000001010101010100'  # '='
+        '0010306060c080000006060301010000'  # '>'
+        '00000888c87830000000000e0e0e0000'  # '?'
+        '00c0f0b888c848f800071f1923222233'  # '@'
+        '0000f0f838f8c000080f070202030f0c'  # 'A'
+        '00f8f88888f87000000f0f0808080f07'  # 'B'
+        '00e0f018080808080003070c08080c08'  # 'C'
+        '00f8f8080818f0e0000f0f08080c0703'  # 'D'
+        '00f8f88888888800000f0f0808080800'  # 'E'
+        '00f8f88888888800000f0f0000000000'  # 'F'
+        '00e0f018088898880003070c08080f0f'  # 'G'
+        '00f8f8808080f8f8000f0f0000000f0f'  # 'H'
+        '000808f8f80808000008080f0f080800'  # 'I'
+        '0008080808f8f800000c0c08080f0700'  # 'J'
+        '00f8f8c0e0b81808000f0f0101070e08'  # 'K'
+        '00f8f80000000000000f0f0808080800'  # 'L'
+        '00f8f8f880f8f8f8000f0f0003000f0f'  # 'M'
+        '00f8f870c000f8f8000f0f0001070f0f'  # 'N'
+        '00e0f0180818f0e00003070c080c0703'  # 'O'
+        '00f8f8080888f8f0000f0f0101010000'  # 'P'
+        '00e0f0180818f0e000070f1c387c4f47'  # 'Q'
+        '00f8f8888888f870000f0f0001070f0c'  # 'R'
+        '0070f8c8c8c89800000c0c0909090707'  # 'S'
+        '00080808f8f80808000000000f0f0000'  # 'T'
+        '00f8f8000000f8f800070f0808080f07'  # 'U'
+        '0878f88000e0f8180000030f0e0f0100'  # 'V'
+        'f800e0e000f8f8000f0f03070f0f0000'  # 'W'
+        '001878f0c0f03808000c0f0303070e08'  # 'X'
+        '0838f0c0c0f038080000000f0f000000'  # 'Y'
+        '00000888c8f83818000c0e0f0b080808'  # 'Z'
+        '000000fcfc0404040000003f3f202020'  # '['
+        '00043cf080000000000000010f7c6000'  # '\\'
+        '00040404fcfc0000002020203f3f0000'  # ']'
+        '0080e03c1cf0c0000000000000000000'  # '^'
+        '00000000000000000020202020202020'  # '_'
+        '00000307060000000000000000000000'  # '`'
+        '002060202060e0c000060f0909090f0f'  # 'a'
+        '00fcfc202060e0c0000f0f08080c0f03'  # 'b'
+        '0080c060202060000003070c08080c00'  # 'c'
+        '0080e0602020fcfc00070f0c08080f0f'  # 'd'
+        '0080c0602020e0c00003070d09090909'  # 'e'
+        '002020f8fc2424040000000f0f000000'  # 'f'
+        '00c0e02020e0e02000357f4a4a4b7930'  # 'g'
+        '00fcfc202020e0c0000f0f0000000f0f'  # 'h'
+        '00202020e2e20200000000000f0f0000'  # 'i'
+        '00202020e2e20200004040407f3f0000'  # 'j'
+        '00fcfc80c0e02000000f0f0303070c08'  # 'k'
+        '000404fcfc000000000000070f080808'  # 'l'
+        '00e0e020e0e020e0000f0f000f0f000f'  # 'm'
+        '00e0e0202020e0c0000f0f0000000f0f'  # 'n'
+        '0080c0202060c0800003070c080c0703'  # 'o'
+        '00e0e0202060e0c0007f7f08080c0f03'  # 'p'
+        '0080c0602020e0e000070f0c08087f7f'  # 'q'
+        '0000e0e06020202000000f0f00000000'  # 'r'
+        '00c0e0a0a0206000000d090b0b0f0702'  # 's'
+        '002020f8f8202020000000070f080808'  # 't'
+        '00e0e00000e0e00000070f08080f0f00'  # 'u'
+        '00e0e00000c0e0200000070f0c0f0100'  # 'v'
+        '60e000c0c000e0e0000f0f0f030f0f07'  # 'w'
+        '0020e0c080e06000000c0e07030f0c08'  # 'x'
+        '00e0e0000080e0200040437f3c0f0100'  # 'y'
+        '002020a0e0e02000000c0e0f09080800'  # 'z'
+        '008080787c0404000000001f3f202000'  # '{'
+        '000000fefe0000000000007f7f000000'  # '|'
+        '0004047c788080000020203f1f000000'  # '}'
+        '00402020404060200000000000000000'  # '~'
+    )),
+    24: (12, 24, bytes.fromhex(
+        '000000000000000000000000000000000000000000000000000000000000000000000000'  # ' '
+        '0000000000f0f0f0000000000000000080dfdf9f00000000000000000103030100000000'  # '!'
+        '0000f8f8f8000000f8f8f800000003070300000003070300000000000000000000000000'  # '"'
+        '00008080e0f0908080f0f080000031f1ff3f3131ffff3131000000030300000303000000'  # '#'
+        '000080c0e0607c7ce0e040000080c3c78f8e9e9cfcf870000000000101010f0f01010000'  # '$'
+        '00e0f01010f0e0000080c0600083c7e4741703f0fb0b08f8000103000000000103020203'  # '%'
+        '0000c0e0f03030f0e0e0000000f0fbff9f3e7f77e3e1f0fc000001030303030303010101'  # '&'
+        '0000000000f8f8f800000000000000000003070300000000000000000000000000000000'  # "'"
+        '0000000000c0e0f83c18080000000000ffffff0100000000000000000003071f3c181000'  # '('
+        '00000008183cf8e0c000000000000000000081ffffff000000000010183c1f0703000000'  # ')'
+        '000000000000c0c00000000000000686ee7c3f3f7cee8606000000000000000000000000'  # '*'
+        '000000000000c0c0c000000000000c0c0c0cffffff0c0c0c000000000000000000000000'  # '+'
+        '0000000000000000000000000000000000c0c0c0c0800000000000002073333f1f0f0000'  # ','
+        '00000000000000000000000000000c0c0c0c0c0c0c0c0c0c000000000000000000000000'  # '-'
+        '00000000000000000000000000000000c0e0e0e0c0000000000000000103030301000000'  # '.'
+        '00000000000000c0f87c1c0000000000e0f87f1f030000000000181f1f03000000000000'  # '/'
+        '0000c0e070303030f0e0c000003fffffc00c0c0cc0ffff3f000000010303030303010000'  # '0'
+        '000000606060f0f0f0000000000000000000ffffff000000000003030303030303030303'  # '1'
+        '0020607030303070e0e0c000000080c0e0f0f87c1f0f0700000303030303030303030300'  # '2'
+        '0020607030303070f0e0c000008080800c0c0c0e9ffff3f0000101030303030303010100'  # '3'
+        '0000000080c0e070f0f0f00000303c3e3f333130ffffff30000000000000000003030300'  # '4'
+        '0000f0f0f0303030303030000080878f0706068efefc7800000101030303030301010000'  # '5'
+        '0000c0e0e070303030706020003fffffcc0606068efefcf8000000010303030303010100'  # '6'
+        '00303030303030b0f0f0703000000000e0fcff1f03000000000000000303030000000000'  # '7'
+        '0000c0e0f0303030f0e0c00000e0f3ff9f0e0e1e9ffff9f0000001030303030303030100'  # '8'
+        '00c0e0e07030303070e0c0000003878f0e0c0c8cc6ffff3f000101030303030301010000'  # '9'
+        '0000000080c0c0c08000000000000000c3e7e7e7c3000000000000000103030301000000'  # ':'
+        '0000000080c0c0c0800000000000000083c7c7c7c38000000000000021733b3f1f0f0000'  # ';'
+        '0000000000008080c0c0e0700000000e1e3f3b7361e0c0c0000000000000000000000101'  # '<'
+        '000080808080808080808080000031313131313131313131000000000000000000000000'  # '='
+        '000060e0c0c08000000000000000c0c0e171333f1f1e0c00000001000000000000000000'  # '>'
+        '0000206070303030f0e0c0000000000080dcde9f07030100000000000103030100000000'  # '?'
+        '000080c0607030303070e0e000feff010078fcfcccc67fff000003070e1c181818181c08'  # '@'
+        '00000000f0f030f0f080000000c0f8ff3f3330333ffffce0020303030000000000030303'  # 'A'
+        '0000f0f0f030303070f0e0c00000ffffff0c0c0c0e9ffffb000003030303030303030101'  # 'B'
+        '0000c0e0e070303030706020003fffffc080000000808000000000010103030303030101'  # 'C'
+        '0000f0f0f030303070e0e0c00000ffffff00000080c0ffff000003030303030303010100'  # 'D'
+        '0000f0f0f0303030303030300000ffffff0c0c0c0c0c0c00000003030303030303030303'  # 'E'
+        '0000f0f0f0303030303030300000ffffff0c0c0c0c0c0c00000003030300000000000000'  # 'F'
+        '0000c0e0e070303030706020003fffffc080000c0cfcfcfc000000010103030303030101'  # 'G'
+        '00f0f0f000000000f0f0f00000ffffff0c0c0c0cffffff00000303030000000003030300'  # 'H'
+        '0000303030f0f0f0303030300000000000ffffff00000000000003030303030303030303'  # 'I'
+        '0000303030303030f0f0f0000000808000000080ffffff00000101030303030301010000'  # 'J'
+        '00f0f0f00000c0e0f070301000ffffff3e0f3ffff8e08000000303030000000003030302'  # 'K'
+        '0000f0f0f0000000000000000000ffffff00000000000000000003030303030303030303'  # 'L'
+        '00f0f0f0f0800080f0f0f0f000ffffff033f381f03ffffff000303030000000000030303'  # 'M'
+        '00f0f0f0f0800000f0f0f00000ffffff030f7ef0ffffff00000303030000000103030300'  # 'N'
+        '0000c0e0f0303030f0e0c000003fffffc0000000c0ffff3f000000010303030303010000'  # 'O'
+        '0000f0f0f03030303070e0e00000ffffff181818181c0f0f000003030300000000000000'  # 'P'
+        '0000c0e0f0303030f0e0c000007fffffc0000000c0ffff7f0000010303070f1f3f333130'  # 'Q'
+        '0000f0f0f03030303070e0e00000ffffff18183878fcffcf000003030300000000010303'  # 'R'
+        '0000c0e0e030303030706020000083878f0f1e1e3efcf8f0000101010303030303010100'  # 'S'
+        '0030303030f0f0f0303030300000000000ffffff00000000000000000003030300000000'  # 'T'
+        '00f0f0f000000000f0f0f000007fffff80000080ffff7f00000001030303030303010000'  # 'U'
+        '10f0f0f08000000000f0f0f00000073ffff8c0f0ff7f0f01000000000303030303000000'  # 'V'
+        '10f0f0f0000080800000f0f0000fffffe0fe3f3ffec0ffff000003030303000003030303'  # 'W'
+        '003070f0f0c00080e0f0f0300000c0e1ff7f1f7ffff1c000000303030100000001030303'  # 'X'
+        '0030f0f0c0000000c0f0f030000000030ffff8ff0f030000000000000003030300000000'  # 'Y'
+        '00003030303030b0f0f0f0300000c0e0f8fc3f1f07010000000303030303030303030303'  # 'Z'
+        '00000000f8f8f8080808080000000000ffffff0000000000000000001f1f1f1010101000'  # '['
+        '00000c7cfce000000000000000000000030f7ffce000000000000000000000010f1f1c00'  # '\\'
+        '000008080808f8f8f8000000000000000000ffffff0000000000101010101f1f1f000000'  # ']'
+        '00000000e0f878f8e080000000000c0f0f0100010f0f0c00000000000000000000000000'  # '^'
+        '000000000000000000000000000000000000000000000000003030303030303030303030'  # '_'
+        '000000040e1e3c1800000000000000000000000000000000000000000000000000000000'  # '`'
+        '00000080808080808000000000e0f3f33919199bfffffe00000101030303030103030300'  # 'a'
+        '0000f8f8f8008080808000000000ffffff03010183ffff7c000003030301030303010100'  # 'b'
+        '000000008080808080800000007cfeff8301010101830100000000010303030303030100'  # 'c'
+        '000000008080808000f8f8f8007cfeff8301010183ffffff000001010303030301030303'  # 'd'
+        '000000008080808080000000007cfeffdf9919191b1f9f1e000000010303030303030100'  # 'e'
+        '0000808080e0f0f8b89898980000010101ffffff01010101000000000003030300000000'  # 'f'
+        '00000080808080808080808000ceffff313131333f1f0f01001d1f3f33333333331f1f0e'  # 'g'
+        '0000f8f8f8008080808000000000ffffff03010101fffffe000003030300000000030303'  # 'h'
+        '008080808098bcbc98000000000101010101ffffff000000000000000000030303000000'  # 'i'
+        '00808080808c9e9e8c000000000101010101ffffff0000000030303030383f1f0f000000'  # 'j'
+        '0000f8f8f8000000008080800000ffffff783c7ef7e3c100000003030300000000030303'  # 'k'
+        '0018181818f8f8f8000000000000000000ffffff00000000000000000000010303030303'  # 'l'
+        '00808000808080008080808000ffffff01ffffff0101ffff000303030003030300000303'  # 'm'
+        '0000808080008080808000000000ffffff03010101fffffe000003030300000000030303'  # 'n'
+        '000000008080808080000000007cfeff8301010183fffe7c000000010303030303010000'  # 'o'
+        '0000808080008080808000000000ffffff03010183ffff7c00003f3f3f01030303010100'  # 'p'
+        '000000008080808000808000007cffff83010181ffffff0000000103030303013f3f3f00'  # 'q'
+        '000000808080000080808080000000ffffff070301010101000000030303000000000000'  # 'r'
+        '00000000808080808080000000008e9f1f3d393939f3f3e1000101030303030303030100'  # 's'
+        '00808080f0f0f0808080808000010101ffffff8101010101000000000001030303030303'  # 't'
+        '00808080000000008080800000ffffff00000080ffffff00000003030303030103030300'  # 'u'
+        '00808080000000000080808000010f7ffef080e0fc7f1f03000000000103030303000000'  # 'v'
+        '808000000000000000808080fffff0f0fe1efec0feff7f01030303030100030303030000'  # 'w'
+        '008080808000000080808080000081c7fffe3cfeffc78300000203030300000001030302'  # 'x'
+        '0080808000000000008080800001073ffef8c0e0fc7f0f0300003030383f1f0701000000'  # 'y'
+        '000080808080808080808080000001c1e1f17d3f1f0f0301000003030303030303030303'  # 'z'
+        '0000000000f0f8f808080800000018183cffffe70000000000000000000f1f1f10101000'  # '{'
+        '0000000000fcfcfc000000000000000000ffffff0000000000000000007f7f7f00000000'  # '|'
+        '0000080808f8f8f0000000000000000000e7ffff1818180000001010101f1f0f00000000'  # '}'
+        '00000000000000000000000000040e070303060c0c0e0702000000000000000000000000'  # '~'
+    )),
+    32: (16, 32, bytes.fromhex(
+        '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # ' '
+        '000000000000e0e0e0e0000000000000000000000000ffffffff0000000000000000000000f0f9f9f9f9f0000000000000000000000001010101000000000000'  # '!'
+        '0000e0e0e0e0e0000000e0e0e0e0e00000000fffffff0f0000000fffffff0f000000000000000000000000000000000000000000000000000000000000000000'  # '"'
+        '0000000000c0c0000000c0c0c000000000001c1cfcff7f1c1cdcffff1d1c1c00000e0efeffff0e0e8effff0f0e0e000000000001010000000101010000000000'  # '#'
+        '00000000008080f8f8f880808000000000001e7f7ffff3e3e3e3c3c7878300000020387c7878f0f1f1f1737f7f3f1f00000000000000000f0f0f000000000000'  # '$'
+        '0080c0c0c0c0c08000000000000080801f3f7f7060707f3f1f00989c9e8f87036070f83c1e0f02007effffc381c3ffff00000000000000000000010101010100'  # '%'
+        '00000080c0c0c0c0c0800000000000000000beffffffe1f17f3f0f00808080803c7fffffe3c3c7cffffefc7effffe7c100000001010101010100000000000101'  # '&'
+        '000000000000e0e0e0e0e000000000000000000000000fffffff0f00000000000000000000000000000000000000000000000000000000000000000000000000'  # "'"
+        '0000000000000080e0f0f8702000000000000000e0fcffff0f03000000000000000000001fffffffe00000000000000000000000000003070f1f3e3810000000'  # '('
+        '0000002070f8f0e08000000000000000000000000000031ffffffce00000000000000000000000e0ffffff1f0000000000000010383e1f0f0703000000000000'  # ')'
+        '0000000000000000000000000000000000207070e0e0e0ffffffe0e0e0707020000000103c1e0f0703070f1e3c10000000000000000000000000000000000000'  # '*'
+        '0000000000000000000000000000000000c0c0c0c0c0ffffffc0c0c0c0c0c0000001010101013f3f3f0101010101010000000000000000000000000000000000'  # '+'
+        '00000000000000000000000000000000000000000000000000000000000000000000000000f0f8f8f8f0e000000000000000000020e071793f1f070000000000'  # ','
+        '0000000000000000000000000000000000c0c0c0c0c0c0c0c0c0c0c0c0c0c0000001010101010101010101010101010000000000000000000000000000000000'  # '-'
+        '0000000000000000000000000000000000000000000000000000000000000000000000000070f8fcfcfcf8700000000000000000000000010101000000000000'  # '.'
+        '00000000000000000000c0f0f0f0100000000000000000c0f8feff1f0300000000000000e0f8ff7f1f030000000000000020383f3f1f03000000000000000000'  # '/'
+        '000000008080c0c0c0c0c0808000000000f8feffff0783c1c1c1830ffffffef8000f3f7ffff8e0c1c1c1e0f8ff7f3f0700000000000001010101010000000000'  # '0'
+        '000000808080c0c0c0c0c00000000000000007070707ffffffffff000000000000c0c0c0c0c0ffffffffffc0c0c0c00000010101010101010101010101010100'  # '1'
+        '00008080c0c0c0c0c0c0808000000000000103070301010101c3ffffff3c00000080c0e0f0f8fcfedfcfc7c3c0c0c00000010101010101010101010101010100'  # '2'
+        '00008080c0c0c0c0c0c0c080800000000001030703c1c1c1e1e3ff7f3f3f1e0000e0f0e0e0c1c1c1c3e3ffffff7e3c0000000000010101010101010000000000'  # '3'
+        '00000000000000c0c0c0c0c0c00000000080c0f0f87e3f0f03ffffffff0000000e0f0f0f0f0e0e0e0effffffff0e0e0e00000000000000000001010101000000'  # '4'
+        '0000c0c0c0c0c0c0c0c0c0c0c0c000000000ffffffffe1e1e1e1e1c1c181000040e0f0e1c0c0c0c0c0e1ffff7f7f1f0000000000010101010101000000000000'  # '5'
+        '00000000008080c0c0c0c0c0c080800000f0fcffff8fc3e3e1e1e1e1e3c38100000f3f7ffff1e1c0c0c0c0e1ffff7f1f00000000000001010101010100000000'  # '6'
+        '008080808080808080808080808080000003030303030383e3f3fb7f1f0703000000000000f0feffffff07000000000000000000000101010101000000000000'  # '7'
+        '0000000080c0c0c0c0c0c0c08000000000001e3f7ffff3e1c1c1e3ff7f3f1e00003c7effffe3c1c1c1c3e3ffff7f3c0000000000000101010101010000000000'  # '8'
+        '0000008080c0c0c0c0c0808000000000007cffffffc3818181c3c7fffffef8000000c1e1e3c3c3c3c3e1f8ff7f1f070000000000010101010101000000000000'  # '9'
+        '0000000000000000000000000000000000000000001c3e7f7f7f3e1c00000000000000000070f8fcfcfcf8700000000000000000000000010101000000000000'  # ':'
+        '000000000000000000000000000000000000000000387cfefefe7c3800000000000000000060f0f8f8f8f0e000000000000000000060e071793f1f0700000000'  # ';'
+        '00000000000000000000000080c000000000e0e0f0f8783c1c1e0f07070300000000010303070f0f1e3c3c7870f0000000000000000000000000000000000000'  # '<'
+        '00000000000000000000000000000000001c1c1c1c1c1c1c1c1c1c1c1c1c1c00000e0e0e0e0e0e0e0e0e0e0e0e0e0e0000000000000000000000000000000000'  # '='
+        '00008080000000000000000000000000000007070f0e1e3c3cf8f0f0e0c000000000f078383c1e1e0f0707030101000000000000000000000000000000000000'  # '>'
+        '000000c0c0e0e0e0e0e0e0c0c0800000000000000101c0e0f0f97f3f1f0f00000000000000f0f9f9f9f9f0000000000000000000000001010101000000000000'  # '?'
+        '000000008080c0c0c0c0c08080000000f0fcfe1f070181c0e0e06061fffffc001fffffe0800f1f3f3838381c0f3f3f000000010307070e0c0c0c0c0c06040000'  # '@'
+        '0000000000c0c0c0c0c0c00000000000000080f0feff7f070f7ffffef0800000e0fcffff3f0f0e0e0e0e0f7ffffffce001010101000000000000000001010101'  # 'A'
+        '00c0c0c0c0c0c0c0c0c0c0c08080000000ffffffffffc1c1c1e3ffff7f3f1e0000ffffffffffc1c1c1c1e3ffffff7f3c00010101010101010101010100000000'  # 'B'
+        '00000000008080c0c0c0c0c0c0c0808000f0fcfeffff0f07030101010103030100071f3f7ffff8f0e0c0c0c0c0e0f0e000000000000000010101010101010000'  # 'C'
+        '00c0c0c0c0c0c0c0c0c080800000000000ffffffffff010101030ffffffffcf000ffffffffffc0c0c0e0f8ff7f7f1f0700010101010101010101000000000000'  # 'D'
+        '0000c0c0c0c0c0c0c0c0c0c0c0c0c0000000ffffffffffc1c1c1c1c1c1c101000000ffffffffffc1c1c1c1c1c1c1c0c000000101010101010101010101010101'  # 'E'
+        '0000c0c0c0c0c0c0c0c0c0c0c0c0c0000000ffffffffffc1c1c1c1c1c1c101000000ffffffffff01010101010101000000000101010101000000000000000000'  # 'F'
+        '000000008080c0c0c0c0c0c080800000f0fcfeffff0f0301c1c1c1c3c3c1c000071f7f7ffff8e0c0c1c1c1ffffff7f0000000000000001010101010100000000'  # 'G'
+        '00c0c0c0c0c000000000c0c0c0c0c00000ffffffffffc0c0c0c0ffffffffff0000ffffffffff01010101ffffffffff0000010101010100000000010101010100'  # 'H'
+        '00c0c0c0c0c0c0c0c0c0c0c0c0c0c0000001010101ffffffffff01010101010000c0c0c0c0ffffffffffc0c0c0c0c00000010101010101010101010101010100'  # 'I'
+        '0000c0c0c0c0c0c0c0c0c0c0c0c0c00000000101010101010101ffffffffff000040e0f0e0c0c0c0c0e0ffffff7f1f0000000000010101010101010000000000'  # 'J'
+        '00c0c0c0c0c00000000000c0c0c0c0c000ffffffffffe0f0f8feff9f0703010000ffffffffff070301071f7ffffcf0c000010101010100000000000001010101'  # 'K'
+        '0000c0c0c0c0c00000000000000000000000ffffffffff0000000000000000000000ffffffffffc0c0c0c0c0c0c0c00000000101010101010101010101010100'  # 'L'
+        '00c0c0c0c0c00000000000c0c0c0c0c000ffffffff3ffff880f0ff1fffffffff00ffffffff00010f0f0f0100ffffffff00010101010000000000000001010101'  # 'M'
+        '00c0c0c0c0c00000000000c0c0c0c00000ffffffef3ffff8e08000ffffffff0000ffffffff0000030f7ffef7ffffff0000010101010000000000010101010100'  # 'N'
+        '0000008080c0c0c0c0c0c08080000000f0feffffff07030101030ffffffffef0073f7ffffff8e0c0c0e0f8ffff7f3f0700000000000101010101010000000000'  # 'O'
+        '00c0c0c0c0c0c0c0c0c0c0c08080000000ffffffffff81818181c3ffffffff3e00ffffffffff0303030303030101000000010101010100000000000000000000'  # 'P'
+        '0000008080c0c0c0c0c0c08080000000f0feffffff070301010307fffffffef00f3f7ffffff8e0c0c0e0f8ffff7f3f0f00000000010103070f1f3f3d38383838'  # 'Q'
+        '00c0c0c0c0c0c0c0c0c0c0c08080000000ffffffffff81818181c3ffffffff3e00ffffffffff0303071f7ffffdf1e08000010101010100000000000101010101'  # 'R'
+        '0000008080c0c0c0c0c0c08080800000003e7ffffffff1f1e1e1c3c38381000040e0f0f0e1c1c3c3c3e7ffffff7f1e0000000000010101010101010000000000'  # 'S'
+        'c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0010101010101ffffffffff0101010101000000000000ffffffffff000000000000000000000001010101010000000000'  # 'T'
+        '00c0c0c0c0c00000000000c0c0c0c0c000ffffffffff0000000000ffffffffff001f7fffffffe0c0c0c0e0ffffff7f1f00000000000101010101010100000000'  # 'U'
+        'c0c0c0c08000000000000000c0c0c0c0011ffffffff880000000f0ffffff1f01000000073ffffff8f0ffff3f0700000000000000000101010101010000000000'  # 'V'
+        'c0c0c0c00000000000000000c0c0c0c0ffffffff00c0f8fcfcfc8000ffffff7f00fffffff8ffff0307fffff0ffff7f0000000101010100000001010101010000'  # 'W'
+        '40c0c0c0c0800000000000c0c0c0c0400001070f3ffffef8f0fcff3f0f07010080c0f0fcff7f1f07071f7ffefcf0c08001010101010000000000000101010101'  # 'X'
+        'c0c0c0c0c000000000000000c0c0c0c000030f3ffffffce080e0f8feff3f0f03000000000003ffffffffff030000000000000000000001010101010000000000'  # 'Y'
+        '0000c0c0c0c0c0c0c0c0c0c0c0c0c0c000000101010181e1f1fdff7f1f0f030100c0e0f8fcffffdfc7c3c0c0c0c0c0c000010101010101010101010101010101'  # 'Z'
+        '0000000000f0f0f030303030303000000000000000ffffff00000000000000000000000000ffffff000000000000000000000000001f1f1f1818181818180000'  # '['
+        '0010f0f0f0c000000000000000000000000000031ffffef8c000000000000000000000000000031f7ffff8c000000000000000000000000000030f3f3f382000'  # '\\'
+        '0000303030303030f0f0f000000000000000000000000000ffffff00000000000000000000000000ffffff000000000000001818181818181f1f1f0000000000'  # ']'
+        '000000000080e0e0e0e0800000000000000080f0fcff3f07073ffffcf08000000000010101000000000000010101000000000000000000000000000000000000'  # '^'
+        '00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000383838383838383838383838383800'  # '_'
+        '000000040e1f3e7c7830000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000'  # '`'
+        '0000000000000000000000000000000000003838381c1c1c1c1c3cfcf8f8f0c00078fcfefec7c7c3c3e3e37fffffffff00000001010101010100000001010101'  # 'a'
+        '00e0e0e0e0e00000000000000000000000ffffffffff38181c1c3cfcfcf8f0c000ffffffffffe0c0c0c0f0ffff7f3f0f00010101010000010101010100000000'  # 'b'
+        '000000000000000000000000000000000080e0f0f8f87c3c1c1c1c1c3c381800000f3f7ffffff0e0c0c0c0c0e0e0e00000000000000001010101010101000000'  # 'c'
+        '00000000000000000000e0e0e0e0e000c0e0f8f8fc7c1c1c1c38ffffffffff001f7fffffffe0c0c0c0e0ffffffffff0000000000010101010100000101010100'  # 'd'
+        '000000000000000000000000000000000080e0f0f8f83c1c1c1c1c3cf8f8f0c0000f3f7fffffe7c7c7c7c7c7c7e7c70700000000000001010101010101000000'  # 'e'
+        '000000000080c0e0f0f0f07070707000001c1c1c1cffffffffff1c1c1c1c00000000000000ffffffffff00000000000000000000000101010101000000000000'  # 'f'
+        '000000000000000000000000000000000000e0f8f8fc3c1c1c3cfcfcfcfc1c1c000071ffffe7c7c6c6c7c7c3c3c18000000e1e1f3f3939393939393d1f1f0f07'  # 'g'
+        '00e0e0e0e0e00000000000000000000000ffffffffff38181c3cfcfcfcf8e00000ffffffffff00000000ffffffffff0000010101010100000000010101010100'  # 'h'
+        '00000000000070f8f8f8f87000000000001c1c1c1c1c1cfcfcfcfcfc0000000000000000000000ffffffffff0000000000000000000000010101010100000000'  # 'i'
+        '000000000000387c7c7c7c3800000000001c1c1c1c1c1cfcfcfcfcfc0000000000000000000000ffffffffff00000000103c383838383c3f1f1f0f0300000000'  # 'j'
+        '00e0e0e0e0e00000000000000000000000ffffffffff0080e0f0f87c3c1c0c0400ffffffffff1f0f071f7ffef8f0c08000010101010100000000000001010101'  # 'k'
+        '7070707070f0f0f0f0f00000000000000000000000ffffffffff00000000000000000000003f7fffffffe0c0c0c0c00000000000000000000101010101010100'  # 'l'
+        '00000000000000000000000000000000fcfcfcf0381c1cfcfcf8381cfcfcfcf0ffffffff000000ffffff0000ffffffff01010101000000010101000001010101'  # 'm'
+        '0000000000000000000000000000000000fcfcfcfcf038181c3cfcfcfcf8e00000ffffffffff00000000ffffffffff0000010101010100000000010101010100'  # 'n'
+        '0000000000000000000000000000000080e0f0f8f83c1c1c1c7cf8f8f0e080000f3f7ffffff0c0c0c0f0ffff7f3f0f0000000000000101010101000000000000'  # 'o'
+        '0000000000000000000000000000000000fcfcfcfcf8381c1c1c3cfcfcf8f0c000ffffffffffe0c0c0c0f0ffff7f3f0f003f3f3f3f3f00010101010100000000'  # 'p'
+        '00000000000000000000000000000000c0e0f8f8fc7c1c1c1c38f8fcfcfcfc001f7fffffffe0c0c0c0e0ffffffffff00000000000101010101003f3f3f3f3f00'  # 'q'
+        '000000000000000000000000000000000000fcfcfcfce0f038381c1c1c1c1c000000ffffffffff00000000000000000000000101010101000000000000000000'  # 'r'
+        '000000000000000000000000000000000000e0f8f8fcfc9c9c9c1c3c383818000040e0f3e3e7c7c7c7cfcffffffe7e3c00000000000101010101010100000000'  # 's'
+        '00000000c0c0c0c000000000000000001c1c1cffffffffff1c1c1c1c1c1c00000000003f7fffffffe0c0c0c0c0c0000000000000000001010101010101010000'  # 't'
+        '0000000000000000000000000000000000fcfcfcfcfc00000000fcfcfcfcfc00003fffffffffe0c0c0e07fffffffff0000000001010101010000000101010100'  # 'u'
+        '000000000000000000000000000000000c3cfcfcfce000000000c0f8fcfc3c0c0000010f3ffffff0e0feff7f0f01000000000000000101010101010000000000'  # 'v'
+        '00000000000000000000000000000000fcfcfcfc0000c0e0e0e00000c0fcfcfc017ffffffef8ff3f03ffffe0ffffff1f00000101010101000000010101010100'  # 'w'
+        '00000000000000000000000000000000000c1c7cfcfcf0c080e0f8fc7c1c0c000080e0f0fcff3f0f1f7ffff8f0c0800001010101010000000000000101010101'  # 'x'
+        '00000000000000000000000000000000041cfcfcfce000000000c0f8fcfc3c0c000000030f3ffffcf0feff1f0701000000303838383c1f1f0f03000000000000'  # 'y'
+        '0000000000000000000000000000000000001c1c1c1c1c9cfcfcfcfc7c3c1c0000c0e0f0fcfeffffcfc7c3c1c0c0c00000010101010101010101010101010100'  # 'z'
+        '000000000000c0e0f0f03030303000000000808080c0ffff7f7f000000000000000001010103fffffefe000000000000000000000000070f1f1f1c1818180000'  # '{'
+        '000000000000f8f8f8f8000000000000000000000000ffffffff000000000000000000000000ffffffff000000000000000000000000ffffffff000000000000'  # '|'
+        '000030303030f0f0e0c00000000000000000000000007f7fffffc08080800000000000000000fefeffff03010101000000001818181c1f1f0f07000000000000'  # '}'
+        '0000000000000000000000000000000000c0e0f0707070f0e0c0c0c0f0f060000000010100000000010101010100000000000000000000000000000000000000'  # '~'
+    )),
+}
@@ -0,0 +1,294 @@
+"""
+LCD 图像打包工具
+将 1bit 图像 (PIL "1" 模式 / NumPy bool 二维数组) 转换为控制器使用的页格式:
+每页 8 行, 每列 1 字节, 字节内 LSB 在上 (与 display_buffer 布局一致)。
+
+适用于 UC1638 (PMDBLCD / P3PLUSLCD) 与 SSD1306 (FT2232_01.PMDBLCD)。
+"""
+
+import importlib.util
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy 只在图像打包函数中按需导入，条带 (PageStrip) 相关函数不依赖 numpy
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+
+def image_to_bits(img, invert: bool = False) -> "np.ndarray":
+    """
+    将图像转换为二维 bool 数组 (True=点亮)
+
+    Args:
+        img: PIL.Image (任意模式, 非 "1" 模式先转换为 "1") 或二维数组 (非零即点亮)
+        invert: 是否反相
+
+    Returns:
+        np.ndarray: 形状为 (高, 宽) 的 bool 数组
+    """
+    if not NUMPY_AVAILABLE:
+        raise Exception("未安装numpy库，无法使用图像快速打包")
+    import numpy as np
+
+    if hasattr(img, 'mode'):  # PIL.Image
+        if img.mode != '1':
+            img = img.convert('1')
+        bits = np.asarray(img, dtype=bool)
+    else:
+        bits = np.asarray(img)
+        if bits.dtype != np.bool_:
+            bits = bits != 0
+
+    if bits.ndim != 2:
+        raise ValueError(f"图像必须是二维数据, 当前维度: {bits.ndim}")
+
+    return ~bits if invert else bits
+
+
+def pack_pages(bits: "np.ndarray", shift: int = 0) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    将 bool 数组沿 8 行方向打包为页格式
+
+    Args:
+        bits: 形状为 (高, 宽) 的 bool 数组
+        shift: 首行在首页中的行偏移 (0-7)
+
+    Returns:
+        (data, mask): data 形状为 (页数, 宽) 的 uint8 页数据;
+                      mask 形状为 (页数,) 的 uint8, 表示每页被覆盖的行位
+    """
+    import numpy as np
+
+    height, width = bits.shape
+    total = (shift + height + 7) & ~7
+
+    if shift == 0 and total == height:
+        # 快速路径: 页对齐, 无需填充
+        padded = bits
+    else:
+        padded = np.zeros((total, width), dtype=bool)
+        padded[shift:shift + height] = bits
+
+    data = np.packbits(padded.reshape(-1, 8, width), axis=1, bitorder='little')[:, 0, :]
+
+    cover = np.zeros(total, dtype=bool)
+    cover[shift:shift + height] = True
+    mask = np.packbits(cover.reshape(-1, 8), axis=1, bitorder='little')[:, 0]
+
+    return data, mask
+
+
+def blit_bits_to_buffer(buffer, cols: int, rows: int, bits: "np.ndarray",
+                        x: int, y: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    将 bool 数组按页格式写入显示缓冲区 (支持任意 y 偏移与越界裁剪)
+
+    Args:
+        buffer: 显示缓冲区 (bytearray, 长度为 cols * rows / 8)
+        cols, rows: 屏幕宽高 (像素)
+        bits: 形状为 (高, 宽) 的 bool 数组
+        x, y: 左上角坐标 (可为负数)
+
+    Returns:
+        实际写入的区域 (x1, y1, x2, y2)，完全越界时返回 None
+    """
+    import numpy as np
+
+    height, width = bits.shape
+
+    # 裁剪到屏幕范围
+    sx0 = max(0, -x)
+    sy0 = max(0, -y)
+    sx1 = min(width, cols - x)
+    sy1 = min(height, rows - y)
+    if sx0 >= sx1 or sy0 >= sy1:
+        return None
+
+    bits = bits[sy0:sy1, sx0:sx1]
+    x0 = x + sx0
+    y0 = y + sy0
+    height, width = bits.shape
+
+    data, mask = pack_pages(bits, y0 & 7)
+    page0 = y0 >> 3
+    pages = data.shape[0]
+
+    if isinstance(buffer, list):
+        # 兼容旧版 list 缓冲区 (较慢)
+        fb = np.array(buffer, dtype=np.uint8).reshape(rows >> 3, cols)
+    else:
+        fb = np.frombuffer(buffer, dtype=np.uint8).reshape(rows >> 3, cols)
+
+    region = fb[page0:page0 + pages, x0:x0 + width]
+    region &= ~mask[:, None]
+    region |= data
+
+    if isinstance(buffer, list):
+        buffer[:] = fb.ravel().tolist()
+
+    return x0, y0, x0 + width - 1, y0 + height - 1
+
+
+def blit_image_to_buffer(buffer, cols: int, rows: int, img, x: int, y: int,
+                         invert: bool = False) -> Optional[Tuple[int, int, int, int]]:
+    """
+    将图像写入显示缓冲区，参见 image_to_bits / blit_bits_to_buffer
+
+    Returns:
+        实际写入的区域 (x1, y1, x2, y2)，完全越界时返回 None
+    """
+    return blit_bits_to_buffer(buffer, cols, rows, image_to_bits(img, invert), x, y)
+
+
+# ==========================================
+# 页格式条带 (预渲染的字形/文字，用于切片方式快速写入)
+# ==========================================
+
+def glyph_columns(rows: List[int], width: int) -> List[int]:
+    """
+    将按行取模 (每行一个整数，bit j = 第j列) 的字形转换为按列的位掩码
+
+    Returns:
+        List[int]: 每列一个整数，bit i = 第i行
+    """
+    columns = [0] * width
+    for i, row_bits in enumerate(rows):
+        if not row_bits:
+            continue
+        for j in range(width):
+            if row_bits & (1 << j):
+                columns[j] |= 1 << i
+    return columns
+
+
+class PageStrip:
+    """
+    页格式条带: 在给定行偏移 (shift) 下预先拆分好的各页数据与掩码
+
+    pages 中每项为 (data, mask, data_int, mask_int):
+    data/mask 为该页各列的字节，*_int 为对应的小端整数，
+    用于整页一次完成 (old & ~mask) | data 合并; mask 全为 0xFF 时 mask_int 为 None，
+    直接切片赋值。
+    """
+
+    __slots__ = ('width', 'height', 'shift', 'pages', 'nbytes')
+
+    def __init__(self, width: int, height: int, shift: int, pages: list):
+        self.width = width
+        self.height = height
+        self.shift = shift
+        self.pages = pages
+        self.nbytes = sum(len(page[0]) * 2 for page in pages)
+
+
+def render_strip(columns: List[int], height: int, shift: int,
+                 fc: int = 1, bc: int = 0, mode: int = 0) -> PageStrip:
+    """
+    把按列位掩码渲染为页格式条带
+
+    Args:
+        columns: 每列的位掩码 (bit i = 第i行点亮)
+        height: 高度 (像素)
+        shift: 首行在首页中的行偏移 (0-7)
+        fc, bc: 前景色/背景色 (0或1)
+        mode: 0=覆盖模式 (背景色也写入), 1=叠加模式 (只写前景像素)
+
+    Returns:
+        PageStrip
+    """
+    full = (1 << height) - 1
+    npages = (shift + height + 7) >> 3
+    width = len(columns)
+
+    datas = [bytearray(width) for _ in range(npages)]
+    masks = [bytearray(width) for _ in range(npages)]
+    for j, col in enumerate(columns):
+        col &= full
+        if mode:
+            value = col if fc & 1 else 0
+            cover = col
+        else:
+            value = (col if fc & 1 else 0) | ((full & ~col) if bc & 1 else 0)
+            cover = full
+        value <<= shift
+        cover <<= shift
+        for k in range(npages):
+            datas[k][j] = (value >> (k << 3)) & 0xFF
+            masks[k][j] = (cover >> (k << 3)) & 0xFF
+
+    pages = []
+    for data, mask in zip(datas, masks):
+        data = bytes(data)
+        mask = bytes(mask)
+        if mask == b'\xff' * width:
+            pages.append((data, mask, None, None))
+        else:
+            pages.append((data, mask, int.from_bytes(data, 'little'), int.from_bytes(mask, 'little')))
+    return PageStrip(width, height, shift, pages)
+
+
+def blit_strip_to_buffer(buffer, cols: int, strip: PageStrip, x: int, page0: int,
+                         total_pages: int, wrap: bool = False):
+    """
+    将条带按页写入显示缓冲区
+
+    Args:
+        buffer: 显示缓冲区 (bytearray)
+        cols: 屏幕宽度
+        strip: 页格式条带
+        x: 左侧列坐标 (越界部分裁剪)
+        page0: 条带首页对应的缓冲区页号
+        total_pages: 缓冲区总页数
+        wrap: 页号超出末尾时是否回绕 (硬件滚动的环形缓冲)
+    """
+    c0 = max(0, -x)
+    c1 = min(strip.width, cols - x)
+    if c0 >= c1:
+        return
+    clipped = c0 != 0 or c1 != strip.width
+    n = c1 - c0
+
+    for k, (data, mask, data_int, mask_int) in enumerate(strip.pages):
+        page = page0 + k
+        if page >= total_pages:
+            if not wrap:
+                break
+            page %= total_pages
+        if page < 0:
+            continue
+
+        start = page * cols + x + c0
+        if mask_int is None:
+            # 整页覆盖: 直接切片赋值
+            buffer[start:start + n] = data[c0:c1] if clipped else data
+            continue
+
+        if clipped:
+            data_int = int.from_bytes(data[c0:c1], 'little')
+            mask_int = int.from_bytes(mask[c0:c1], 'little')
+        old = int.from_bytes(buffer[start:start + n], 'little')
+        buffer[start:start + n] = ((old & ~mask_int) | data_int).to_bytes(n, 'little')
+
+
+def copy_rect_bits(dst, src, cols: int, x1: int, y1: int, x2: int, y2: int):
+    """
+    将 src 缓冲区中矩形区域 (包含端点, 缓冲区行坐标) 的像素复制到 dst，其余像素不变
+
+    用于裁剪: 在整块缓冲区上绘制后，只保留目标矩形内的结果。
+    """
+    n = x2 - x1 + 1
+    if n <= 0 or y1 > y2:
+        return
+    for page in range(y1 >> 3, (y2 >> 3) + 1):
+        row_start = y1 - (page << 3) if page == y1 >> 3 else 0
+        row_end = y2 - (page << 3) if page == y2 >> 3 else 7
+        row_mask = ((0xFF << row_start) & (0xFF >> (7 - row_end))) & 0xFF
+        start = page * cols + x1
+        if row_mask == 0xFF:
+            dst[start:start + n] = src[start:start + n]
+            continue
+        mask = int.from_bytes(bytes([row_mask]) * n, 'little')
+        old = int.from_bytes(dst[start:start + n], 'little')
+        new = int.from_bytes(src[start:start + n], 'little')
+        dst[start:start + n] = ((old & ~mask) | (new & mask)).to_bytes(n, 'little')
@@ -0,0 +1,178 @@
+"""
+分级日志 (环形缓冲)
+日志记录保存在固定大小的内存环形缓冲区中，消息按 % 格式延迟格式化:
+低于当前级别的调用直接返回，不格式化也不输出；达到回显级别的记录才打印到控制台。
+
+默认级别 INFO (连接、配置等一次性信息照常打印)，读写、绘图等热路径上的诊断信息为 DEBUG，
+需要时用环境变量 LCD_LOG_LEVEL=DEBUG 或 set_level('DEBUG') 打开，
+回显级别默认跟随记录级别，可用 LCD_LOG_ECHO 单独设置。
+
+用法:
+    from lcd_log import get_logger, hexlist
+    log = get_logger('gemini_lcd.transport')
+    log.debug("发送命令: %s", hexlist(commands))
+    log.error("写入失败: %s", e)
+
+    import lcd_log
+    lcd_log.set_level('DEBUG', echo='WARNING')   # 全部记录，只打印警告以上
+    print('\\n'.join(lcd_log.records()))          # 查看最近的记录
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Union
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+_LEVEL_NAMES = {DEBUG: 'DEBUG', INFO: 'INFO', WARNING: 'WARNING', ERROR: 'ERROR'}
+_NAME_LEVELS = {name: level for level, name in _LEVEL_NAMES.items()}
+
+
+def _to_level(level: Union[int, str]) -> int:
+    if isinstance(level, str):
+        if level.upper() not in _NAME_LEVELS:
+            raise ValueError(f"未知的日志级别: {level}")
+        return _NAME_LEVELS[level.upper()]
+    return level
+
+
+class hexlist:
+    """延迟格式化为十六进制列表 (只在日志真正输出时才格式化)"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return '[' + ', '.join(f'0x{b:02x}' for b in self.data) + ']'
+
+
+class RingBuffer:
+    """所有日志器共用的记录缓冲区"""
+
+    def __init__(self, capacity: int = 1024):
+        self.records = deque(maxlen=capacity)
+
+    def resize(self, capacity: int):
+        self.records = deque(self.records, maxlen=capacity)
+
+
+class Logger:
+    """分级日志器"""
+
+    def __init__(self, name: str, buffer: RingBuffer):
+        self.name = name
+        self._buffer = buffer
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= _state['level']
+
+    def log(self, level: int, msg: str, *args):
+        """记录一条日志 (msg % args 在读取或回显时才格式化)"""
+        if level < _state['level']:
+            return
+        record = (time.time(), level, self.name, msg, args)
+        self._buffer.records.append(record)
+        if level >= _state['echo']:
+            print(_format_message(record))
+
+    def debug(self, msg: str, *args):
+        if DEBUG >= _state['level']:
+            self.log(DEBUG, msg, *args)
+
+    def info(self, msg: str, *args):
+        self.log(INFO, msg, *args)
+
+    def warning(self, msg: str, *args):
+        self.log(WARNING, msg, *args)
+
+    def error(self, msg: str, *args):
+        self.log(ERROR, msg, *args)
+
+
+def _format_message(record) -> str:
+    _, _, _, msg, args = record
+    if args:
+        try:
+            return msg % args
+        except (TypeError, ValueError):
+            return f"{msg} {args}"
+    return msg
+
+
+def _format_record(record) -> str:
+    t, level, name, _, _ = record
+    stamp = time.strftime('%H:%M:%S', time.localtime(t)) + f'.{int(t * 1000) % 1000:03d}'
+    return f"{stamp} {_LEVEL_NAMES.get(level, level)} {name}: {_format_message(record)}"
+
+
+_buffer = RingBuffer()
+_loggers: Dict[str, Logger] = {}
+_lock = threading.Lock()
+_state = {'level': _to_level(os.environ.get('LCD_LOG_LEVEL', 'INFO'))}
+# 回显级别默认与记录级别相同 (与 set_level 一致), 可用 LCD_LOG_ECHO 单独指定
+_state['echo'] = _to_level(os.environ.get('LCD_LOG_ECHO', _state['level']))
+
+
+def get_logger(name: str) -> Logger:
+    """获取 (或创建) 指定名字的日志器"""
+    with _lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = Logger(name, _buffer)
+        return logger
+
+
+def set_level(level: Union[int, str], echo: Optional[Union[int, str]] = None):
+    """
+    设置记录级别与回显级别 (对所有日志器生效)
+
+    Args:
+        level: 低于该级别的日志直接丢弃
+        echo: 达到该级别的记录同时打印到控制台 (默认与 level 相同)
+    """
+    _state['level'] = _to_level(level)
+    _state['echo'] = _to_level(echo) if echo is not None else _state['level']
+
+
+def set_capacity(capacity: int):
+    """设置环形缓冲区容量 (保留最近的记录)"""
+    _buffer.resize(capacity)
+
+
+def records(level: Union[int, str] = DEBUG, name: Optional[str] = None) -> List[str]:
+    """
+    格式化缓冲区中的记录
+
+    Args:
+        level: 只返回不低于该级别的记录
+        name: 只返回该日志器 (或其子日志器) 的记录
+    """
+    level = _to_level(level)
+    result = []
+    for record in list(_buffer.records):
+        if record[1] < level:
+            continue
+        if name and not (record[2] == name or record[2].startswith(name + '.')):
+            continue
+        result.append(_format_record(record))
+    return result
+
+
+def dump(file=None, level: Union[int, str] = DEBUG):
+    """把缓冲区中的记录写到 file (默认 stderr)"""
+    file = file or sys.stderr
+    for line in records(level):
+        print(line, file=file)
+
+
+def clear():
+    """清空缓冲区"""
+    _buffer.records.clear()
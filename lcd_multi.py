@@ -0,0 +1,254 @@
+"""
+多屏驱动
+FT2232H 有两个 MPSSE 通道 (A/B)，每个通道是一个独立的 D2XX 设备 (序列号 <芯片序列号>A/B)。
+MultiPanel 为每块屏 (任意通道、任意 FTDI 设备) 打开一个 FTD2XXSPIInterface，
+每块屏一个写线程: FT_Write 是 ctypes 调用，执行期间释放 GIL，
+各通道的 USB 传输可以并行，总吞吐量随通道数增加。
+
+各屏共用一个帧时钟: 每帧把各屏 FrameScheduler 合并后的脏区域同时交给各自的写线程刷新，
+等待全部完成后返回，因此调用方在两次 tick() 之间绘制不会与刷新冲突。
+
+用法:
+    panels = MultiPanel.open_ft2232h('FT6ZK1', clock=6000000)   # 通道 A、B 各一块屏
+    left, right = panels['A'].lcd, panels['B'].lcd
+    while True:
+        left.lcd_show_string(0, 0, "L", 1, 0, 12);  panels.mark_dirty('A', 0, 0, 5, 11)
+        right.lcd_show_string(0, 0, "R", 1, 0, 12); panels.mark_dirty('B', 0, 0, 5, 11)
+        panels.tick()
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from lcd_log import get_logger
+from lcd_scheduler import FrameScheduler
+
+log = get_logger(__name__)
+
+
+class Panel:
+    """一块屏: 驱动、接口、调度器与专属写线程"""
+
+    def __init__(self, name: str, lcd, spi=None, max_rects: int = 4):
+        self.name = name
+        self.lcd = lcd
+        self.spi = spi
+        self.scheduler = FrameScheduler(lcd, max_rects=max_rects)
+        # 单线程执行器 = 该屏的写线程，同一块屏的传输保持顺序
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'lcd-{name}')
+
+    def submit(self, fn: Callable, *args):
+        """在该屏的写线程上执行 fn(*args)"""
+        return self.executor.submit(fn, *args)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        if self.spi is not None:
+            self.spi.disconnect()
+
+
+class MultiPanel:
+    """多屏管理器: 每屏一个写线程，共用帧时钟并行刷新"""
+
+    def __init__(self, fps: float = 20.0):
+        """
+        Args:
+            fps: 共用的目标帧率
+        """
+        self.panels: Dict[str, Panel] = {}
+        self.set_fps(fps)
+        self._next_deadline = time.perf_counter()
+
+        # 统计
+        self.frames = 0
+        self.misses = 0
+        self.busy_time = 0.0
+
+    def set_fps(self, fps: float):
+        """设置目标帧率"""
+        if fps <= 0:
+            raise ValueError(f"帧率必须为正数: {fps}")
+        self.fps = fps
+        self.interval = 1.0 / fps
+
+    # ------------------------------------------------------------------
+    # 屏幕管理
+    # ------------------------------------------------------------------
+    def add(self, name: str, lcd, spi=None, max_rects: int = 4) -> Panel:
+        """
+        添加一块已创建驱动的屏
+
+        Args:
+            name: 屏名称
+            lcd: LCD 驱动实例
+            spi: 该屏独占的接口 (close() 时断开)，可为None
+            max_rects: 每帧最多分别刷新的区域数
+        """
+        if name in self.panels:
+            raise Exception(f"屏名称重复: {name}")
+        panel = Panel(name, lcd, spi, max_rects)
+        self.panels[name] = panel
+        return panel
+
+    def __getitem__(self, name: str) -> Panel:
+        return self.panels[name]
+
+    def __iter__(self):
+        return iter(self.panels.values())
+
+    def __len__(self) -> int:
+        return len(self.panels)
+
+    @classmethod
+    def open_serials(cls, serials: Iterable[str], clock: int = 1000000, mode: int = 0,
+                     fps: float = 20.0, names: Optional[List[str]] = None,
+                     driver=None, init: bool = True, use_ctypes: bool = True) -> 'MultiPanel':
+        """
+        按序列号打开多块屏 (每个序列号一个通道/设备)，并行初始化
+
+        Args:
+            serials: 序列号列表
+            clock: SPI 时钟 (Hz)
+            mode: SPI 模式
+            fps: 目标帧率
+            names: 屏名称 (默认为序列号)
+            driver: 驱动类 (默认 gemini_lcd.PMDBLCD)
+            init: 是否执行 pmdb_init()
+            use_ctypes: 是否使用ctypes直接调用DLL (False 时使用 ftd2xx 库)
+        """
+        from gemini_lcd import FTD2XXSPIInterface, PMDBLCD
+        driver = driver or PMDBLCD
+        serials = list(serials)
+        names = names or serials
+
+        manager = cls(fps)
+        try:
+            for name, serial in zip(names, serials):
+                spi = FTD2XXSPIInterface(use_ctypes=use_ctypes, serial=serial)
+                if not spi.connect():
+                    raise Exception(f"打开设备失败: {serial}")
+                if not spi.configure_spi(mode, clock):
+                    spi.disconnect()
+                    raise Exception(f"配置SPI失败: {serial}")
+                manager.add(name, driver(spi), spi)
+
+            if init:
+                results = manager.run_all(lambda panel: panel.lcd.pmdb_init())
+                failed = [name for name, ok in results.items() if not ok]
+                if failed:
+                    raise Exception(f"LCD初始化失败: {failed}")
+        except Exception:
+            manager.close()
+            raise
+        return manager
+
+    @classmethod
+    def open_ft2232h(cls, serial: str, channels: str = 'AB', **kwargs) -> 'MultiPanel':
+        """
+        打开一颗 FT2232H 的多个通道，屏名称为通道字母
+
+        Args:
+            serial: 芯片序列号 (不含通道字母，如 'FT6ZK1')
+            channels: 使用的通道
+            **kwargs: 传给 open_serials 的参数
+        """
+        return cls.open_serials([serial + ch for ch in channels], names=list(channels), **kwargs)
+
+    def close(self):
+        """停止写线程并断开所有接口"""
+        for panel in self.panels.values():
+            panel.close()
+        self.panels = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 并行执行
+    # ------------------------------------------------------------------
+    def run_all(self, fn: Callable[[Panel], object], names: Optional[Iterable[str]] = None) -> Dict[str, object]:
+        """
+        在各屏的写线程上并行执行 fn(panel)，等待全部完成
+
+        Returns:
+            Dict[str, object]: 屏名称 -> 返回值 (异常时为 False 并记录错误)
+        """
+        panels = [self.panels[name] for name in names] if names is not None else list(self.panels.values())
+        futures = [(panel.name, panel.submit(fn, panel)) for panel in panels]
+        results = {}
+        for name, future in futures:
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                log.error("屏 %s 执行失败: %s", name, e)
+                results[name] = False
+        return results
+
+    # ------------------------------------------------------------------
+    # 刷新
+    # ------------------------------------------------------------------
+    def mark_dirty(self, name: str, x1: int, y1: int, x2: int, y2: int):
+        """标记某块屏的脏区域"""
+        self.panels[name].scheduler.mark_dirty(x1, y1, x2, y2)
+
+    def mark_all(self, name: Optional[str] = None):
+        """标记某块屏 (默认全部) 整屏需要刷新"""
+        panels = [self.panels[name]] if name is not None else self.panels.values()
+        for panel in panels:
+            panel.scheduler.mark_all()
+
+    def flush_now(self) -> Dict[str, bool]:
+        """并行刷新所有屏的待刷新区域，等待全部完成"""
+        start = time.perf_counter()
+        pending = [name for name, panel in self.panels.items() if panel.scheduler.pending]
+        if not pending:
+            return {}
+        results = self.run_all(lambda panel: panel.scheduler.flush_now(), pending)
+        elapsed = time.perf_counter() - start
+
+        self.frames += 1
+        self.busy_time += elapsed
+        # 超时的帧由下一次 tick() 的迟到检查计入 misses，这里不重复统计
+        return results
+
+    def tick(self, block: bool = True) -> bool:
+        """
+        共用帧节拍: 到达帧截止时间后并行刷新各屏
+
+        Args:
+            block: True=睡眠等待截止时间; False=未到截止时间时立即返回
+
+        Returns:
+            bool: 本次是否执行了刷新
+        """
+        now = time.perf_counter()
+        if now < self._next_deadline:
+            if not block:
+                return False
+            time.sleep(self._next_deadline - now)
+            now = time.perf_counter()
+
+        late = now - self._next_deadline
+        if late >= self.interval:
+            self.misses += int(late / self.interval)
+            self._next_deadline = now
+        self._next_deadline += self.interval
+
+        return bool(self.flush_now())
+
+    def stats(self) -> Dict[str, object]:
+        """获取统计信息 (总体与各屏)"""
+        panels = {name: panel.scheduler.stats() for name, panel in self.panels.items()}
+        total_bytes = sum(s['total_bytes'] for s in panels.values())
+        return {
+            'fps_target': self.fps,
+            'frames': self.frames,
+            'misses': self.misses,
+            'avg_frame_ms': self.busy_time / self.frames * 1000 if self.frames else 0.0,
+            'throughput_Bps': total_bytes / self.busy_time if self.busy_time else 0.0,
+            'panels': panels,
+        }
@@ -0,0 +1,225 @@
+"""
+LCD 帧调度器
+接管 LCD 的刷新: 调用方只标记脏区域，调度器按目标帧率每帧最多刷新一次，
+合并重叠的更新区域，并记录帧耗时、掉帧次数与每帧传输字节数。
+
+适用于 gemini_lcd.PMDBLCD (支持 flush_rect 局部刷新)、gemini_lcd_00.PMDBLCD、
+gemini_lcd_01.P3PLUSLCD 等驱动 (仅整屏刷新)。
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+Rect = Tuple[int, int, int, int]
+
+
+def _panel_size(lcd) -> Tuple[int, int]:
+    """获取驱动的屏幕尺寸 (宽, 高)"""
+    for cols, rows in (('PMDB_COLS', 'PMDB_ROWS'), ('P3PLUS_COLS', 'P3PLUS_ROWS'), ('width', 'height')):
+        if hasattr(lcd, cols) and hasattr(lcd, rows):
+            return getattr(lcd, cols), getattr(lcd, rows)
+    return 128, 128
+
+
+def _full_flush_fn(lcd) -> Callable[[], object]:
+    """获取驱动的整屏刷新函数"""
+    for name in ('lcd_flush', 'flush', 'refresh'):
+        fn = getattr(lcd, name, None)
+        if callable(fn):
+            return fn
+    raise ValueError(f"驱动 {type(lcd).__name__} 没有刷新函数")
+
+
+def _touching(a: Rect, b: Rect) -> bool:
+    """两个矩形重叠或相邻"""
+    return not (a[2] + 1 < b[0] or b[2] + 1 < a[0] or a[3] + 1 < b[1] or b[3] + 1 < a[1])
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+class FrameScheduler:
+    """帧调度器: 目标帧率、脏区域合并与掉帧统计"""
+
+    def __init__(self, lcd, fps: float = 20.0, max_rects: int = 4, history: int = 120,
+                 flush_fn: Optional[Callable[[], object]] = None,
+                 rect_fn: Optional[Callable[[int, int, int, int], object]] = None):
+        """
+        Args:
+            lcd: LCD 驱动实例
+            fps: 目标帧率
+            max_rects: 每帧最多分别刷新的区域数，超过后合并为一个包围盒
+            history: 保留最近多少帧的统计记录
+            flush_fn: 整屏刷新函数 (默认自动查找 lcd_flush/flush/refresh)
+            rect_fn: 局部刷新函数 (默认使用 lcd.flush_rect，不存在则总是整屏刷新)
+        """
+        self.lcd = lcd
+        self.width, self.height = _panel_size(lcd)
+        self.max_rects = max(1, max_rects)
+        self.flush_fn = flush_fn or _full_flush_fn(lcd)
+        self.rect_fn = rect_fn or getattr(lcd, 'flush_rect', None)
+        self.set_fps(fps)
+
+        self._lock = threading.Lock()
+        self._dirty: List[Rect] = []
+        self._full = False
+        self._next_deadline = time.perf_counter()
+
+        # 统计
+        self.frames = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self.frame_times = deque(maxlen=history)
+        self.frame_bytes = deque(maxlen=history)
+
+    def set_fps(self, fps: float):
+        """设置目标帧率"""
+        if fps <= 0:
+            raise ValueError(f"帧率必须为正数: {fps}")
+        self.fps = fps
+        self.interval = 1.0 / fps
+
+    # ------------------------------------------------------------------
+    # 脏区域
+    # ------------------------------------------------------------------
+    def mark_dirty(self, x1: int, y1: int, x2: int, y2: int):
+        """标记脏区域 (包含端点)，与已有的重叠/相邻区域合并"""
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        x1 = max(0, x1)
+        y1 = max(0, y1)
+        x2 = min(self.width - 1, x2)
+        y2 = min(self.height - 1, y2)
+        if x1 > x2 or y1 > y2:
+            return
+
+        rect = (x1, y1, x2, y2)
+        with self._lock:
+            if self._full:
+                return
+            # 反复合并直到没有可合并的区域
+            merged = True
+            while merged:
+                merged = False
+                for i, other in enumerate(self._dirty):
+                    if _touching(rect, other):
+                        rect = _union(rect, other)
+                        del self._dirty[i]
+                        merged = True
+                        break
+            self._dirty.append(rect)
+
+            if len(self._dirty) > self.max_rects:
+                box = self._dirty[0]
+                for other in self._dirty[1:]:
+                    box = _union(box, other)
+                self._dirty = [box]
+
+    def mark_all(self):
+        """标记整屏需要刷新"""
+        with self._lock:
+            self._full = True
+            self._dirty = []
+
+    @property
+    def pending(self) -> bool:
+        """是否有待刷新的区域"""
+        return self._full or bool(self._dirty)
+
+    def _take_dirty(self) -> Tuple[bool, List[Rect]]:
+        with self._lock:
+            full, rects = self._full, self._dirty
+            self._full = False
+            self._dirty = []
+
+        if not full and rects and self.rect_fn is None:
+            full = True
+        if full:
+            return True, []
+        return False, rects
+
+    def _rect_bytes(self, rect: Rect) -> int:
+        """页对齐区域的数据字节数"""
+        x1, y1, x2, y2 = rect
+        return (x2 - x1 + 1) * ((y2 >> 3) - (y1 >> 3) + 1)
+
+    # ------------------------------------------------------------------
+    # 帧节拍
+    # ------------------------------------------------------------------
+    def wait_next_frame(self):
+        """睡眠到下一帧的截止时间"""
+        delay = self._next_deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    def tick(self, block: bool = True) -> bool:
+        """
+        帧节拍: 到达帧截止时间后刷新本帧合并后的脏区域
+
+        Args:
+            block: True=睡眠等待截止时间; False=未到截止时间时立即返回
+
+        Returns:
+            bool: 本次是否执行了刷新
+        """
+        now = time.perf_counter()
+        if now < self._next_deadline:
+            if not block:
+                return False
+            self.wait_next_frame()
+            now = time.perf_counter()
+
+        # 错过的帧截止时间 (调用方渲染/刷新过慢)
+        late = now - self._next_deadline
+        if late >= self.interval:
+            self.misses += int(late / self.interval)
+            self._next_deadline = now
+        self._next_deadline += self.interval
+
+        if not self.pending:
+            return False
+        return self.flush_now()
+
+    def flush_now(self) -> bool:
+        """立即刷新所有待刷新区域 (不等待帧截止时间)"""
+        full, rects = self._take_dirty()
+        if not full and not rects:
+            return False
+
+        start = time.perf_counter()
+        if full:
+            self.flush_fn()
+            nbytes = (self.width * self.height) >> 3
+        else:
+            nbytes = 0
+            for rect in rects:
+                self.rect_fn(*rect)
+                nbytes += self._rect_bytes(rect)
+        elapsed = time.perf_counter() - start
+
+        self.frames += 1
+        self.total_bytes += nbytes
+        self.frame_times.append(elapsed)
+        self.frame_bytes.append(nbytes)
+        # 超时的帧由下一次 tick() 的迟到检查计入 misses，这里不重复统计
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        """获取统计信息"""
+        times = list(self.frame_times)
+        sizes = list(self.frame_bytes)
+        return {
+            'fps_target': self.fps,
+            'frames': self.frames,
+            'misses': self.misses,
+            'total_bytes': self.total_bytes,
+            'avg_frame_ms': sum(times) / len(times) * 1000 if times else 0.0,
+            'max_frame_ms': max(times) * 1000 if times else 0.0,
+            'avg_frame_bytes': sum(sizes) / len(sizes) if sizes else 0.0,
+            'max_frame_bytes': max(sizes) if sizes else 0,
+        }
@@ -0,0 +1,199 @@
+"""
+共享内存帧缓冲区
+显示缓冲区放在 multiprocessing.shared_memory 中，多个生产者进程直接在其上绘制，
+由唯一持有 FTDI 设备的刷新进程只发送脏页，进程之间不复制帧数据。
+
+内存布局:
+    头部: 魔数 'LFB1', 列数, 行数, 代数 (generation)
+    脏页表: 每页 1 字节 (单字节写入在各进程间是原子的，无需跨进程锁)
+    显示缓冲区: 页数 * 列数 字节 (页格式，与 PMDBLCD.display_buffer 相同)
+
+约定: 生产者先绘制再标记脏页；刷新进程先清除标记再读取该页，
+因此清除之后的绘制一定会在下一次刷新中发出。共享模式下不要使用硬件滚动。
+
+用法:
+    # 刷新进程
+    fb = SharedFramebuffer.create('pmdb_fb')
+    lcd = PMDBLCD(spi); lcd.pmdb_init()
+    SharedFlusher(fb, lcd, fps=30).run()
+
+    # 生产者进程
+    fb = SharedFramebuffer.attach('pmdb_fb')
+    canvas = PMDBLCD(None)
+    fb.bind(canvas)
+    canvas.lcd_show_string(0, 0, "hello", 1, 0, 12)
+    fb.mark_rect(0, 0, 29, 11)
+"""
+
+import multiprocessing
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+MAGIC = b'LFB1'
+HEADER = struct.Struct('<4sHHI')
+_GEN_OFFSET = 8
+
+
+def _open_shm(name: str, create: bool, size: int = 0) -> shared_memory.SharedMemory:
+    """打开共享内存；附加方不注册到 resource_tracker，避免其退出时删除共享内存"""
+    if create:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 没有 track 参数。multiprocessing 启动的子进程与创建方共用
+        # resource_tracker，此时不能注销 (会注销掉创建方的登记)
+        shm = shared_memory.SharedMemory(name=name)
+        if multiprocessing.parent_process() is None:
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, 'shared_memory')
+            except Exception:
+                pass
+        return shm
+
+
+class SharedFramebuffer:
+    """共享内存中的页格式帧缓冲区"""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        magic, self.cols, self.rows, _ = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC:
+            raise Exception(f"共享内存 {shm.name} 不是帧缓冲区")
+        self.pages = self.rows >> 3
+        self._dirty_offset = HEADER.size
+        self._buffer_offset = (HEADER.size + self.pages + 7) & ~7
+
+        self.dirty = shm.buf[self._dirty_offset:self._dirty_offset + self.pages]
+        self.buffer = shm.buf[self._buffer_offset:self._buffer_offset + self.pages * self.cols]
+
+    @classmethod
+    def create(cls, name: Optional[str] = None, cols: int = 128, rows: int = 128) -> 'SharedFramebuffer':
+        """创建共享帧缓冲区 (刷新进程调用，关闭时删除共享内存)"""
+        pages = rows >> 3
+        size = ((HEADER.size + pages + 7) & ~7) + pages * cols
+        shm = _open_shm(name, True, size)
+        HEADER.pack_into(shm.buf, 0, MAGIC, cols, rows, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedFramebuffer':
+        """附加到已存在的共享帧缓冲区 (生产者进程调用)"""
+        return cls(_open_shm(name, False), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self):
+        """释放映射，创建方同时删除共享内存"""
+        self.dirty.release()
+        self.buffer.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    # ------------------------------------------------------------------
+    # 生产者
+    # ------------------------------------------------------------------
+    def bind(self, lcd):
+        """让驱动直接在共享缓冲区上绘制 (替换 lcd.display_buffer，不复制)"""
+        if len(lcd.display_buffer) != len(self.buffer):
+            raise Exception(f"缓冲区大小不一致: {len(lcd.display_buffer)} != {len(self.buffer)}")
+        lcd.display_buffer = self.buffer
+
+    @property
+    def generation(self) -> int:
+        return struct.unpack_from('<I', self.shm.buf, _GEN_OFFSET)[0]
+
+    def _bump(self):
+        struct.pack_into('<I', self.shm.buf, _GEN_OFFSET, (self.generation + 1) & 0xFFFFFFFF)
+
+    def mark_pages(self, page1: int, page2: int):
+        """标记页范围 (包含端点) 为脏"""
+        page1 = max(0, page1)
+        page2 = min(self.pages - 1, page2)
+        if page1 > page2:
+            return
+        self.dirty[page1:page2 + 1] = b'\x01' * (page2 - page1 + 1)
+        self._bump()
+
+    def mark_rect(self, x1: int, y1: int, x2: int, y2: int):
+        """标记区域所在的页为脏 (区域包含端点)"""
+        if y1 > y2:
+            y1, y2 = y2, y1
+        self.mark_pages(y1 >> 3, y2 >> 3)
+
+    def mark_all(self):
+        self.mark_pages(0, self.pages - 1)
+
+    # ------------------------------------------------------------------
+    # 刷新方
+    # ------------------------------------------------------------------
+    def take_dirty(self) -> List[int]:
+        """取出并清除脏页 (先清除标记，之后的绘制会在下一次被取出)"""
+        pages = [page for page in range(self.pages) if self.dirty[page]]
+        for page in pages:
+            self.dirty[page] = 0
+        return pages
+
+
+class SharedFlusher:
+    """刷新进程: 持有 LCD 驱动，按帧率只发送共享缓冲区中的脏页"""
+
+    def __init__(self, fb: SharedFramebuffer, lcd, fps: float = 30.0):
+        """
+        Args:
+            fb: 共享帧缓冲区
+            lcd: 已初始化的 LCD 驱动 (需提供 lcd_flush_pages)
+            fps: 最高刷新帧率
+        """
+        self.fb = fb
+        self.lcd = lcd
+        self.interval = 1.0 / fps
+        fb.bind(lcd)
+        self._stop = threading.Event()
+
+        # 统计
+        self.frames = 0
+        self.pages_sent = 0
+
+    def flush_once(self) -> int:
+        """发送当前的脏页，返回发送的页数"""
+        # 不以代数判断是否有更新: 多个生产者同时递增可能丢失一次计数，
+        # 而扫描脏页表只有 页数 个字节
+        pages = self.fb.take_dirty()
+        if not pages:
+            return 0
+        self.lcd.lcd_flush_pages(pages)
+        self.frames += 1
+        self.pages_sent += len(pages)
+        return len(pages)
+
+    def run(self):
+        """循环刷新，直到 stop()"""
+        next_deadline = time.perf_counter()
+        while not self._stop.is_set():
+            self.flush_once()
+            next_deadline += self.interval
+            delay = next_deadline - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                next_deadline = time.perf_counter()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'frames': self.frames,
+            'pages_sent': self.pages_sent,
+            'bytes_sent': self.pages_sent * self.fb.cols,
+            'generation': self.fb.generation,
+        }
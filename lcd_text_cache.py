@@ -0,0 +1,110 @@
+"""
+LCD 文字渲染缓存
+将整串文字预渲染为页格式条带 (lcd_image.PageStrip)，按
+(驱动类型, 文字, 字号, fc, bc, 模式, 行偏移) 缓存，LRU 淘汰并限制占用内存。
+命中时每页一次切片赋值/整数掩码合并即可写入显示缓冲区，静态文字重绘几乎无开销。
+
+驱动需提供 get_char_columns / strip_shift / blit_strip。
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from lcd_image import PageStrip, render_strip
+
+
+class TextCache:
+    """文字条带的 LRU 缓存"""
+
+    def __init__(self, max_bytes: int = 32 * 1024, max_entries: int = 256):
+        """
+        Args:
+            max_bytes: 缓存条带占用的字节上限 (数据 + 掩码)
+            max_entries: 缓存条目数上限
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, PageStrip]" = OrderedDict()
+        self.nbytes = 0
+
+        # 统计
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _render(self, lcd, text: str, size: int, fc: int, bc: int, mode: int,
+                shift: int) -> Optional[PageStrip]:
+        """拼接各字符的按列位掩码并渲染为一个条带；有字符不支持时返回None"""
+        get_columns = getattr(lcd, 'get_char_columns', None)
+        if get_columns is None:
+            return None
+        columns = []
+        height = size
+        for char in text:
+            glyph = get_columns(char, size)
+            if glyph is None:
+                return None
+            char_columns, _, height = glyph
+            columns.extend(char_columns)
+        return render_strip(columns, height, shift, fc, bc, mode)
+
+    def get(self, lcd, text: str, size: int, fc: int, bc: int, mode: int,
+            shift: int) -> Optional[PageStrip]:
+        """获取文字条带 (未命中时渲染并加入缓存)"""
+        key = (type(lcd).__name__, text, size, fc & 1, bc & 1, mode, shift)
+        strip = self._entries.get(key)
+        if strip is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return strip
+
+        self.misses += 1
+        strip = self._render(lcd, text, size, fc, bc, mode, shift)
+        if strip is None or strip.nbytes > self.max_bytes:
+            return strip
+
+        self._entries[key] = strip
+        self.nbytes += strip.nbytes
+        while self.nbytes > self.max_bytes or len(self._entries) > self.max_entries:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= old.nbytes
+            self.evictions += 1
+        return strip
+
+    def draw(self, lcd, x: int, y: int, text: str, fc: int, bc: int, size: int, mode: int = 0) -> bool:
+        """
+        通过缓存写入文字 (参数顺序与 lcd_show_string 一致)
+
+        Returns:
+            bool: 是否写入 (驱动或字号不支持、纵向越界时返回False，由调用方退回逐字符绘制)
+        """
+        if not text:
+            return True
+        shift_fn = getattr(lcd, 'strip_shift', None)
+        if shift_fn is None:
+            return False
+        strip = self.get(lcd, text, size, fc, bc, mode, shift_fn(y))
+        if strip is None:
+            return False
+        return lcd.blit_strip(strip, x, y)
+
+    def clear(self):
+        """清空缓存 (统计保留)"""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """获取统计信息"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
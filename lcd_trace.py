@@ -0,0 +1,341 @@
+"""
+事务级跟踪 (Chrome trace-event JSON，可在 https://ui.perfetto.dev 或 chrome://tracing 中查看)
+
+启用后替换各驱动类上的方法，记录:
+- render: 绘图调用 (画点/线/字符串、blit 等)
+- flush:  整屏/局部刷新
+- usb:    每次USB写入，拆分为 bytes() 转换与写入本身 (含大小)；读取
+- gpio:   复位、MPSSE 初始化、GPIO 更新
+- sleep:  驱动模块内的每次 time.sleep (含请求的时长)
+- frame:  FrameScheduler.tick / flush_now
+
+未启用时不替换任何方法，没有额外开销。
+
+用法:
+    python lcd_trace.py -o trace.json gemini_lcd_01.py      # 不改代码，跟踪整个脚本
+    python lcd_trace.py -o trace.json -m gemini_lcd
+
+    import lcd_trace
+    with lcd_trace.trace_to('trace.json'):
+        lcd.lcd_show_string(0, 0, "Hello", 1, 0, 12)
+        with lcd_trace.span('my_screen'):
+            ...
+        lcd.lcd_flush()
+"""
+
+import argparse
+import contextlib
+import functools
+import importlib
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+from lcd_log import get_logger
+
+log = get_logger(__name__)
+
+# 绘图与刷新方法 (各驱动中存在的才会被替换)
+_RENDER = (
+    'lcd_draw_point', 'lcd_draw_line', 'lcd_draw_rectangle', 'draw_circle', 'lcd_fill',
+    'lcd_show_char', 'lcd_show_string', 'lcd_show_int_num', 'lcd_show_float_num',
+    'lcd_show_chinese', 'blit_image', 'blit_grayscale', 'blit_strip', 'load_frame', 'clear_screen',
+    'draw_point', 'draw_line', 'draw_rect', 'show_string', 'clear',
+)
+_FLUSH = ('lcd_flush', 'lcd_flush_pages', 'flush_rect', 'lcd_flush_rows', 'lcd_scroll', 'flush', 'refresh')
+_GPIO = ('LCD_Reset', '_initialize_mpsse', 'configure_spi', '_update_gpio')
+
+# 模块 -> 类 -> {方法: 类别}
+TARGETS: Dict[str, Dict[str, Dict[str, str]]] = {
+    'gemini_lcd.transport': {
+        'FTD2XXSPIInterface': {'_write_data': 'usb', '_read_data': 'usb', 'connect': 'usb',
+                               **dict.fromkeys(_GPIO, 'gpio')},
+    },
+    'gemini_lcd.bus': {
+        'SPIBus': {'transfer': 'usb', 'reset': 'gpio'},
+    },
+    'gemini_lcd.controllers': {
+        'PMDBLCD': {**dict.fromkeys(_RENDER, 'render'), **dict.fromkeys(_FLUSH, 'flush'),
+                    'pmdb_init': 'gpio'},
+    },
+    'gemini_lcd_00': {
+        'FTD2XXSPIInterface': {'_write_data': 'usb', '_read_data': 'usb', **dict.fromkeys(_GPIO, 'gpio')},
+        'PMDBLCD': {**dict.fromkeys(_RENDER, 'render'), **dict.fromkeys(_FLUSH, 'flush')},
+    },
+    'gemini_lcd_01': {
+        'FTD2XXSPIInterface': {'_write_raw': 'usb', **dict.fromkeys(_GPIO, 'gpio')},
+        'P3PLUSLCD': {**dict.fromkeys(_RENDER, 'render'), **dict.fromkeys(_FLUSH, 'flush'),
+                      'P3PLUS_init': 'gpio'},
+    },
+    'FT2232_01': {
+        'FTD2XXSPIInterface': {'_write_data': 'usb', '_read_data': 'usb', **dict.fromkeys(_GPIO, 'gpio')},
+        'PMDBLCD': {**dict.fromkeys(_RENDER, 'render'), **dict.fromkeys(_FLUSH, 'flush')},
+    },
+    'lcd_scheduler': {
+        'FrameScheduler': {'tick': 'frame', 'flush_now': 'frame'},
+    },
+}
+
+# USB 写函数: 第一个参数为数据，记录时拆分 bytes() 转换与写入
+_WRITE_METHODS = ('_write_data', '_write_raw')
+
+
+class Tracer:
+    """跟踪事件缓冲区 (线程安全，超过 max_events 时丢弃最早的事件)"""
+
+    def __init__(self, max_events: int = 1000000):
+        self.events = deque(maxlen=max_events)
+        self.pid = os.getpid()
+        self._t0 = time.perf_counter_ns()
+        self._threads: Dict[int, str] = {}
+
+    def record(self, name: str, cat: str, start_ns: int, end_ns: int, args: Optional[dict] = None):
+        """记录一个完整的区间 (perf_counter_ns 时间戳)"""
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        self.events.append((name, cat, tid, start_ns, end_ns, args))
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = 'user', **args):
+        """记录 with 块的耗时"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, cat, start, time.perf_counter_ns(), args or None)
+
+    def instant(self, name: str, cat: str = 'user', **args):
+        """记录一个时间点"""
+        now = time.perf_counter_ns()
+        self.record(name, cat, now, None, args or None)
+
+    def to_json(self) -> dict:
+        """转换为 Chrome trace-event 格式"""
+        trace = []
+        for tid, thread_name in list(self._threads.items()):
+            trace.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                          'args': {'name': thread_name}})
+        for name, cat, tid, start, end, args in list(self.events):
+            event = {'name': name, 'cat': cat, 'pid': self.pid, 'tid': tid,
+                     'ts': (start - self._t0) / 1000}
+            if end is None:
+                event['ph'] = 'i'
+                event['s'] = 't'
+            else:
+                event['ph'] = 'X'
+                event['dur'] = (end - start) / 1000
+            if args:
+                event['args'] = args
+            trace.append(event)
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def save(self, path: str):
+        """写入 JSON 文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f)
+
+    def summary(self) -> Dict[str, dict]:
+        """按事件名汇总: 次数、总耗时 (毫秒)"""
+        result: Dict[str, dict] = {}
+        for name, cat, _, start, end, _ in list(self.events):
+            if end is None:
+                continue
+            item = result.setdefault(name, {'cat': cat, 'count': 0, 'total_ms': 0.0})
+            item['count'] += 1
+            item['total_ms'] += (end - start) / 1000000
+        return result
+
+
+class _TracedTime:
+    """替换驱动模块中的 time 模块: sleep 被记录，其余属性转发给 time"""
+
+    def __init__(self, tracer: Tracer):
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    def sleep(self, seconds: float):
+        start = time.perf_counter_ns()
+        try:
+            time.sleep(seconds)
+        finally:
+            self._tracer.record('sleep', 'sleep', start, time.perf_counter_ns(),
+                                {'requested_ms': seconds * 1000})
+
+
+def _wrap(tracer: Tracer, fn, name: str, cat: str):
+    clock = time.perf_counter_ns
+    record = tracer.record
+
+    @functools.wraps(fn)
+    def traced(*args, **kwargs):
+        start = clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record(name, cat, start, clock())
+    return traced
+
+
+def _wrap_write(tracer: Tracer, fn, name: str):
+    clock = time.perf_counter_ns
+    record = tracer.record
+
+    @functools.wraps(fn)
+    def traced(self, data, *args, **kwargs):
+        if getattr(self, '_batch_buffer', None) is not None:
+            # 批量模式下只追加到缓冲区，批量结束时的实际写入会被记录
+            return fn(self, data, *args, **kwargs)
+        start = clock()
+        data = bytes(data)
+        converted = clock()
+        try:
+            return fn(self, data, *args, **kwargs)
+        finally:
+            end = clock()
+            size = {'size': len(data)}
+            record('bytes()', 'usb', start, converted, size)
+            record(name, 'usb', converted, end, size)
+    return traced
+
+
+# 当前启用的跟踪器与被替换的属性 (对象, 属性名, 原值)
+_tracer: Optional[Tracer] = None
+_patched = []
+
+
+def enable(max_events: int = 1000000, modules: Optional[Iterable[str]] = None) -> Tracer:
+    """
+    启用跟踪: 导入并替换 TARGETS 中各模块的方法与 time.sleep
+
+    Args:
+        max_events: 最多保留的事件数
+        modules: 只跟踪指定模块 (默认 TARGETS 全部，导入失败的模块跳过)
+
+    Returns:
+        Tracer: 跟踪器 (已启用时返回当前跟踪器)
+    """
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+    tracer = Tracer(max_events)
+
+    for module_name in modules or TARGETS:
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            log.warning("跳过模块 %s: %s", module_name, e)
+            continue
+        for class_name, methods in TARGETS.get(module_name, {}).items():
+            cls = getattr(module, class_name, None)
+            if cls is None:
+                continue
+            for method, cat in methods.items():
+                fn = cls.__dict__.get(method)
+                if not callable(fn):
+                    continue
+                name = f'{class_name}.{method}'
+                wrapped = _wrap_write(tracer, fn, name) if method in _WRITE_METHODS else _wrap(tracer, fn, name, cat)
+                _patched.append((cls, method, fn))
+                setattr(cls, method, wrapped)
+        if getattr(module, 'time', None) is time:
+            _patched.append((module, 'time', time))
+            module.time = _TracedTime(tracer)
+
+    _tracer = tracer
+    return tracer
+
+
+def disable(path: Optional[str] = None) -> Optional[Tracer]:
+    """
+    停止跟踪并恢复原方法
+
+    Args:
+        path: 同时把结果写入该文件
+
+    Returns:
+        Optional[Tracer]: 停止的跟踪器 (未启用时为 None)
+    """
+    global _tracer
+    while _patched:
+        obj, attr, original = _patched.pop()
+        setattr(obj, attr, original)
+    tracer, _tracer = _tracer, None
+    if tracer is not None and path:
+        tracer.save(path)
+    return tracer
+
+
+def current() -> Optional[Tracer]:
+    """当前启用的跟踪器"""
+    return _tracer
+
+
+def span(name: str, cat: str = 'user', **args):
+    """在调用方代码中标记一段区间 (未启用跟踪时什么都不做)"""
+    if _tracer is None:
+        return contextlib.nullcontext()
+    return _tracer.span(name, cat, **args)
+
+
+@contextlib.contextmanager
+def trace_to(path: str, **kwargs):
+    """with 块内启用跟踪，结束时写入 path"""
+    tracer = enable(**kwargs)
+    try:
+        yield tracer
+    finally:
+        disable(path)
+
+
+def _run_script(path: str):
+    """
+    运行脚本。脚本本身是 TARGETS 中的驱动模块 (如 gemini_lcd_01.py) 时，
+    按模块名导入已替换方法的模块并调用其 main()：用 run_path 作为 __main__ 运行
+    会重新定义一份未替换的类，跟踪不到驱动内部的调用。
+    """
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    module = sys.modules.get(module_name) if module_name in TARGETS else None
+    if module is not None and callable(getattr(module, 'main', None)) and \
+            os.path.abspath(getattr(module, '__file__', '')) == os.path.abspath(path):
+        module.main()
+    else:
+        runpy.run_path(path, run_name='__main__')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='跟踪 LCD 脚本并导出 Chrome trace-event JSON')
+    parser.add_argument('-o', '--output', default='lcd_trace.json', help='输出文件')
+    parser.add_argument('--max-events', type=int, default=1000000, help='最多保留的事件数')
+    parser.add_argument('-m', dest='module', action='store_true', help='把 target 当作模块运行')
+    parser.add_argument('target', help='要运行的脚本 (或 -m 模块名)')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='传给脚本的参数')
+    args = parser.parse_args()
+
+    sys.argv = [args.target] + args.args
+    if not args.module:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(args.target)))
+    enable(args.max_events)
+    try:
+        if args.module:
+            runpy.run_module(args.target, run_name='__main__', alter_sys=True)
+        else:
+            _run_script(args.target)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        tracer = disable(args.output)
+        for name, item in sorted(tracer.summary().items(), key=lambda kv: -kv[1]['total_ms'])[:15]:
+            print(f"{name:36s} {item['cat']:7s} {item['count']:8d} 次 {item['total_ms']:10.2f} ms", file=sys.stderr)
+        print(f"跟踪结果已写入 {args.output} (在 https://ui.perfetto.dev 中打开)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,512 @@
+"""
+LCD 控件
+在驱动的显示缓冲区上实现增量刷新的显示控件。
+
+NumericField: 数值显示框，缓存上一次显示的字符串，只重绘内容变化的字符格，
+字形按 (字符, 字号, 颜色, 行偏移) 预渲染为页格式条带后整页切片写入，
+并只把变化的字符格标记为脏区域。
+
+Scene + Label/Number/Bar/Icon/Frame/Chart: 保留模式的控件树。控件属性变化时
+只使受影响的矩形失效，Scene.render() 只重绘并刷新这些区域。
+
+驱动需提供 get_char_columns / strip_shift / blit_strip (gemini_lcd.PMDBLCD、
+gemini_lcd_01.P3PLUSLCD)，否则退回逐字符 lcd_show_char。
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from lcd_image import PageStrip, copy_rect_bits
+from lcd_scheduler import _panel_size, _full_flush_fn, _touching, _union
+from lcd_text_cache import TextCache
+
+Rect = Tuple[int, int, int, int]
+
+# 单字符的字形条带缓存 (按驱动类型、字号、颜色、行偏移、模式，LRU 淘汰)
+_GLYPH_CACHE = TextCache(max_bytes=64 * 1024, max_entries=1024)
+
+DIGIT_CHARS = '0123456789 .-'
+
+
+def get_glyph_strip(lcd, char: str, size: int, fc: int, bc: int, shift: int,
+                    mode: int = 0) -> Optional[PageStrip]:
+    """获取字符的页格式条带，按驱动类型缓存；驱动不支持时返回None"""
+    return _GLYPH_CACHE.get(lcd, char, size, fc, bc, mode, shift)
+
+
+def clear_glyph_cache():
+    """清空字形条带缓存"""
+    _GLYPH_CACHE.clear()
+
+
+def draw_text(lcd, x: int, y: int, text: str, size: int, fc: int, bc: int, mode: int = 0):
+    """
+    写入文字: 优先使用驱动的整串文字缓存 (lcd.text_cache)，
+    否则逐字符写入字形条带 (驱动不支持或越界时退回 lcd_show_char)
+    """
+    cache = getattr(lcd, 'text_cache', None)
+    if cache is not None and cache.draw(lcd, x, y, text, fc, bc, size, mode):
+        return
+    shift_fn = getattr(lcd, 'strip_shift', None)
+    shift = shift_fn(y) if shift_fn is not None else y & 7
+    for char in text:
+        strip = get_glyph_strip(lcd, char, size, fc, bc, shift, mode)
+        if strip is None or not lcd.blit_strip(strip, x, y):
+            lcd.lcd_show_char(x, y, char, fc, bc, size, mode)
+        x += size // 2
+
+
+def format_fixed(value, length: int, decimals: int = 0) -> str:
+    """
+    将数值格式化为定长字符串: 右对齐，前导零显示为空格，
+    超出位数时保留低位 (与 lcd_show_int_num 一致)
+    """
+    text = f"{value:.{decimals}f}" if decimals else str(int(value))
+    if len(text) > length:
+        text = text[-length:]
+    return text.rjust(length)
+
+
+class NumericField:
+    """增量刷新的数值显示框"""
+
+    def __init__(self, lcd, x: int, y: int, length: int, size: int = 12,
+                 fc: int = 1, bc: int = 0, decimals: int = 0, scheduler=None):
+        """
+        Args:
+            lcd: LCD 驱动实例
+            x, y: 显示位置 (左上角)
+            length: 显示的字符格数 (含小数点与负号)
+            size: 字体大小 (字符宽度为 size // 2)
+            fc, bc: 前景色/背景色
+            decimals: 小数位数 (0=整数)
+            scheduler: 可选的 FrameScheduler，变化的字符格会标记为脏区域
+        """
+        if length <= 0:
+            raise ValueError(f"显示位数必须为正数: {length}")
+        self.lcd = lcd
+        self.x = x
+        self.y = y
+        self.length = length
+        self.size = size
+        self.fc = fc
+        self.bc = bc
+        self.decimals = decimals
+        self.scheduler = scheduler
+        self.cell_width = size // 2
+
+        self._last: Optional[str] = None
+        self._strips: Dict[str, Optional[PageStrip]] = {}
+        self._shift: Optional[int] = None
+
+        # 统计
+        self.updates = 0
+        self.cells_drawn = 0
+
+    def format(self, value) -> str:
+        """将数值格式化为显示框的定长字符串 (见 format_fixed)"""
+        return format_fixed(value, self.length, self.decimals)
+
+    def _strip(self, char: str) -> Optional[PageStrip]:
+        """获取当前行偏移下的字形条带 (滚动后行偏移变化时重新查缓存)"""
+        shift_fn = getattr(self.lcd, 'strip_shift', None)
+        shift = shift_fn(self.y) if shift_fn is not None else self.y & 7
+        if shift != self._shift:
+            self._shift = shift
+            self._strips = {c: get_glyph_strip(self.lcd, c, self.size, self.fc, self.bc, shift)
+                            for c in DIGIT_CHARS}
+        if char not in self._strips:
+            self._strips[char] = get_glyph_strip(self.lcd, char, self.size, self.fc, self.bc, shift)
+        return self._strips[char]
+
+    def _draw_cell(self, index: int, char: str):
+        cx = self.x + index * self.cell_width
+        strip = self._strip(char)
+        if strip is None or not self.lcd.blit_strip(strip, cx, self.y):
+            self.lcd.lcd_show_char(cx, self.y, char, self.fc, self.bc, self.size, 0)
+
+    def set(self, value) -> List[Rect]:
+        """
+        更新显示的数值，只重绘发生变化的字符格
+
+        Returns:
+            List[Rect]: 本次重绘的区域 (相邻的变化字符格合并为一个区域)
+        """
+        text = self.format(value)
+        last = self._last
+        if text == last:
+            return []
+
+        rects: List[Rect] = []
+        run_start = None
+        for i in range(self.length + 1):
+            changed = i < self.length and (last is None or text[i] != last[i])
+            if changed:
+                self._draw_cell(i, text[i])
+                self.cells_drawn += 1
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                x1 = self.x + run_start * self.cell_width
+                x2 = self.x + i * self.cell_width - 1
+                rects.append((x1, self.y, x2, self.y + self.size - 1))
+                run_start = None
+
+        self._last = text
+        self.updates += 1
+        if self.scheduler is not None:
+            for rect in rects:
+                self.scheduler.mark_dirty(*rect)
+        return rects
+
+    def invalidate(self):
+        """使缓存失效，下一次 set() 重绘全部字符格 (如清屏之后)"""
+        self._last = None
+
+    @property
+    def text(self) -> Optional[str]:
+        """当前显示的字符串"""
+        return self._last
+
+    @property
+    def rect(self) -> Rect:
+        """控件占据的区域"""
+        return (self.x, self.y, self.x + self.length * self.cell_width - 1, self.y + self.size - 1)
+
+
+# ==========================================
+# 保留模式控件树
+# ==========================================
+
+class Widget(ABC):
+    """控件基类: 位置、尺寸与可见性，属性变化时使自身区域失效"""
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.visible = True
+        self.scene: Optional['Scene'] = None
+
+    @property
+    def bounds(self) -> Rect:
+        """控件占据的区域 (包含端点)"""
+        return (self.x, self.y, self.x + self.width - 1, self.y + self.height - 1)
+
+    def invalidate(self, rect: Optional[Rect] = None):
+        """使控件 (或其中的一部分) 失效，等待 Scene.render() 重绘"""
+        if self.scene is not None:
+            self.scene.invalidate(*(rect or self.bounds))
+
+    def set_visible(self, visible: bool):
+        if visible != self.visible:
+            self.visible = visible
+            self.invalidate()
+
+    def move(self, x: int, y: int):
+        """移动控件 (旧位置与新位置都失效)"""
+        if (x, y) != (self.x, self.y):
+            self.invalidate()
+            self.x, self.y = x, y
+            self.invalidate()
+
+    @abstractmethod
+    def draw(self, lcd):
+        """将控件绘制到驱动的显示缓冲区"""
+
+
+class Label(Widget):
+    """文字标签"""
+
+    def __init__(self, x: int, y: int, text: str, size: int = 12, fc: int = 1, bc: int = 0, mode: int = 0):
+        super().__init__(x, y, len(text) * (size // 2), size)
+        self.text = text
+        self.size = size
+        self.fc = fc
+        self.bc = bc
+        self.mode = mode
+
+    def set_text(self, text: str):
+        if text == self.text:
+            return
+        old = self.bounds
+        self.text = text
+        self.width = len(text) * (self.size // 2)
+        self.invalidate(_union(old, self.bounds) if self.width else old)
+
+    def set_colors(self, fc: int, bc: int):
+        if (fc, bc) != (self.fc, self.bc):
+            self.fc, self.bc = fc, bc
+            self.invalidate()
+
+    def draw(self, lcd):
+        draw_text(lcd, self.x, self.y, self.text, self.size, self.fc, self.bc, self.mode)
+
+
+class Number(Label):
+    """数值: 定长右对齐，数值变化时只使变化的字符格失效"""
+
+    def __init__(self, x: int, y: int, length: int, value=0, size: int = 12,
+                 fc: int = 1, bc: int = 0, decimals: int = 0):
+        self.length = length
+        self.decimals = decimals
+        self.value = value
+        super().__init__(x, y, format_fixed(value, length, decimals), size, fc, bc, 0)
+
+    def set_value(self, value):
+        self.value = value
+        text = format_fixed(value, self.length, self.decimals)
+        if text == self.text:
+            return
+        cell = self.size // 2
+        old = self.text
+        self.text = text
+        for i in range(self.length):
+            if text[i] != old[i]:
+                cx = self.x + i * cell
+                self.invalidate((cx, self.y, cx + cell - 1, self.y + self.size - 1))
+
+
+class Bar(Widget):
+    """水平进度条 (带边框)，数值变化时只使增减的那一段失效"""
+
+    def __init__(self, x: int, y: int, width: int, height: int, value: float = 0,
+                 minimum: float = 0, maximum: float = 100, color: int = 1):
+        super().__init__(x, y, width, height)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.color = color
+        self.value = value
+
+    def _fill_width(self, value: float) -> int:
+        inner = self.width - 2
+        span = self.maximum - self.minimum
+        if span <= 0 or inner <= 0:
+            return 0
+        ratio = min(1.0, max(0.0, (value - self.minimum) / span))
+        return int(ratio * inner + 0.5)
+
+    def set_value(self, value: float):
+        old = self._fill_width(self.value)
+        self.value = value
+        new = self._fill_width(value)
+        if new != old:
+            x1 = self.x + 1 + min(old, new)
+            x2 = self.x + max(old, new)
+            self.invalidate((x1, self.y + 1, x2, self.y + self.height - 2))
+
+    def draw(self, lcd):
+        x1, y1, x2, y2 = self.bounds
+        lcd.lcd_draw_rectangle(x1, y1, x2, y2, self.color)
+        fill = self._fill_width(self.value)
+        if fill and self.height > 2:
+            lcd.lcd_fill(x1 + 1, y1 + 1, x1 + fill, y2 - 1, self.color)
+
+
+class Icon(Widget):
+    """图标 (1bit 图像或二维 bool 数组，通过驱动的 blit_image 写入)"""
+
+    def __init__(self, x: int, y: int, image, invert: bool = False):
+        height, width = _image_size(image)
+        super().__init__(x, y, width, height)
+        self.image = image
+        self.invert = invert
+
+    def set_image(self, image, invert: Optional[bool] = None):
+        old = self.bounds
+        self.image = image
+        if invert is not None:
+            self.invert = invert
+        self.height, self.width = _image_size(image)
+        self.invalidate(_union(old, self.bounds))
+
+    def draw(self, lcd):
+        lcd.blit_image(self.image, self.x, self.y, self.invert)
+
+
+def _image_size(image) -> Tuple[int, int]:
+    """图像尺寸 (高, 宽)"""
+    if hasattr(image, 'size') and hasattr(image, 'mode'):  # PIL.Image
+        width, height = image.size
+        return height, width
+    return image.shape[0], image.shape[1]
+
+
+class Frame(Widget):
+    """矩形边框"""
+
+    def __init__(self, x: int, y: int, width: int, height: int, color: int = 1):
+        super().__init__(x, y, width, height)
+        self.color = color
+
+    def draw(self, lcd):
+        x1, y1, x2, y2 = self.bounds
+        lcd.lcd_draw_rectangle(x1, y1, x2, y2, self.color)
+
+
+class Chart(Widget):
+    """滚动折线图: 每列一个采样点，push() 追加新采样"""
+
+    def __init__(self, x: int, y: int, width: int, height: int,
+                 minimum: float = 0, maximum: float = 100, color: int = 1):
+        super().__init__(x, y, width, height)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.color = color
+        self.samples = deque(maxlen=width)
+
+    def push(self, value: float):
+        self.samples.append(value)
+        self.invalidate()
+
+    def clear(self):
+        self.samples.clear()
+        self.invalidate()
+
+    def _sample_y(self, value: float) -> int:
+        span = self.maximum - self.minimum
+        ratio = (value - self.minimum) / span if span > 0 else 0.0
+        ratio = min(1.0, max(0.0, ratio))
+        return self.y + self.height - 1 - int(ratio * (self.height - 1) + 0.5)
+
+    def draw(self, lcd):
+        prev = None
+        for i, value in enumerate(self.samples):
+            point = (self.x + i, self._sample_y(value))
+            if prev is None:
+                lcd.lcd_draw_point(point[0], point[1], self.color)
+            else:
+                lcd.lcd_draw_line(prev[0], prev[1], point[0], point[1], self.color)
+            prev = point
+
+
+def _intersects(a: Rect, b: Rect) -> bool:
+    return not (a[2] < b[0] or b[2] < a[0] or a[3] < b[1] or b[3] < a[1])
+
+
+class Scene:
+    """
+    控件树合成器: 收集失效区域，render() 时对每个区域
+    清除背景 -> 按添加顺序重绘与之相交的控件 -> 裁剪回该区域 -> 刷新
+    """
+
+    def __init__(self, lcd, scheduler=None, bc: int = 0, max_rects: int = 8):
+        """
+        Args:
+            lcd: LCD 驱动实例
+            scheduler: 可选的 FrameScheduler (渲染后只标记脏区域，由调度器按帧率刷新)
+            bc: 背景色
+            max_rects: 失效区域数上限，超过后合并为一个包围盒
+        """
+        self.lcd = lcd
+        self.scheduler = scheduler
+        self.bc = bc
+        self.max_rects = max(1, max_rects)
+        self.width, self.height = _panel_size(lcd)
+        self.widgets: List[Widget] = []
+        self._dirty: List[Rect] = []
+
+        # 统计
+        self.renders = 0
+        self.pixels_redrawn = 0
+
+    def add(self, widget: Widget) -> Widget:
+        """添加控件 (后添加的位于上层)"""
+        widget.scene = self
+        self.widgets.append(widget)
+        widget.invalidate()
+        return widget
+
+    def remove(self, widget: Widget):
+        if widget in self.widgets:
+            widget.invalidate()
+            self.widgets.remove(widget)
+            widget.scene = None
+
+    def invalidate(self, x1: int, y1: int, x2: int, y2: int):
+        """使区域失效 (包含端点)，与已有的重叠/相邻区域合并"""
+        x1 = max(0, x1)
+        y1 = max(0, y1)
+        x2 = min(self.width - 1, x2)
+        y2 = min(self.height - 1, y2)
+        if x1 > x2 or y1 > y2:
+            return
+        rect = (x1, y1, x2, y2)
+        merged = True
+        while merged:
+            merged = False
+            for i, other in enumerate(self._dirty):
+                if _touching(rect, other):
+                    rect = _union(rect, other)
+                    del self._dirty[i]
+                    merged = True
+                    break
+        self._dirty.append(rect)
+        if len(self._dirty) > self.max_rects:
+            box = self._dirty[0]
+            for other in self._dirty[1:]:
+                box = _union(box, other)
+            self._dirty = [box]
+
+    def invalidate_all(self):
+        self._dirty = [(0, 0, self.width - 1, self.height - 1)]
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._dirty)
+
+    def _ram_bands(self, y1: int, y2: int) -> List[Tuple[int, int]]:
+        """逻辑行范围对应的显存行范围 (硬件滚动后可能分成两段)"""
+        scroll = getattr(self.lcd, 'scroll_line', 0)
+        if not scroll:
+            return [(y1, y2)]
+        ram_y1 = (y1 + scroll) % self.height
+        ram_y2 = ram_y1 + (y2 - y1)
+        if ram_y2 < self.height:
+            return [(ram_y1, ram_y2)]
+        return [(ram_y1, self.height - 1), (0, ram_y2 - self.height)]
+
+    def _redraw(self, rect: Rect):
+        lcd = self.lcd
+        buffer = lcd.display_buffer
+        snapshot = bytes(buffer)
+
+        x1, y1, x2, y2 = rect
+        lcd.lcd_fill(x1, y1, x2, y2, self.bc)
+        for widget in self.widgets:
+            if widget.visible and _intersects(widget.bounds, rect):
+                widget.draw(lcd)
+
+        # 裁剪: 只保留失效区域内的绘制结果，区域外恢复原样
+        drawn = bytes(buffer)
+        buffer[:] = snapshot
+        for band_y1, band_y2 in self._ram_bands(y1, y2):
+            copy_rect_bits(buffer, drawn, self.width, x1, band_y1, x2, band_y2)
+        self.pixels_redrawn += (x2 - x1 + 1) * (y2 - y1 + 1)
+
+    def render(self) -> List[Rect]:
+        """
+        重绘所有失效区域并刷新 (有调度器时只标记脏区域)
+
+        Returns:
+            List[Rect]: 本次重绘的区域
+        """
+        rects, self._dirty = self._dirty, []
+        if not rects:
+            return []
+
+        for rect in rects:
+            self._redraw(rect)
+        self.renders += 1
+
+        if self.scheduler is not None:
+            for rect in rects:
+                self.scheduler.mark_dirty(*rect)
+        elif hasattr(self.lcd, 'flush_rect'):
+            for rect in rects:
+                self.lcd.flush_rect(*rect)
+        else:
+            _full_flush_fn(self.lcd)()
+        return rects